@@ -30,6 +30,11 @@ class GoogleBellTestJob(GoogleJob):
         self.add_measurements = add_measurements
         self.num_shots = num_shots
 
+    def build_circuit(self):
+        path = self.path
+        test_type = self.test_type
+        add_measurements = self.add_measurements
+
         # Build the circuit
         _path = [cirq.GridQubit(0, i) for i in path]
         _qubit_a, _qubit_b = _path[0], _path[-1]
@@ -73,8 +78,7 @@ class GoogleBellTestJob(GoogleJob):
             circuit.append(cirq.measure(_qubit_a, key="A"))
             circuit.append(cirq.measure(_qubit_b, key="B"))
 
-        # store the resulting circuit
-        self.circuit = circuit
+        return circuit
 
     def run(self, device):
         super().run(device)
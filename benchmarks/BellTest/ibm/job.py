@@ -31,6 +31,11 @@ class IBMBellTestJob(IBMJob):
         self.add_measurements = add_measurements
         self.num_shots = num_shots
 
+    def build_circuit(self):
+        path = self.path
+        test_type = self.test_type
+        add_measurements = self.add_measurements
+
         # Build the circuit
         # in qiskit, we cannot directly specify the target qubits;
         # this will be done in the transpiler pass for which we
@@ -74,8 +79,7 @@ class IBMBellTestJob(IBMJob):
         if add_measurements:
             circuit.measure([_qubit_a, _qubit_b], [0, 1])
 
-        # store the resulting circuit
-        self.circuit = circuit
+        return circuit
 
     def run(self, device):
         super().run(device)
@@ -33,6 +33,12 @@ class RigettiBellTestJob(RigettiJob):
         self.add_measurements = add_measurements
         self.num_shots = num_shots
 
+    def build_circuit(self):
+        path = self.path
+        test_type = self.test_type
+        qubit_a = self.qubit_a
+        qubit_b = self.qubit_b
+
         # Build the circuit
         program = pq.Program()
         program += Pragma("INITIAL_REWIRING", ['"NAIVE"'])
@@ -63,8 +69,7 @@ class RigettiBellTestJob(RigettiJob):
         program += pq.gates.H(qubit_a)
         program += pq.gates.H(qubit_b)
 
-        # store the resulting circuit
-        self.program = program
+        return program
 
     def run(self, device):
         super().run(device)
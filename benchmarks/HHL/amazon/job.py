@@ -94,6 +94,40 @@ class HHLJob(AmazonJob):
         if num_ancillas != 1:
             raise NotImplementedError("The general HHL circuit generation is not yet implemented!")
 
+        used_qubits = num_qubits - num_ancillas
+
+        for m_idx in range(shots_multiplier):
+            for basis_vec in range(0, 2 ** used_qubits):
+                yield HHLJob(
+                    matrix,
+                    num_qubits,
+                    num_ancillas,
+                    basis_vec,
+                    num_shots,
+                    m_idx,
+                    add_measurements,
+                )
+
+    def __init__(
+        self, matrix, num_qubits, num_ancillas, basis_vec, shots, m_idx, add_measurements
+    ):
+        super().__init__()
+
+        self.matrix = matrix
+        self.num_qubits = num_qubits
+        self.num_ancillas = num_ancillas
+        self.basis_vec = basis_vec
+        self.shots = shots
+        self.m_idx = m_idx
+        self.add_measurements = add_measurements
+
+    def build_circuit(self):
+        matrix = self.matrix
+        num_qubits = self.num_qubits
+        num_ancillas = self.num_ancillas
+        basis_vec = self.basis_vec
+        add_measurements = self.add_measurements
+
         # Build block-encoding of A
         block_encoding = Circuit()
         HHLJob.list_to_circuit(matrix["circuit"], block_encoding)
@@ -135,38 +169,15 @@ class HHLJob(AmazonJob):
 
         used_qubits = num_qubits - num_ancillas
 
-        for m_idx in range(shots_multiplier):
-            for basis_vec in range(0, 2 ** used_qubits):
-                instance_circuit = Circuit()
-                # Here we assume that there is a single ancilla
-                instance_circuit.x(1)
-                for i in range(used_qubits):
-                    if basis_vec % 2 ** (i + 1) >= 2 ** i:
-                        instance_circuit.x(num_qubits - i)
-                instance_circuit.add_circuit(qsvt_circuit)
+        instance_circuit = Circuit()
+        # Here we assume that there is a single ancilla
+        instance_circuit.x(1)
+        for i in range(used_qubits):
+            if basis_vec % 2 ** (i + 1) >= 2 ** i:
+                instance_circuit.x(num_qubits - i)
+        instance_circuit.add_circuit(qsvt_circuit)
 
-                yield HHLJob(
-                    instance_circuit,
-                    num_qubits,
-                    num_ancillas,
-                    basis_vec,
-                    num_shots,
-                    m_idx,
-                    add_measurements,
-                )
-
-    def __init__(
-        self, circuit, num_qubits, num_ancillas, basis_vec, shots, m_idx, add_measurements
-    ):
-        super().__init__()
-
-        self.circuit = circuit
-        self.num_qubits = num_qubits
-        self.num_ancillas = num_ancillas
-        self.basis_vec = basis_vec
-        self.shots = shots
-        self.m_idx = m_idx
-        self.add_measurements = add_measurements
+        return instance_circuit
 
     def run(self, device):
         super().run(device)
@@ -1,6 +1,6 @@
 import numpy as np
 
-from libbench.ibm import Benchmark as IBMBenchmark
+from libbench.ibm import Benchmark as IBMBenchmark, histogram
 
 from .job import HHLJob
 from .. import HHLBenchmarkMixin
@@ -33,16 +33,16 @@ class HHLBenchmark(HHLBenchmarkBase):
         super().__init__(*args, **kwargs)
 
     def parse_result(self, job, result):
-        counts = result.get_counts()
+        hist = histogram(result)
 
-        total = 0
-        histogram = [0] * 2 ** (job.num_qubits - job.num_ancillas)
-        for result in counts:
-            total += counts[result]
-            if result[0:2] == "01":
-                histogram[int(result[2:], 2)] = counts[result]
+        # outcomes starting with "01" on the first two qubits, indexed by the remaining ones
+        total = hist.num_shots
+        counts = hist.counts.reshape(4, -1)[1]
+        histogram_01 = [0] * 2 ** (job.num_qubits - job.num_ancillas)
+        for i in np.flatnonzero(counts):
+            histogram_01[i] = int(counts[i])
 
-        return {"basis_vec": job.basis_vec, "histogram": histogram, "total": total}
+        return {"basis_vec": job.basis_vec, "histogram": histogram_01, "total": total}
 
 
 class HHLSimulatedBenchmark(HHLBenchmarkBase):
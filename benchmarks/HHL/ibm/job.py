@@ -93,6 +93,40 @@ class HHLJob(IBMJob):
         if num_ancillas != 1:
             raise NotImplementedError("The general HHL circuit generation is not yet implemented!")
 
+        used_qubits = num_qubits - num_ancillas
+
+        for m_idx in range(shots_multiplier):
+            for basis_vec in range(0, 2 ** used_qubits):
+                yield HHLJob(
+                    matrix,
+                    num_qubits,
+                    num_ancillas,
+                    basis_vec,
+                    num_shots,
+                    m_idx,
+                    add_measurements,
+                )
+
+    def __init__(
+        self, matrix, num_qubits, num_ancillas, basis_vec, shots, m_idx, add_measurements
+    ):
+        super().__init__()
+
+        self.matrix = matrix
+        self.num_qubits = num_qubits
+        self.num_ancillas = num_ancillas
+        self.basis_vec = basis_vec
+        self.shots = shots
+        self.m_idx = m_idx
+        self.add_measurements = add_measurements
+
+    def build_circuit(self):
+        matrix = self.matrix
+        num_qubits = self.num_qubits
+        num_ancillas = self.num_ancillas
+        basis_vec = self.basis_vec
+        add_measurements = self.add_measurements
+
         # Build block-encoding of A
         block_encoding = QuantumCircuit(num_qubits)
         HHLJob.list_to_circuit(matrix["circuit"], block_encoding)
@@ -134,50 +168,27 @@ class HHLJob(IBMJob):
 
         used_qubits = num_qubits - num_ancillas
 
-        for m_idx in range(shots_multiplier):
-            for basis_vec in range(0, 2 ** used_qubits):
-                instance_circuit = (
-                    QuantumCircuit(num_qubits + 1, num_qubits + 1)
-                    if add_measurements
-                    else QuantumCircuit(num_qubits + 1)
-                )
-                # Here we assume that there is a single ancilla
-                instance_circuit.x(1)
-                for i in range(used_qubits):
-                    if basis_vec % 2 ** (i + 1) >= 2 ** i:
-                        instance_circuit.x(num_qubits - i)
-                instance_circuit.extend(qsvt_circuit)
-
-                yield HHLJob(
-                    instance_circuit,
-                    num_qubits,
-                    num_ancillas,
-                    basis_vec,
-                    num_shots,
-                    m_idx,
-                    add_measurements,
-                )
-
-    def __init__(
-        self, circuit, num_qubits, num_ancillas, basis_vec, shots, m_idx, add_measurements
-    ):
-        super().__init__()
-
-        self.circuit = circuit
-        self.num_qubits = num_qubits
-        self.num_ancillas = num_ancillas
-        self.basis_vec = basis_vec
-        self.shots = shots
-        self.m_idx = m_idx
-        self.add_measurements = add_measurements
+        instance_circuit = (
+            QuantumCircuit(num_qubits + 1, num_qubits + 1)
+            if add_measurements
+            else QuantumCircuit(num_qubits + 1)
+        )
+        # Here we assume that there is a single ancilla
+        instance_circuit.x(1)
+        for i in range(used_qubits):
+            if basis_vec % 2 ** (i + 1) >= 2 ** i:
+                instance_circuit.x(num_qubits - i)
+        instance_circuit.extend(qsvt_circuit)
 
         if add_measurements:
-            circuit.measure(
+            instance_circuit.measure(
                 # list(range(num_qubits+1)), list(range(num_qubits+1))
                 list(range(num_qubits + 1)),
                 list(reversed(range(num_qubits + 1))),
             )
 
+        return instance_circuit
+
     def run(self, device):
         super().run(device)
         return device.execute(self.circuit, num_shots=self.shots)
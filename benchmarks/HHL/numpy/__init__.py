@@ -0,0 +1,2 @@
+from .benchmark import NumpyHHLBenchmark as Benchmark
+from .benchmark import NumpyHHLSimulatedBenchmark as SimulatedBenchmark
@@ -0,0 +1,65 @@
+import numpy as np
+
+from libbench.numpy import Benchmark as NumpyBenchmark, histogram
+
+from .job import NumpyHHLJob
+from .. import HHLBenchmarkMixin
+
+
+class NumpyHHLBenchmarkBase(HHLBenchmarkMixin, NumpyBenchmark):
+    def __init__(self, add_measurements, **kwargs):
+        super().__init__(**kwargs)
+
+        self.add_measurements = add_measurements
+
+    def get_jobs(self):
+        yield from NumpyHHLJob.job_factory(
+            self.matrix, self.num_shots, self.shots_multiplier, self.add_measurements
+        )
+
+    def __str__(self):
+        return "Numpy-HHL"
+
+
+class NumpyHHLBenchmark(NumpyHHLBenchmarkBase):
+    """
+    Full Benchmark
+
+    Measurements are sampled from the exact outcome distribution, i.e. without noise
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.update({"add_measurements": True})
+        super().__init__(*args, **kwargs)
+
+    def parse_result(self, job, result):
+        hist = histogram(result)
+
+        # outcomes starting with "01" on the first two qubits, indexed by the remaining ones
+        total = hist.num_shots
+        counts = hist.counts.reshape(4, -1)[1]
+        histogram_01 = [int(count) for count in counts]
+
+        return {"basis_vec": job.basis_vec, "histogram": histogram_01, "total": total}
+
+
+class NumpyHHLSimulatedBenchmark(NumpyHHLBenchmarkBase):
+    """
+    Simulated HHL Benchmark
+
+    The device behaves like a statevector_simulator, i.e. without noise; the histograms hold the
+    expected counts for num_shots shots, which collate_results scores like measured ones
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.update({"add_measurements": False})
+        super().__init__(*args, **kwargs)
+
+    def parse_result(self, job, result):
+        psi = result
+
+        # qubit 0 is the most significant bit, so the outcomes starting with "01" are contiguous
+        probabilities = np.abs(psi.reshape(4, -1)[1]) ** 2
+        histogram_01 = list(self.num_shots * probabilities)
+
+        return {"basis_vec": job.basis_vec, "histogram": histogram_01, "total": self.num_shots}
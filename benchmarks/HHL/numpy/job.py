@@ -0,0 +1,137 @@
+import numpy as np
+
+from libbench.numpy import Job as NumpyJob, Circuit
+
+
+class NumpyHHLJob(NumpyJob):
+    @staticmethod
+    def create_qsvt_circuit(
+        num_qubits, num_ancillas, add_measurements, block_encoding, block_encoding_inv, angles
+    ):
+        qsvt_circuit = Circuit(num_qubits + 1)
+        if num_ancillas != 1:
+            raise NotImplementedError("The general QSVT circuit generation is not yet implemented!")
+
+        qubits = list(range(1, num_qubits + 1))
+
+        # Quantum Singular Value Transformation
+        qsvt_circuit.h(0)
+        for i in range(0, len(angles)):
+            if i % 2 == 0:
+                qsvt_circuit.compose(block_encoding, qubits=qubits)
+            else:
+                qsvt_circuit.compose(block_encoding_inv, qubits=qubits)
+            qsvt_circuit.cx(1, 0)
+            qsvt_circuit.rz(-2 * angles[i], 0)
+            qsvt_circuit.cx(1, 0)
+        qsvt_circuit.h(0)
+
+        if add_measurements:
+            # the first qubit is the most significant bit, as for the classical bits on IBM
+            qsvt_circuit.measure(range(num_qubits + 1))
+
+        return qsvt_circuit
+
+    @staticmethod
+    def list_to_circuit(circuit_list: list, circuit: Circuit) -> Circuit:
+
+        gate_lut = {
+            "H": lambda index: circuit.h(index),
+            "X": lambda index: circuit.x(index),
+            "Y": lambda index: circuit.y(index),
+            "Z": lambda index: circuit.z(index),
+            "R": lambda index: circuit.rz(2 * np.pi / 3, index),
+            "S": lambda index: circuit.s(index),
+            "T": lambda index: circuit.t(index),
+            "RX": lambda index: circuit.rx(2 * np.pi / 3, index),
+            "SX": lambda index: circuit.rx(np.pi / 2, index),
+            "TX": lambda index: circuit.rx(np.pi / 4, index),
+            "RY": lambda index: circuit.ry(2 * np.pi / 3, index),
+            "SY": lambda index: circuit.ry(np.pi / 2, index),
+            "TY": lambda index: circuit.ry(np.pi / 4, index),
+            "CX": lambda control, target: circuit.cx(control, target),
+            "CZ": lambda qubit1, qubit2: circuit.cz(qubit1, qubit2),
+            "SQSWAP": lambda qubit1, qubit2: circuit.sqswap(qubit1, qubit2),
+        }
+
+        for gate, *indices in circuit_list:
+            gate_lut[gate](*[idx - 1 for idx in indices])
+
+        return circuit
+
+    @staticmethod
+    def job_factory(matrix, num_shots, shots_multiplier, add_measurements):
+        if matrix is None:
+            raise NotImplementedError("The matrix is Not specified")
+        num_qubits = matrix["qubits"]
+        num_ancillas = matrix["ancillas"]
+
+        if num_ancillas != 1:
+            raise NotImplementedError("The general HHL circuit generation is not yet implemented!")
+
+        used_qubits = num_qubits - num_ancillas
+
+        for m_idx in range(shots_multiplier):
+            for basis_vec in range(0, 2 ** used_qubits):
+                yield NumpyHHLJob(
+                    matrix,
+                    num_qubits,
+                    num_ancillas,
+                    basis_vec,
+                    num_shots,
+                    m_idx,
+                    add_measurements,
+                )
+
+    def __init__(
+        self, matrix, num_qubits, num_ancillas, basis_vec, shots, m_idx, add_measurements
+    ):
+        super().__init__()
+
+        self.matrix = matrix
+        self.num_qubits = num_qubits
+        self.num_ancillas = num_ancillas
+        self.basis_vec = basis_vec
+        self.shots = shots
+        self.m_idx = m_idx
+        self.add_measurements = add_measurements
+
+    def build_circuit(self):
+        """
+        the QSVT circuit alone, which is the same for all basis vectors; the input is prepared by
+        starting from the basis state given by input_state() instead of |0...0>, such that the
+        device evaluates all inputs of a batch in a single pass
+        """
+        matrix = self.matrix
+        num_qubits = self.num_qubits
+
+        # Build block-encoding of A
+        block_encoding = Circuit(num_qubits)
+        NumpyHHLJob.list_to_circuit(matrix["circuit"], block_encoding)
+
+        # Angles describing the polynomial inverting A
+        angles = matrix["angles"]
+
+        return NumpyHHLJob.create_qsvt_circuit(
+            num_qubits,
+            self.num_ancillas,
+            self.add_measurements,
+            block_encoding.inverse(),
+            block_encoding,
+            angles,
+        )
+
+    def input_state(self):
+        """
+        index of the basis state with X applied to qubit 1, and to qubit num_qubits - i for every
+        bit i set in basis_vec; qubit 0 is the most significant bit
+        """
+        # Here we assume that there is a single ancilla
+        return 2 ** (self.num_qubits - 1) + self.basis_vec
+
+    def run(self, device):
+        super().run(device)
+        return device.execute(self.circuit, num_shots=self.shots, basis_state=self.input_state())
+
+    def __str__(self):
+        return f"NumpyHHLJob--{self.num_qubits-self.num_ancillas}-{self.basis_vec}-{self.shots}-{self.m_idx}"
@@ -1,6 +1,6 @@
 import numpy as np
 
-from libbench.rigetti import Benchmark as RigettiBenchmark
+from libbench.rigetti import Benchmark as RigettiBenchmark, bitstring_histogram
 
 from .job import HHLJob
 from .. import HHLBenchmarkMixin
@@ -38,22 +38,14 @@ class HHLBenchmark(HHLBenchmarkBase):
         so each column represents one joint measurement outcome; selecting only a subset of the qubits
         effectively means measuring only a subset, ignoring the rest
         """
-        counts = {}
-        qubits = job.num_qubits + 1
+        hist = bitstring_histogram(result, range(job.num_qubits + 1))
 
-        for measurement in np.vstack([result[k] for k in range(qubits)]).T:
-            key = "".join(["0" if b == 0 else "1" for b in measurement])
-            if key in counts:
-                counts[key] += 1
-            else:
-                counts[key] = 1
-
-        total = 0
+        # outcomes starting with "01" on the first two qubits, indexed by the remaining ones
+        total = hist.num_shots
+        counts = hist.counts.reshape(4, -1)[1]
         histogram = [0] * 2 ** (job.num_qubits - job.num_ancillas)
-        for result in counts:
-            total += counts[result]
-            if result[0:2] == "01":
-                histogram[int(result[2:], 2)] = counts[result]
+        for i in np.flatnonzero(counts):
+            histogram[i] = int(counts[i])
 
         return {"basis_vec": job.basis_vec, "histogram": histogram, "total": total}
 
@@ -78,6 +78,28 @@ class HHLJob(RigettiJob):
         if num_ancillas != 1:
             raise NotImplementedError("The general HHL circuit generation is not yet implemented!")
 
+        used_qubits = num_qubits - num_ancillas
+
+        for m_idx in range(shots_multiplier):
+            for basis_vec in range(2 ** used_qubits):
+                yield HHLJob(matrix, num_qubits, num_ancillas, basis_vec, num_shots, m_idx)
+
+    def __init__(self, matrix, num_qubits, num_ancillas, basis_vec, shots, m_idx):
+        super().__init__()
+
+        self.matrix = matrix
+        self.num_qubits = num_qubits
+        self.num_ancillas = num_ancillas
+        self.basis_vec = basis_vec
+        self.shots = shots
+        self.m_idx = m_idx
+
+    def build_circuit(self):
+        matrix = self.matrix
+        num_qubits = self.num_qubits
+        num_ancillas = self.num_ancillas
+        basis_vec = self.basis_vec
+
         # Build block-encoding of A
         block_encoding = pq.Program()
         HHLJob.list_to_circuit(matrix["circuit"], block_encoding)
@@ -93,30 +115,16 @@ class HHLJob(RigettiJob):
 
         used_qubits = num_qubits - num_ancillas
 
-        for m_idx in range(shots_multiplier):
-            for basis_vec in range(2 ** used_qubits):
-                instance_circuit = pq.Program()
-
-                instance_circuit += pq.gates.X(1)
-                for i in range(used_qubits):
-                    if basis_vec % 2 ** (i + 1) >= 2 ** i:
-                        instance_circuit += pq.gates.X(num_qubits - i)
-
-                instance_circuit += qsvt_circuit
+        instance_circuit = pq.Program()
 
-                yield HHLJob(
-                    instance_circuit, num_qubits, num_ancillas, basis_vec, num_shots, m_idx
-                )
+        instance_circuit += pq.gates.X(1)
+        for i in range(used_qubits):
+            if basis_vec % 2 ** (i + 1) >= 2 ** i:
+                instance_circuit += pq.gates.X(num_qubits - i)
 
-    def __init__(self, circuit, num_qubits, num_ancillas, basis_vec, shots, m_idx):
-        super().__init__()
+        instance_circuit += qsvt_circuit
 
-        self.circuit = circuit
-        self.num_qubits = num_qubits
-        self.num_ancillas = num_ancillas
-        self.basis_vec = basis_vec
-        self.shots = shots
-        self.m_idx = m_idx
+        return instance_circuit
 
     def run(self, device):
         super().run(device)
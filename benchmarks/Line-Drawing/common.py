@@ -1,4 +1,3 @@
-from typing import Dict
 from pathlib import Path
 import os
 
@@ -9,8 +8,10 @@ np.set_printoptions(linewidth=200)
 import matplotlib.pyplot as plt
 import itertools as it
 
-from libbench import VendorJob, is_power_of_2
+from libbench import ResultIndex, is_power_of_2
+from libbench.histogram import probabilities
 from .shapes import SHAPE_FUNCTIONS
+from .tomography import gkkt_reconstruction, gkkt_top_eigenvectors
 
 
 class LineDrawingBenchmarkMixin:
@@ -61,41 +62,36 @@ class LineDrawingBenchmarkMixin:
 
         return corrected_curve
 
-    def collate_results(self, results: Dict[VendorJob, object]):
+    def collate_results(self, results: ResultIndex):
         # PRE OUR OWN TOMOGRAPHY METHOD
         if not hasattr(self, "tomography_method") or self.tomography_method == "custom":
             n = int(np.log2(len(self.points)))
             curves = []
             for j in range(self.num_repetitions):
-                for job in results:
-                    if job.repetition == j and job.Hadamard_qubit is None and job.S_qubit is None:
-                        prob_hist = results[job]
-                        estimates = {k: np.sqrt(v) for k, v in prob_hist.items()}
-                        break
-                else:
+                prob_hist = results.lookup(repetition=j, Hadamard_qubit=None, S_qubit=None)
+                if prob_hist is None:
                     raise AssertionError(
                         f"The probability job with repetition {j} was not found in the results data structure."
                     )
+                estimates = {
+                    f"{i:0{n}b}": np.sqrt(p) for i, p in enumerate(probabilities(prob_hist, n))
+                }
 
                 # Retrieve the relative phase estimates
                 for k in range(n - 1, -1, -1):
-                    for job in results:
-                        if job.repetition == j and job.Hadamard_qubit == k and job.S_qubit is None:
-                            cos_hist = results[job]
-                            break
-                    else:
+                    cos_hist = results.lookup(repetition=j, Hadamard_qubit=k, S_qubit=None)
+                    if cos_hist is None:
                         raise AssertionError(
                             f"The job with repetition {j}, Hadamard qubit {k} and S qubit None is missing."
                         )
+                    cos_hist = probabilities(cos_hist, n)
 
-                    for job in results:
-                        if job.repetition == j and job.Hadamard_qubit == k and job.S_qubit == k:
-                            sin_hist = results[job]
-                            break
-                    else:
+                    sin_hist = results.lookup(repetition=j, Hadamard_qubit=k, S_qubit=k)
+                    if sin_hist is None:
                         raise AssertionError(
                             f"The job with repetition {j}, Hadamard qubit {k} and S qubit {k} is missing."
                         )
+                    sin_hist = probabilities(sin_hist, n)
 
                     its = [["0"]] * (k + 1) + [["0", "1"]] * (n - 1 - k)
                     for j0 in it.product(*its):
@@ -104,8 +100,9 @@ class LineDrawingBenchmarkMixin:
                         fact = abs(estimates[j0] * estimates[j1])
                         if fact == 0:
                             continue
-                        cos_phase_diff = (cos_hist[j0] - cos_hist[j1]) / (2 * fact)
-                        sin_phase_diff = (sin_hist[j0] - sin_hist[j1]) / (2 * fact)
+                        i0, i1 = int(j0, 2), int(j1, 2)
+                        cos_phase_diff = (cos_hist[i0] - cos_hist[i1]) / (2 * fact)
+                        sin_phase_diff = (sin_hist[i0] - sin_hist[i1]) / (2 * fact)
                         phase_diff = np.arctan2(sin_phase_diff, cos_phase_diff)
 
                         # Iterate over the part of the Hamming cube that is influenced
@@ -126,76 +123,34 @@ class LineDrawingBenchmarkMixin:
         ## OWN TOMOGRAPHY METHOD
         assert self.tomography_method == "GKKT", "invalid tomography method given"
 
-        # Retrieve the amplitude estimates
+        # Retrieve the measurement statistics
         n = int(np.log2(len(self.points)))
-        curves = []
+        pauli_strings = list(it.product(["X", "Y", "Z"], repeat=n))
+        prob_hists = np.zeros((self.num_repetitions, len(pauli_strings), 2 ** n))
         for j in range(self.num_repetitions):
-            prob_hists = {}
-            for pauli_string in it.product(["X", "Y", "Z"], repeat=n):
-
-                # Retrieve the measurement statistics
-                for job in results:
-                    if job.repetition == j and job.pauli_string == pauli_string:
-                        prob_hists["".join(pauli_string)] = results[job]
-                        break
-                else:
+            for k, pauli_string in enumerate(pauli_strings):
+                prob_hist = results.lookup(repetition=j, pauli_string=pauli_string)
+                if prob_hist is None:
                     raise AssertionError(
                         f"The probability job with repetition {j} was not found in the results data structure."
                     )
+                prob_hists[j, k] = probabilities(prob_hist, n)
 
-            # eigenstates of the paulis
-            eigenstates = {
-                "X0": np.array([1, 1], dtype=np.complex64) / np.sqrt(2),
-                "X1": np.array([1, -1], dtype=np.complex64) / np.sqrt(2),
-                "Y0": np.array([1, 1.0j], dtype=np.complex64) / np.sqrt(2),
-                "Y1": np.array([1, -1.0j], dtype=np.complex64) / np.sqrt(2),
-                "Z0": np.array([1, 0], dtype=np.complex64),
-                "Z1": np.array([0, 1], dtype=np.complex64),
-            }
-
-            approx = np.zeros((2 ** n, 2 ** n), dtype=np.complex64)
-            for pauli_string in it.product(["X", "Y", "Z"], repeat=n):
-                for o, f in prob_hists["".join(pauli_string)].items():
-                    m = np.array([1], dtype=np.complex64)
-                    for pi, oi in zip(pauli_string, o):
-                        basis_state = eigenstates[pi + oi]
-                        tensor = (
-                            np.conj(basis_state.T)[np.newaxis, :] * basis_state[:, np.newaxis]
-                            - np.eye(2) / 3
-                        )
-                        m = np.kron(m, tensor)
-                    m *= f
-                    approx += m / (3 ** n)
+        # reconstruct all density matrices at once
+        approxs = gkkt_reconstruction(prob_hists)
 
-            # trace 1
-            approx /= approx.trace()
+        # largest eigenvectors, and their eigenvalues minus the projected shift of GKKT, III. B
+        vectors, values = gkkt_top_eigenvectors(approxs)
 
-            # Obtain the largest eigenvector
-            w, v = np.linalg.eigh(approx)
-            idx = w.argsort()[::-1]
-            w = w[idx]
-            v = v[:, idx]
-            curve = v[:, 0] / np.exp(1.0j * np.angle(v[0, 0]))
+        curves = []
+        for v, value in zip(vectors, values):
+            curve = v / np.exp(1.0j * np.angle(v[0]))
 
             # correct curve alignment
             curve = self.corrected_curve(curve, self.points)
 
-            # find projected eigenvalue shift as described in GKKT, III. B
-            def tr(x):
-                return sum([ww - x for ww in w if ww - x > 0])
-
-            left, right = 0.0, w[0]
-
-            for _ in range(32):
-                midpt = (left + right) / 2
-                if tr(midpt) >= 1:
-                    left = midpt
-                else:
-                    right = midpt
-            x0 = midpt
-
             # rescale to represent mixedness
-            curve *= np.sqrt(w[0] - x0)
+            curve *= np.sqrt(value)
 
             # Add the curve to the resulting curves
             curves.append(curve)
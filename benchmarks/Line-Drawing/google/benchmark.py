@@ -2,7 +2,7 @@ from typing import Dict, List, Union
 
 import numpy as np
 
-from libbench.google import Benchmark as GoogleBenchmark
+from libbench.google import Benchmark as GoogleBenchmark, histogram
 from .job import GoogleLineDrawingJob
 from .. import LineDrawingBenchmarkMixin
 
@@ -38,14 +38,7 @@ class GoogleLineDrawingBenchmark(GoogleLineDrawingBenchmarkBase):
         super().__init__(**kwargs)
 
     def parse_result(self, job, result):
-        n = len(job.qubits)
-        measurements = result.measurements["result"]
-        str_measurements = ["".join(map(lambda x: str(int(x)), r)) for r in measurements]
-        hist = {
-            f"{i:0{n}b}": str_measurements.count(f"{i:0{n}b}") / job.num_shots
-            for i in range(2 ** n)
-        }
-        return hist
+        return histogram(result, ["result"])
 
 
 class GoogleLineDrawingSimulatedBenchmark(GoogleLineDrawingBenchmarkBase):
@@ -52,6 +52,15 @@ class GoogleLineDrawingJob(GoogleJob):
         self.repetition = repetition
         self.pauli_string = pauli_string
 
+        # the QFT reverses the order of the qubits
+        n = int(np.log2(len(points)))
+        self.qubits = [cirq.GridQubit(0, i) for i in reversed(range(n))]
+
+    def build_circuit(self):
+        points = self.points
+        state_preparation_method = self.state_preparation_method
+        pauli_string = self.pauli_string
+
         n = int(np.log2(len(points)))
 
         Fourier_coeffs = np.fft.fft(points, norm="ortho")
@@ -71,15 +80,13 @@ class GoogleLineDrawingJob(GoogleJob):
         if self.add_measurements:
             circuit.append(cirq.measure(*qubits, key="result"))
 
-        # store the resulting circuit
-        self.qubits = qubits
-        self.circuit = circuit
-
         # Display some statistics
         qubit_ops = [len(op.qubits) for moment in circuit for op in moment]
         print(" - No. single qubit gates:", qubit_ops.count(1))
         print(" - No. two qubit gates:", qubit_ops.count(2))
 
+        return circuit
+
     def prepare_state(self, state, qubits, state_preparation_method):
         assert state_preparation_method in ["DC", "SBM", "SBM+GC", "BVMS"]
 
@@ -2,7 +2,7 @@ from typing import Dict, List
 
 import numpy as np
 
-from libbench.ibm import Benchmark as IBMBenchmark
+from libbench.ibm import Benchmark as IBMBenchmark, histogram
 
 from .job import IBMLineDrawingJob
 from .. import LineDrawingBenchmarkMixin
@@ -42,12 +42,8 @@ class IBMLineDrawingBenchmark(IBMLineDrawingBenchmarkBase):
         n = int(np.log2(len(self.points)))
         assert len(self.points) == 2 ** n
 
-        hist = result.get_counts()
-        corrected_hist = {}
-        for i in range(2 ** n):
-            s = f"{i:0{n}b}"
-            corrected_hist["".join(reversed(s))] = hist[s] / self.num_shots if s in hist else 0
-        return corrected_hist
+        # qiskit's last classical bit is the most significant one, so we reverse the bits
+        return histogram(result).bit_reversed()
 
 
 class IBMLineDrawingSimulatedBenchmark(IBMLineDrawingBenchmarkBase):
@@ -50,6 +50,11 @@ class IBMLineDrawingJob(IBMJob):
         self.repetition = repetition
         self.pauli_string = pauli_string
 
+    def build_circuit(self):
+        points = self.points
+        state_preparation_method = self.state_preparation_method
+        pauli_string = self.pauli_string
+
         n = int(np.log2(len(points)))
 
         # NOTE: This is actually the INVERSE QFT because of incompatible definitions
@@ -68,8 +73,7 @@ class IBMLineDrawingJob(IBMJob):
         if self.add_measurements:
             circuit.measure(list(range(n - 1, -1, -1)), list(range(n)))
 
-        # store the resulting circuit
-        self.circuit = circuit
+        return circuit
 
     def prepare_state(self, state, qubits, state_preparation_method):
         assert state_preparation_method in ["DC", "SBM", "SBM+GC", "BVMS"]
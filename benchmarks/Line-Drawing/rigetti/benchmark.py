@@ -2,7 +2,7 @@ from typing import Dict, List
 
 import numpy as np
 
-from libbench.rigetti import Benchmark as RigettiBenchmark
+from libbench.rigetti import Benchmark as RigettiBenchmark, bitstring_histogram
 
 from .job import RigettiLineDrawingJob
 from .. import LineDrawingBenchmarkMixin
@@ -42,19 +42,7 @@ class RigettiLineDrawingBenchmark(RigettiLineDrawingBenchmarkBase):
         n = int(np.log2(len(self.points)))
         assert len(self.points) == 2 ** n
 
-        hist = {}
-        for measurement in np.vstack([result[k] for k in range(n)]).T:
-            key = "".join(["0" if b == 0 else "1" for b in measurement])
-            if key in hist:
-                hist[key] += 1
-            else:
-                hist[key] = 1
-
-        corrected_hist = {}
-        for i in range(2 ** n):
-            s = f"{i:0{n}b}"
-            corrected_hist["".join(reversed(s))] = hist[s] / self.num_shots if s in hist else 0
-        return corrected_hist
+        return bitstring_histogram(result, range(n)).bit_reversed()
 
 
 class RigettiLineDrawingSimulatedBenchmark(RigettiLineDrawingBenchmarkBase):
@@ -51,6 +51,11 @@ class RigettiLineDrawingJob(RigettiJob):
         self.repetition = repetition
         self.pauli_string = pauli_string
 
+    def build_circuit(self):
+        points = self.points
+        state_preparation_method = self.state_preparation_method
+        pauli_string = self.pauli_string
+
         n = int(np.log2(len(points)))
 
         # NOTE: This is actually the INVERSE QFT because of incompatible definitions
@@ -69,8 +74,7 @@ class RigettiLineDrawingJob(RigettiJob):
                 program += pq.gates.S(n - 1 - i).dagger()
                 program += pq.gates.H(n - 1 - i)
 
-        # store the resulting program
-        self.program = program
+        return program
 
     def prepare_state(self, state, qubits, method):
         assert method in ["DC", "SBM", "SBM+GC", "BVMS"]
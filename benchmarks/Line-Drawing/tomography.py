@@ -0,0 +1,83 @@
+import numpy as np
+
+# eigenstates of the paulis, indexed by pauli and outcome
+EIGENSTATES = np.array(
+    [
+        [[1, 1], [1, -1]],  # X
+        [[1, 1.0j], [1, -1.0j]],  # Y
+        [[np.sqrt(2), 0], [0, np.sqrt(2)]],  # Z
+    ],
+    dtype=np.complex128,
+) / np.sqrt(2)
+
+# single-qubit GKKT estimators |e><e| - 1/3, one for each pauli and outcome, flattened to 6 x 4
+ESTIMATORS = (
+    EIGENSTATES[:, :, :, np.newaxis] * np.conj(EIGENSTATES[:, :, np.newaxis, :])
+    - np.eye(2)[np.newaxis, np.newaxis] / 3
+).reshape(6, 4)
+
+
+def gkkt_reconstruction(probabilities: np.ndarray) -> np.ndarray:
+    """
+    reconstruct density matrices from pauli measurement statistics, as in GKKT.
+
+    probabilities has shape (repetitions, 3^n, 2^n); the first index enumerates the pauli strings
+    in the order of it.product("XYZ", repeat=n), the second the outcomes, with the first qubit being
+    the most significant bit. Returns the (repetitions, 2^n, 2^n) reconstructed matrices, normalized
+    to trace 1.
+
+    Instead of summing a kronecker product for each of the 6^n pauli string and outcome pairs, we
+    contract the per-qubit estimators into the outcome tensor one qubit at a time.
+    """
+    num_repetitions = probabilities.shape[0]
+    n = int(np.log2(probabilities.shape[2]))
+    assert probabilities.shape[1:] == (3 ** n, 2 ** n), "need one histogram per pauli string"
+
+    # interleave pauli and outcome of each qubit into one axis of length 6
+    tensor = probabilities.reshape((num_repetitions,) + (3,) * n + (2,) * n)
+    tensor = tensor.transpose([0] + [a for q in range(n) for a in (1 + q, 1 + n + q)])
+    tensor = tensor.reshape((num_repetitions,) + (6,) * n)
+
+    # contracting the first remaining qubit axis appends its 2 x 2 block as the last axis,
+    # so after n steps the blocks are in qubit order
+    for _ in range(n):
+        tensor = np.tensordot(tensor, ESTIMATORS, axes=([1], [0]))
+
+    approx = tensor.reshape((num_repetitions,) + (2, 2) * n)
+    approx = approx.transpose([0] + list(range(1, 2 * n + 1, 2)) + list(range(2, 2 * n + 1, 2)))
+    approx = approx.reshape(num_repetitions, 2 ** n, 2 ** n)
+
+    # trace 1
+    return approx / np.trace(approx, axis1=1, axis2=2)[:, np.newaxis, np.newaxis]
+
+
+def trace_shift(eigenvalues: np.ndarray, num_steps: int = 32) -> np.ndarray:
+    """
+    projected eigenvalue shift as described in GKKT, III. B, i.e. x such that the eigenvalues above
+    x, minus x, sum to 1; found by bisection, at once for a batch of full spectra of shape
+    (batch, dim) in descending order.
+    """
+    left, right = np.zeros(len(eigenvalues)), eigenvalues[:, 0].copy()
+
+    for _ in range(num_steps):
+        midpt = (left + right) / 2
+        above = np.clip(eigenvalues - midpt[:, np.newaxis], 0, None).sum(axis=1) >= 1
+        left = np.where(above, midpt, left)
+        right = np.where(above, right, midpt)
+
+    return midpt
+
+
+def gkkt_top_eigenvectors(approxs: np.ndarray):
+    """
+    largest eigenvector and its eigenvalue minus the GKKT trace shift, for a batch of reconstructed
+    density matrices.
+
+    All repetitions are decomposed by a single batched eigh. We need the full spectrum: for noisy
+    reconstructions the trace shift lies within the bulk of small eigenvalues (for 256 points and
+    1024 shots about a dozen eigenvalues are above it), such that the top few eigenvalues alone, as
+    a partial, iterative eigensolver would give them, do not determine the shift.
+    """
+    w, v = np.linalg.eigh(approxs)
+    w, v = w[:, ::-1], v[:, :, ::-1]
+    return v[:, :, 0], w[:, 0] - trace_shift(w)
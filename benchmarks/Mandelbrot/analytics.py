@@ -1,74 +1,52 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
-# The transform
-def gen_F(c):
-    def F(z):
-        return z ** 2 + c
+from libbench.cache import DiskCache
+from libbench.pictures import cached_pictures
 
-    return F
+# bump the version whenever probabilities or the pixel layout change
+PICTURE_CACHE = DiskCache("mandelbrot", version=1)
 
 
-# The iterated transform
-def gen_Fcirc(c):
-    F = gen_F(c)
+# The transform, applied to all points c of the grid at once
+def F(c, z):
+    return z ** 2 + c
 
-    def Fcirc(n, z):
-        if n == 0:
-            return z
-        if n == 1:
-            return F(z)
-        return Fcirc(n - 1, F(z))
 
-    return Fcirc
-
-
-# The success probability
-def gen_p1(c):
-    Fcirc = gen_Fcirc(c)
-
-    def p1(n, z):
-        return 1 / (np.abs(Fcirc(n, z)) ** 2 + 1)
-
-    return p1
-
-
-# The post-selection probability
-def gen_pps(c):
-    r2 = abs(c) * np.sqrt(0.5 * (1 + np.sqrt(1 + 4 / abs(c) ** 2)))
+# The factor of the post-selection probability contributed by the orbit point x
+def pps_factor(c, x):
+    r2 = np.abs(c) * np.sqrt(0.5 * (1 + np.sqrt(1 + 4 / np.abs(c) ** 2)))
     r1 = 1 / r2
-    Fcirc = gen_Fcirc(c)
-
-    def pps(n, z):
-        f = 1.0
-        for j in range(1, n + 1):
-            x = Fcirc(n - j, z)
-            f *= (
-                (
-                    abs(
-                        x ** 2 / np.sqrt(1 + r2 ** 2)
-                        + np.exp(1.0j * np.angle(c)) * r2 / np.sqrt((1 + r1 ** 2) * (1 + r2 ** 2))
-                    )
-                    ** 2
-                    + r1 ** 2 / (1 + r1 ** 2)
-                )
-                / (1 + abs(x) ** 2) ** 2
-            ) ** (2 ** (j - 1))
-        return f
-
-    return pps
+    return (
+        np.abs(
+            x ** 2 / np.sqrt(1 + r2 ** 2)
+            + np.exp(1.0j * np.angle(c)) * r2 / np.sqrt((1 + r1 ** 2) * (1 + r2 ** 2))
+        )
+        ** 2
+        + r1 ** 2 / (1 + r1 ** 2)
+    ) / (1 + np.abs(x) ** 2) ** 2
+
+
+# The post-selection and success probabilities
+def probabilities(n, c):
+    """
+    post-selection and success probability after n iterations starting from z = 0, for an array of
+    points c; the orbit is carried forward once, with the k-th point contributing to the
+    post-selection probability with exponent 2^(n-1-k)
+    """
+    z = np.zeros_like(c)
+    pss = np.ones(c.shape)
+    for k in range(n):
+        pss *= pps_factor(c, z) ** (2 ** (n - 1 - k))
+        z = F(c, z)
+
+    ss = 1 / (np.abs(z) ** 2 + 1)
+    return pss, ss
 
 
 # Calculate the pixel values for the pictures
-def make_pictures(n, p):
-    xs = np.linspace(-2.0, 2.0, p + 1)
-    xs = 0.5 * (xs[:-1] + xs[1:])
-    cs = xs[np.newaxis, :] + 1j * xs[:, np.newaxis]
-
-    pss = np.zeros(cs.shape)
-    ss = np.zeros(cs.shape)
-    for idx, c in np.ndenumerate(cs):
-        pss[idx] = gen_pps(c)(n, 0)
-        ss[idx] = gen_p1(c)(n, 0)
-
-    return pss, ss
+def make_pictures(n, p, extent=(-2.0, 2.0, -2.0, 2.0)):
+    """
+    expected post-selection and success probability of every pixel, with rows running over y;
+    memoized on disk by (n, p, extent) and the PICTURE_CACHE version
+    """
+    return cached_pictures(PICTURE_CACHE, probabilities, n, p, extent)
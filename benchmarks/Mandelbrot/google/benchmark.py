@@ -2,7 +2,7 @@ from typing import Dict, List, Union
 
 import numpy as np
 
-from libbench.google import Benchmark as GoogleBenchmark
+from libbench.google import Benchmark as GoogleBenchmark, histogram
 from .job import GoogleMandelbrotJob
 from .. import MandelbrotBenchmarkMixin
 
@@ -22,6 +22,7 @@ class GoogleMandelbrotBenchmarkBase(MandelbrotBenchmarkMixin, GoogleBenchmark):
             self.ymin,
             self.ymax,
             self.add_measurements,
+            self.template,
         )
 
     def __str__(self):
@@ -40,22 +41,15 @@ class GoogleMandelbrotBenchmark(GoogleMandelbrotBenchmarkBase):
         super().__init__(**kwargs)
 
     def parse_result(self, job, result):
-        post_selection_result = list(
-            not any(outcome) for outcome in result.measurements["post_selection"]
-        )
-        num_post_selected = post_selection_result.count(True)
+        qubits = 2 ** self.num_post_selections
+        hist = histogram(result, ["success", "post_selection"], range(qubits))
+
+        # all qubits but the first one are post-selected on 0, the first one is the outcome
+        num_post_selected_failures = int(hist.counts[0])
+        num_post_selected_successes = int(hist.counts[hist.index({0: 1})])
+        num_post_selected = num_post_selected_failures + num_post_selected_successes
         psp = num_post_selected / self.num_shots
-        z = (
-            list(
-                success and post_selected
-                for success, post_selected in zip(
-                    result.measurements["success"], post_selection_result
-                )
-            ).count(True)
-            / num_post_selected
-            if num_post_selected > 0
-            else 0
-        )
+        z = num_post_selected_successes / num_post_selected if num_post_selected > 0 else 0
 
         return {"psp": psp, "z": z}
 
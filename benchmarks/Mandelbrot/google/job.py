@@ -1,18 +1,31 @@
 import itertools as it
+import functools
 from functools import reduce
 
 from typing import Union
 
 import numpy as np
 import cirq
+import sympy
 
 from libbench.google import Job as GoogleJob
 
 
 class GoogleMandelbrotJob(GoogleJob):
+    # jobs pickled before templates existed build their own circuit
+    template = False
+
     @staticmethod
     def job_factory(
-        num_post_selections, num_pixels, num_shots, xmin, xmax, ymin, ymax, add_measurements
+        num_post_selections,
+        num_pixels,
+        num_shots,
+        xmin,
+        xmax,
+        ymin,
+        ymax,
+        add_measurements,
+        template=False,
     ):
         xs = np.linspace(xmin, xmax, num_pixels + 1)
         xs = 0.5 * (xs[:-1] + xs[1:])
@@ -21,9 +34,11 @@ class GoogleMandelbrotJob(GoogleJob):
 
         for (i, x), (j, y) in it.product(enumerate(xs), enumerate(ys)):
             z = x + 1j * y
-            yield GoogleMandelbrotJob(num_post_selections, num_shots, z, add_measurements, i, j)
+            yield GoogleMandelbrotJob(
+                num_post_selections, num_shots, z, add_measurements, i, j, template
+            )
 
-    def __init__(self, num_post_selections, num_shots, z, add_measurements, i, j):
+    def __init__(self, num_post_selections, num_shots, z, add_measurements, i, j, template=False):
         super().__init__()
 
         self.num_post_selections = num_post_selections
@@ -32,6 +47,10 @@ class GoogleMandelbrotJob(GoogleJob):
         self.z = z
         self.i = i
         self.j = j
+        self.template = template
+
+    def parameters_for_pixel(self):
+        z = self.z
 
         # Calculate the required circuit parameters
         r2 = abs(z) * np.sqrt(0.5 * (1 + np.sqrt(1 + 4 / abs(z) ** 2)))
@@ -40,6 +59,20 @@ class GoogleMandelbrotJob(GoogleJob):
         r1rot = 2 * np.arccos(1 / np.sqrt(1.0 + r1 ** 2))
         r2rot = 2 * np.arccos(1 / np.sqrt(1.0 + r2 ** 2))
 
+        return {"r1rot": r1rot, "r2rot": r2rot, "phi": phi}
+
+    @staticmethod
+    @functools.lru_cache()
+    def template_circuit(num_post_selections, add_measurements):
+        """
+        circuit with a sympy symbol in place of every pixel-dependent angle;
+        it is built once, and every pixel only resolves its values
+        """
+        parameters = {name: sympy.Symbol(name) for name in ["r1rot", "r2rot", "phi"]}
+        return GoogleMandelbrotJob.make_circuit(num_post_selections, add_measurements, **parameters)
+
+    @staticmethod
+    def make_circuit(num_post_selections, add_measurements, r1rot, r2rot, phi):
         # Build the circuit
         qubits = [cirq.GridQubit(0, i) for i in range(2 ** num_post_selections)]
         circuit = cirq.Circuit()
@@ -87,11 +120,22 @@ class GoogleMandelbrotJob(GoogleJob):
             )
             circuit.append(cirq.measure(qubits[0], key="success"))
 
-        # store the resulting circuit
-        self.circuit = circuit
+        return circuit
+
+    def build_circuit(self):
+        if self.template:
+            return self.template_circuit(self.num_post_selections, self.add_measurements)
+
+        return self.make_circuit(
+            self.num_post_selections, self.add_measurements, **self.parameters_for_pixel()
+        )
 
     def run(self, device):
         super().run(device)
+        if self.template:
+            return device.execute(
+                self.circuit, num_shots=self.num_shots, parameters=self.parameters_for_pixel()
+            )
         return device.execute(self.circuit, num_shots=self.num_shots)
 
     def __str__(self):
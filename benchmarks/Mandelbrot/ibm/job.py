@@ -1,16 +1,29 @@
 import itertools as it
+import functools
 from functools import reduce
 
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
 
 from libbench.ibm import Job as IBMJob
 
 
 class IBMMandelbrotJob(IBMJob):
+    # jobs pickled before templates existed build their own circuit
+    template = False
+
     @staticmethod
     def job_factory(
-        num_post_selections, num_pixels, num_shots, xmin, xmax, ymin, ymax, add_measurements
+        num_post_selections,
+        num_pixels,
+        num_shots,
+        xmin,
+        xmax,
+        ymin,
+        ymax,
+        add_measurements,
+        template=False,
     ):
         xs = np.linspace(xmin, xmax, num_pixels + 1)
         xs = 0.5 * (xs[:-1] + xs[1:])
@@ -19,9 +32,11 @@ class IBMMandelbrotJob(IBMJob):
 
         for (i, x), (j, y) in it.product(enumerate(xs), enumerate(ys)):
             z = x + 1j * y
-            yield IBMMandelbrotJob(num_post_selections, z, add_measurements, i, j, num_shots)
+            yield IBMMandelbrotJob(
+                num_post_selections, z, add_measurements, i, j, num_shots, template
+            )
 
-    def __init__(self, num_post_selections, z, add_measurements, i, j, num_shots):
+    def __init__(self, num_post_selections, z, add_measurements, i, j, num_shots, template=False):
         super().__init__()
 
         self.num_post_selections = num_post_selections
@@ -30,6 +45,10 @@ class IBMMandelbrotJob(IBMJob):
         self.i = i
         self.j = j
         self.num_shots = num_shots
+        self.template = template
+
+    def parameters_for_pixel(self):
+        z = self.z
 
         # Calculate the required circuit parameters
         r2 = abs(z) * np.sqrt(0.5 * (1 + np.sqrt(1 + 4 / abs(z) ** 2)))
@@ -38,6 +57,20 @@ class IBMMandelbrotJob(IBMJob):
         r1rot = 2 * np.arccos(1 / np.sqrt(1.0 + r1 ** 2))
         r2rot = 2 * np.arccos(1 / np.sqrt(1.0 + r2 ** 2))
 
+        return {"r1rot": r1rot, "r2rot": r2rot, "phi": phi}
+
+    @staticmethod
+    @functools.lru_cache()
+    def template_circuit(num_post_selections, add_measurements):
+        """
+        circuit with a qiskit Parameter in place of every pixel-dependent angle;
+        it is built and transpiled once, and every pixel only binds its values
+        """
+        parameters = {name: Parameter(name) for name in ["r1rot", "r2rot", "phi"]}
+        return IBMMandelbrotJob.make_circuit(num_post_selections, add_measurements, **parameters)
+
+    @staticmethod
+    def make_circuit(num_post_selections, add_measurements, r1rot, r2rot, phi):
         # Set up the circuit
         circuit = (
             QuantumCircuit(2 ** num_post_selections, 2 ** num_post_selections)
@@ -64,11 +97,22 @@ class IBMMandelbrotJob(IBMJob):
                 list(range(2 ** num_post_selections)), list(range(2 ** num_post_selections))
             )
 
-        # store the resulting circuit
-        self.circuit = circuit
+        return circuit
+
+    def build_circuit(self):
+        if self.template:
+            return self.template_circuit(self.num_post_selections, self.add_measurements)
+
+        return self.make_circuit(
+            self.num_post_selections, self.add_measurements, **self.parameters_for_pixel()
+        )
 
     def run(self, device):
         super().run(device)
+        if self.template:
+            return device.execute(
+                self.circuit, num_shots=self.num_shots, parameters=self.parameters_for_pixel()
+            )
         return device.execute(self.circuit, num_shots=self.num_shots)
 
     def __str__(self):
@@ -0,0 +1,2 @@
+from .benchmark import NumpyMandelbrotBenchmark as Benchmark
+from .benchmark import NumpyMandelbrotSimulatedBenchmark as SimulatedBenchmark
@@ -0,0 +1,78 @@
+from typing import Dict, List
+
+import numpy as np
+
+from libbench.numpy import Benchmark as NumpyBenchmark, histogram
+
+from .job import NumpyMandelbrotJob
+from .. import MandelbrotBenchmarkMixin
+
+
+class NumpyMandelbrotBenchmarkBase(MandelbrotBenchmarkMixin, NumpyBenchmark):
+    def __init__(self, add_measurements, **kwargs):
+        super().__init__(**kwargs)
+        self.add_measurements = add_measurements
+
+    def get_jobs(self):
+        yield from NumpyMandelbrotJob.job_factory(
+            self.num_post_selections,
+            self.num_pixels,
+            self.num_shots,
+            self.xmin,
+            self.xmax,
+            self.ymin,
+            self.ymax,
+            self.add_measurements,
+            self.template,
+        )
+
+    def __str__(self):
+        return "Numpy-Mandelbrot"
+
+
+class NumpyMandelbrotBenchmark(NumpyMandelbrotBenchmarkBase):
+    """
+    Full SM Benchmark
+
+    Measurements are sampled from the exact outcome distribution, i.e. without noise
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.update({"add_measurements": True})
+        super().__init__(**kwargs)
+
+    def parse_result(self, job, result):
+        hist = histogram(result)
+
+        # all qubits but the first one are post-selected on 0, the first one is the outcome
+        num_post_selected_failures = int(hist.counts[0])
+        num_post_selected_successes = int(hist.counts[hist.index({0: 1})])
+        num_post_selected = num_post_selected_failures + num_post_selected_successes
+        psp = num_post_selected / self.num_shots
+        z = num_post_selected_successes / num_post_selected if num_post_selected > 0 else 0
+
+        return {"psp": psp, "z": z}
+
+
+class NumpyMandelbrotSimulatedBenchmark(NumpyMandelbrotBenchmarkBase):
+    """
+    Simulated SM Benchmark
+
+    The device behaves like a statevector_simulator, i.e. without noise
+    """
+
+    def __init__(self, **kwargs):
+        # all pixels run the same template circuit, such that the device evolves the states of a
+        # whole batch of pixels at once; this overrides --template
+        kwargs.update({"add_measurements": False, "template": True})
+        super().__init__(**kwargs)
+
+    def parse_result(self, job, result):
+        psi = result
+
+        # qubit 0 is the most significant bit of the statevector index
+        outcome = 2 ** (2 ** self.num_post_selections - 1)
+        psp = np.abs(psi[0]) ** 2 + np.abs(psi[outcome]) ** 2
+        z = np.abs(psi[outcome]) ** 2 / psp if psp > 0 else 0
+
+        return {"psp": psp, "z": z}
@@ -2,7 +2,7 @@ from typing import Dict, List, Union
 
 import numpy as np
 
-from libbench.rigetti import Benchmark as RigettiBenchmark
+from libbench.rigetti import Benchmark as RigettiBenchmark, bitstring_histogram
 
 from .job import RigettiMandelbrotJob
 from .. import MandelbrotBenchmarkMixin
@@ -18,6 +18,7 @@ class RigettiMandelbrotBenchmarkBase(MandelbrotBenchmarkMixin, RigettiBenchmark)
             self.ymin,
             self.ymax,
             self.num_shots,
+            self.template,
         )
 
     def __str__(self):
@@ -54,23 +55,11 @@ class RigettiMandelbrotBenchmark(RigettiMandelbrotBenchmarkBase):
         so each column represents one joint measurement outcome; selecting only a subset of the qubits
         effectively means measuring only a subset, ignoring the rest
         """
-        counts = {}
-        qubits = 2 ** self.num_post_selections
-        for measurement in np.vstack([result[k] for k in range(qubits)]).T:
-            key = "".join(["0" if b == 0 else "1" for b in measurement])
-            if key in counts:
-                counts[key] += 1
-            else:
-                counts[key] = 1
-
-        failure_post_process_key = "0" + "0" * (2 ** self.num_post_selections - 1)
-        success_post_process_key = "1" + "0" * (2 ** self.num_post_selections - 1)
-        num_post_selected_failures = (
-            counts[failure_post_process_key] if failure_post_process_key in counts else 0
-        )
-        num_post_selected_successes = (
-            counts[success_post_process_key] if success_post_process_key in counts else 0
-        )
+        hist = bitstring_histogram(result, range(2 ** self.num_post_selections))
+
+        # all qubits but the first one are post-selected on 0, the first one is the outcome
+        num_post_selected_failures = int(hist.counts[0])
+        num_post_selected_successes = int(hist.counts[hist.index({0: 1})])
         num_post_selected = num_post_selected_failures + num_post_selected_successes
         psp = num_post_selected / self.num_shots
         z = num_post_selected_successes / num_post_selected if num_post_selected > 0 else 0
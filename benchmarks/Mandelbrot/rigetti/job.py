@@ -1,4 +1,5 @@
 import itertools as it
+import functools
 from functools import reduce
 from typing import Union
 
@@ -10,8 +11,11 @@ from libbench.rigetti import Job as RigettiJob
 
 
 class RigettiMandelbrotJob(RigettiJob):
+    # jobs pickled before templates existed build their own program
+    template = False
+
     @staticmethod
-    def job_factory(num_post_selections, num_pixels, xmin, xmax, ymin, ymax, shots):
+    def job_factory(num_post_selections, num_pixels, xmin, xmax, ymin, ymax, shots, template=False):
         xs = np.linspace(xmin, xmax, num_pixels + 1)
         xs = 0.5 * (xs[:-1] + xs[1:])
         ys = np.linspace(ymin, ymax, num_pixels + 1)
@@ -19,9 +23,9 @@ class RigettiMandelbrotJob(RigettiJob):
 
         for (i, x), (j, y) in it.product(enumerate(xs), enumerate(ys)):
             z = x + 1j * y
-            yield RigettiMandelbrotJob(num_post_selections, z, i, j, shots)
+            yield RigettiMandelbrotJob(num_post_selections, z, i, j, shots, template)
 
-    def __init__(self, num_post_selections, z, i, j, shots):
+    def __init__(self, num_post_selections, z, i, j, shots, template=False):
         super().__init__()
 
         self.num_post_selections = num_post_selections
@@ -29,6 +33,10 @@ class RigettiMandelbrotJob(RigettiJob):
         self.i = i
         self.j = j
         self.shots = shots
+        self.template = template
+
+    def parameters_for_pixel(self):
+        z = self.z
 
         # Calculate the required circuit parameters
         r2 = abs(z) * np.sqrt(0.5 * (1 + np.sqrt(1 + 4 / abs(z) ** 2)))
@@ -37,9 +45,22 @@ class RigettiMandelbrotJob(RigettiJob):
         r1rot = -2 * np.arccos(1 / np.sqrt(1.0 + r1 ** 2))
         r2rot = -2 * np.arccos(1 / np.sqrt(1.0 + r2 ** 2))
 
-        # Build the circuit
+        return {"r1rot": r1rot, "r2rot": r2rot, "phi": phi}
+
+    @staticmethod
+    @functools.lru_cache()
+    def template_program(num_post_selections):
+        """
+        program with a declared memory region in place of every pixel-dependent angle;
+        every pixel only writes its values into the regions
+        """
         program = pq.Program()
+        parameters = {name: program.declare(name, "REAL") for name in ["r1rot", "r2rot", "phi"]}
+        return RigettiMandelbrotJob.make_program(num_post_selections, program, **parameters)
 
+    @staticmethod
+    def make_program(num_post_selections, program, r1rot, r2rot, phi):
+        # Build the circuit
         qubits = 2 ** num_post_selections
         for k in range(2 ** num_post_selections):
             program += pq.gates.X(k)
@@ -58,11 +79,22 @@ class RigettiMandelbrotJob(RigettiJob):
                 program += pq.gates.CNOT(l, l + 2 ** (k - 1))
                 program += pq.gates.X(l + 2 ** (k - 1))
 
-        # store the resulting circuit
-        self.program = program
+        return program
+
+    def build_circuit(self):
+        if self.template:
+            return self.template_program(self.num_post_selections)
+
+        return self.make_program(
+            self.num_post_selections, pq.Program(), **self.parameters_for_pixel()
+        )
 
     def run(self, device):
         super().run(device)
+        if self.template:
+            return device.execute(
+                self.program, num_shots=self.shots, parameters=self.parameters_for_pixel()
+            )
         return device.execute(self.program, num_shots=self.shots)
 
     def __str__(self):
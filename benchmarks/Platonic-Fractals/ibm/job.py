@@ -38,6 +38,12 @@ class IBMPlatonicFractalsJob(IBMJob):
         if not body == 0:  # PlatonicFractalsBenchmarkMixin.BODY_OCTA
             raise NotImplementedError("This fractal is not yet implemented!")
 
+    def build_circuit(self):
+        strength = self.strength
+        meas_dirs = self.meas_dirs
+        final_meas_dir = self.final_meas_dir
+        add_measurements = self.add_measurements
+
         # Calculate some parameters
         angle1 = arccos(sqrt((1 + strength) / 2))
         # angle2 = arccos(sqrt((1 - strength) / 2))
@@ -74,8 +80,8 @@ class IBMPlatonicFractalsJob(IBMJob):
                 list(range(1, len(meas_dirs) + 1)) + [0],
                 [len(meas_dirs) - i for i in range(len(meas_dirs) + 1)],
             )
-        # store the resulting circuit
-        self.circuit = circuit
+
+        return circuit
 
     def run(self, device):
         super().run(device)
@@ -0,0 +1,2 @@
+from .benchmark import NumpyPlatonicFractalsBenchmark as Benchmark
+from .benchmark import NumpyPlatonicFractalsSimulatedBenchmark as SimulatedBenchmark
@@ -0,0 +1,83 @@
+import numpy as np
+
+from libbench.numpy import Benchmark as NumpyBenchmark, histogram
+
+from .job import NumpyPlatonicFractalsJob
+from .. import PlatonicFractalsBenchmarkMixin
+
+
+class NumpyPlatonicFractalsBenchmarkBase(PlatonicFractalsBenchmarkMixin, NumpyBenchmark):
+    def __init__(self, add_measurements, **kwargs):
+        super().__init__(**kwargs)
+
+        self.add_measurements = add_measurements
+
+    def get_jobs(self):
+        yield from NumpyPlatonicFractalsJob.job_factory(
+            self.body,
+            self.strength,
+            self.num_steps,
+            self.num_shots,
+            self.shots_multiplier,
+            self.add_measurements,
+        )
+
+    def _parse_counts(self, job, counts: np.ndarray):
+        """
+        counts of shape (2^t, 2), indexed by the ancilla outcomes and the outcome of the qubit
+        """
+        if self.body != 0:  # PlatonicFractalsBenchmarkMixin.BODY_OCTA
+            raise NotImplementedError("This fractal has not been implemented")
+
+        num_steps = len(job.meas_dirs)
+        totals = counts.sum(axis=1)
+        avgs = counts[:, 0] - counts[:, 1]
+
+        total = {}
+        state = {}
+        for index in np.flatnonzero(totals):
+            bits = format(index, f"0{num_steps}b") if num_steps > 0 else ""
+            total[bits] = totals[index].item()
+            state[bits] = (avgs[index] / totals[index]).item()
+
+        if job.final_meas_dir == 2:
+            return {"dirs": job.meas_dirs, "ymeascounts": total, "ystates": state}
+        if job.final_meas_dir == 3:
+            return {"dirs": job.meas_dirs, "zmeascounts": total, "zstates": state}
+
+    def __str__(self):
+        return "Numpy-PlatonicFractals"
+
+
+class NumpyPlatonicFractalsBenchmark(NumpyPlatonicFractalsBenchmarkBase):
+    """
+    Full Benchmark
+
+    Measurements are sampled from the exact outcome distribution, i.e. without noise
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.update({"add_measurements": True})
+        super().__init__(*args, **kwargs)
+
+    def parse_result(self, job, result):
+        # the ancillas are the leading bits, the qubit is the least significant one
+        return self._parse_counts(job, histogram(result).counts.reshape(-1, 2))
+
+
+class NumpyPlatonicFractalsSimulatedBenchmark(NumpyPlatonicFractalsBenchmarkBase):
+    """
+    Simulated Benchmark
+
+    The device behaves like a statevector_simulator, i.e. without noise; the counts are the
+    expected counts for num_shots shots
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.update({"add_measurements": False})
+        super().__init__(*args, **kwargs)
+
+    def parse_result(self, job, result):
+        # qubit 0 is the most significant bit of the statevector index; move it last
+        probabilities = np.abs(result.reshape(2, -1)) ** 2
+        return self._parse_counts(job, self.num_shots * probabilities.T)
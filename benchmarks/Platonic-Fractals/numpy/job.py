@@ -0,0 +1,76 @@
+import itertools as it
+
+from math import pi
+from numpy import arccos, sqrt
+
+from libbench.numpy import Job as NumpyJob, Circuit
+
+
+class NumpyPlatonicFractalsJob(NumpyJob):
+    @staticmethod
+    def job_factory(body, strength, num_steps, num_shots, shots_multiplier, add_measurements):
+        # jobs are yielded in the depth-first order of the direction tree; the device simulates
+        # every shared prefix of directions once per batch
+        for m_idx in range(shots_multiplier):
+            for dirs in it.product(*[range(1, 4)] * num_steps):
+                yield NumpyPlatonicFractalsJob(
+                    body, strength, dirs, 2, num_shots, m_idx, add_measurements
+                )
+                yield NumpyPlatonicFractalsJob(
+                    body, strength, dirs, 3, num_shots, m_idx, add_measurements
+                )
+
+    def __init__(self, body, strength, meas_dirs, final_meas_dir, shots, m_idx, add_measurements):
+        super().__init__()
+
+        self.body = body
+        self.strength = strength
+        self.meas_dirs = meas_dirs
+        self.final_meas_dir = final_meas_dir
+        self.shots = shots
+        self.m_idx = m_idx
+        self.add_measurements = add_measurements
+
+        if not body == 0:  # PlatonicFractalsBenchmarkMixin.BODY_OCTA
+            raise NotImplementedError("This fractal is not yet implemented!")
+
+    def build_circuit(self):
+        strength = self.strength
+        meas_dirs = self.meas_dirs
+        final_meas_dir = self.final_meas_dir
+
+        # Calculate some parameters
+        angle1 = arccos(sqrt((1 + strength) / 2))
+
+        # Build the circuit; the gates of the i-th step only depend on the first i directions
+        circuit = Circuit(len(meas_dirs) + 1)
+        circuit.h(0)
+        for i in range(len(meas_dirs)):
+            if meas_dirs[i] == 2:
+                circuit.sdg(0)
+            if meas_dirs[i] == 1 or meas_dirs[i] == 2:
+                circuit.h(0)
+            circuit.h(i + 1)
+            circuit.rz(2 * angle1, i + 1)
+            circuit.crz(2 * (pi / 2 - 2 * angle1), 0, i + 1)
+            circuit.h(i + 1)
+            if meas_dirs[i] == 1 or meas_dirs[i] == 2:
+                circuit.h(0)
+            if meas_dirs[i] == 2:
+                circuit.s(0)
+        if final_meas_dir == 2:
+            circuit.sdg(0)
+        if final_meas_dir == 1 or final_meas_dir == 2:
+            circuit.h(0)
+        if self.add_measurements:
+            # the ancillas in the order of the steps, then the qubit; as the classical bits on IBM
+            circuit.measure(list(range(1, len(meas_dirs) + 1)) + [0])
+
+        return circuit
+
+    def run(self, device):
+        super().run(device)
+        return device.execute(self.circuit, num_shots=self.shots)
+
+    def __str__(self):
+        return f"NumpyPlatonicFractalsJob--{self.strength}-{self.meas_dirs}-{self.final_meas_dir}-{self.m_idx}"
@@ -1,6 +1,6 @@
 import numpy as np
 
-from libbench.rigetti import Benchmark as RigettiBenchmark
+from libbench.rigetti import Benchmark as RigettiBenchmark, bitstring_counts, counts_to_dict
 
 from .job import RigettiPlatonicFractalsJob
 from .. import PlatonicFractalsBenchmarkMixin
@@ -46,14 +46,8 @@ class RigettiPlatonicFractalsBenchmark(RigettiPlatonicFractalsBenchmarkBase):
         so each column represents one joint measurement outcome; selecting only a subset of the qubits
         effectively means measuring only a subset, ignoring the rest
         """
-        counts = {}
         qubits = len(job.meas_dirs) + 1
-        for measurement in np.vstack([result[k] for k in range(qubits)]).T:
-            key = "".join(["0" if b == 0 else "1" for b in measurement])
-            if key in counts:
-                counts[key] += 1
-            else:
-                counts[key] = 1
+        counts = counts_to_dict(bitstring_counts(result, range(qubits)), qubits)
 
         if self.body != 0:  # PlatonicFractalsBenchmarkMixin.BODY_OCTA
             raise NotImplementedError("This fractal has not been implemented")
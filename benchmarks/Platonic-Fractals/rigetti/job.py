@@ -40,6 +40,11 @@ class RigettiPlatonicFractalsJob(RigettiJob):
         if not body == 0:  # PlatonicFractalsBenchmarkMixin.BODY_OCTA
             raise NotImplementedError("This fractal is not yet implemented!")
 
+    def build_circuit(self):
+        strength = self.strength
+        meas_dirs = self.meas_dirs
+        final_meas_dir = self.final_meas_dir
+
         # Calculate some parameters
         angle1 = arccos(sqrt((1 + strength) / 2))
 
@@ -68,8 +73,7 @@ class RigettiPlatonicFractalsJob(RigettiJob):
         if final_meas_dir == 1 or final_meas_dir == 2:
             program += pq.gates.H(0)
 
-        # store the resulting circuit
-        self.program = program
+        return program
 
     def run(self, device):
         super().run(device)
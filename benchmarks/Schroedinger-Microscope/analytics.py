@@ -1,39 +1,37 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
-# The transform
-def F(z):
-    return (z ** 2 + 1j) / (1j * z ** 2 + 1)
+from libbench.cache import DiskCache
+from libbench.pictures import cached_pictures
 
+# bump the version whenever probabilities or the pixel layout change
+PICTURE_CACHE = DiskCache("schroedinger-microscope", version=1)
 
-# Iterated transform
-def Fcirc(n, z):
-    if n == 0:
-        return z
-    if n == 1:
-        return F(z)
-    return Fcirc(n - 1, F(z))
 
+# The transform
+def F(z):
+    return (z ** 2 + 1j) / (1j * z ** 2 + 1)
 
-# The success probability
-def p1(n, z):
-    return 1 / (np.abs(Fcirc(n, z)) ** 2 + 1)
 
+# The post-selection and success probabilities
+def probabilities(n, z):
+    """
+    post-selection and success probability after n iterations, for an array of starting points z;
+    the orbit is carried forward once, with the k-th point contributing to the post-selection
+    probability with exponent 2^(n-1-k)
+    """
+    pss = np.ones(z.shape)
+    for k in range(n):
+        pss *= ((np.abs(z) ** 4 + 1) / (np.abs(z) ** 2 + 1) ** 2) ** (2 ** (n - 1 - k))
+        z = F(z)
 
-# The post selection probability
-def pps(n, z):
-    f = 1.0
-    for j in range(1, n + 1):
-        x = Fcirc(n - j, z)
-        f *= ((abs(x) ** 4 + 1) / (abs(x) ** 2 + 1) ** 2) ** (2 ** (j - 1))
-    return f
+    ss = 1 / (np.abs(z) ** 2 + 1)
+    return pss, ss
 
 
 # Calculate the pixel values for the pictures
-def make_pictures(n, p):
-    xs = np.linspace(-2.0, 2.0, p + 1)
-    xs = 0.5 * (xs[:-1] + xs[1:])
-    zs = xs[np.newaxis, :] + 1j * xs[:, np.newaxis]
-    pss = pps(n, zs)
-    ss = p1(n, zs)
-    return pss, ss
+def make_pictures(n, p, extent=(-2.0, 2.0, -2.0, 2.0)):
+    """
+    expected post-selection and success probability of every pixel, with rows running over y;
+    memoized on disk by (n, p, extent) and the PICTURE_CACHE version
+    """
+    return cached_pictures(PICTURE_CACHE, probabilities, n, p, extent)
@@ -10,7 +10,18 @@ from .analytics import make_pictures
 
 
 class SchroedingerMicroscopeBenchmarkMixin:
-    def __init__(self, num_post_selections, num_pixels, num_shots, xmin, xmax, ymin, ymax, **_):
+    def __init__(
+        self,
+        num_post_selections,
+        num_pixels,
+        num_shots,
+        xmin,
+        xmax,
+        ymin,
+        ymax,
+        template=False,
+        **_,
+    ):
         super().__init__()
 
         self.num_post_selections = num_post_selections
@@ -20,6 +31,7 @@ class SchroedingerMicroscopeBenchmarkMixin:
         self.xmax = xmax
         self.ymin = ymin
         self.ymax = ymax
+        self.template = template
 
     def collate_results(self, results: Dict[VendorJob, object]):
         # get array dimensions right
@@ -104,7 +116,8 @@ class SchroedingerMicroscopeBenchmarkMixin:
 
     def score(self, collated_result: object, *_):
         zs, psps = collated_result
-        Epsps, Ezs = make_pictures(self.num_post_selections, self.num_pixels)
+        extent = (self.xmin, self.xmax, self.ymin, self.ymax)
+        Epsps, Ezs = make_pictures(self.num_post_selections, self.num_pixels, extent)
 
         # Calculate the post-selection score
         scaled_psps = (psps ** (1 / (2 ** self.num_post_selections - 1))).flatten()
@@ -181,4 +194,9 @@ def argparser(toadd, **argparse_options):
     parser.add_argument("--xmax", type=float, help="Maximal x-value", default=2)
     parser.add_argument("--ymin", type=float, help="Minimal y-value", default=-2)
     parser.add_argument("--ymax", type=float, help="Maximal y-value", default=2)
+    parser.add_argument(
+        "--template",
+        action="store_true",
+        help="Build and transpile one parameterized circuit, and only bind values per pixel",
+    )
     return parser
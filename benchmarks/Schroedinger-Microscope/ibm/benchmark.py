@@ -2,7 +2,7 @@ from typing import Dict, List
 
 import numpy as np
 
-from libbench.ibm import Benchmark as IBMBenchmark
+from libbench.ibm import Benchmark as IBMBenchmark, histogram
 
 from .job import IBMSchroedingerMicroscopeJob
 from .. import SchroedingerMicroscopeBenchmarkMixin
@@ -23,6 +23,7 @@ class IBMSchroedingerMicroscopeBenchmarkBase(SchroedingerMicroscopeBenchmarkMixi
             self.ymin,
             self.ymax,
             self.add_measurements,
+            self.template,
         )
 
     def __str__(self):
@@ -41,16 +42,11 @@ class IBMSchroedingerMicroscopeBenchmark(IBMSchroedingerMicroscopeBenchmarkBase)
         super().__init__(**kwargs)
 
     def parse_result(self, job, result):
-        counts = result.get_counts()
+        hist = histogram(result)
 
-        failure_post_process_key = "0" * (2 ** self.num_post_selections - 1) + "0"
-        success_post_process_key = "0" * (2 ** self.num_post_selections - 1) + "1"
-        num_post_selected_failures = (
-            counts[failure_post_process_key] if failure_post_process_key in counts else 0
-        )
-        num_post_selected_successes = (
-            counts[success_post_process_key] if success_post_process_key in counts else 0
-        )
+        # all qubits but the first one are post-selected on 0, the first one is the outcome
+        num_post_selected_failures = int(hist.counts[0])
+        num_post_selected_successes = int(hist.counts[hist.index({0: 1})])
         num_post_selected = num_post_selected_failures + num_post_selected_successes
         psp = num_post_selected / self.num_shots
         z = num_post_selected_successes / num_post_selected if num_post_selected > 0 else 0
@@ -1,16 +1,29 @@
 import itertools as it
+import functools
 from functools import reduce
 
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
 
 from libbench.ibm import Job as IBMJob
 
 
 class IBMSchroedingerMicroscopeJob(IBMJob):
+    # jobs pickled before templates existed build their own circuit
+    template = False
+
     @staticmethod
     def job_factory(
-        num_post_selections, num_pixels, num_shots, xmin, xmax, ymin, ymax, add_measurements
+        num_post_selections,
+        num_pixels,
+        num_shots,
+        xmin,
+        xmax,
+        ymin,
+        ymax,
+        add_measurements,
+        template=False,
     ):
         xs = np.linspace(xmin, xmax, num_pixels + 1)
         xs = 0.5 * (xs[:-1] + xs[1:])
@@ -20,10 +33,10 @@ class IBMSchroedingerMicroscopeJob(IBMJob):
         for (i, x), (j, y) in it.product(enumerate(xs), enumerate(ys)):
             z = x + 1j * y
             yield IBMSchroedingerMicroscopeJob(
-                num_post_selections, z, add_measurements, i, j, num_shots
+                num_post_selections, z, add_measurements, i, j, num_shots, template
             )
 
-    def __init__(self, num_post_selections, z, add_measurements, i, j, num_shots):
+    def __init__(self, num_post_selections, z, add_measurements, i, j, num_shots, template=False):
         super().__init__()
 
         self.num_post_selections = num_post_selections
@@ -32,11 +45,31 @@ class IBMSchroedingerMicroscopeJob(IBMJob):
         self.i = i
         self.j = j
         self.num_shots = num_shots
+        self.template = template
+
+    def parameters_for_pixel(self):
+        z = self.z
 
         # Calculate some parameters
         theta = 2 * np.arccos(abs(z) / np.sqrt(1 + abs(z) ** 2))
         phi = np.angle(z)
 
+        return {"theta": theta, "phi": phi}
+
+    @staticmethod
+    @functools.lru_cache()
+    def template_circuit(num_post_selections, add_measurements):
+        """
+        circuit with a qiskit Parameter in place of every pixel-dependent angle;
+        it is built and transpiled once, and every pixel only binds its values
+        """
+        parameters = {name: Parameter(name) for name in ["theta", "phi"]}
+        return IBMSchroedingerMicroscopeJob.make_circuit(
+            num_post_selections, add_measurements, **parameters
+        )
+
+    @staticmethod
+    def make_circuit(num_post_selections, add_measurements, theta, phi):
         # Build the circuit
         circuit = (
             QuantumCircuit(2 ** num_post_selections, 2 ** num_post_selections)
@@ -57,11 +90,22 @@ class IBMSchroedingerMicroscopeJob(IBMJob):
                 list(range(2 ** num_post_selections)), list(range(2 ** num_post_selections))
             )
 
-        # store the resulting circuit
-        self.circuit = circuit
+        return circuit
+
+    def build_circuit(self):
+        if self.template:
+            return self.template_circuit(self.num_post_selections, self.add_measurements)
+
+        return self.make_circuit(
+            self.num_post_selections, self.add_measurements, **self.parameters_for_pixel()
+        )
 
     def run(self, device):
         super().run(device)
+        if self.template:
+            return device.execute(
+                self.circuit, num_shots=self.num_shots, parameters=self.parameters_for_pixel()
+            )
         return device.execute(self.circuit, num_shots=self.num_shots)
 
     def __str__(self):
@@ -0,0 +1,2 @@
+from .benchmark import NumpySchroedingerMicroscopeBenchmark as Benchmark
+from .benchmark import NumpySchroedingerMicroscopeSimulatedBenchmark as SimulatedBenchmark
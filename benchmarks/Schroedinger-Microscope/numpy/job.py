@@ -0,0 +1,101 @@
+import itertools as it
+import functools
+from functools import reduce
+
+import numpy as np
+
+from libbench.numpy import Job as NumpyJob, Circuit, Parameter
+
+
+class NumpySchroedingerMicroscopeJob(NumpyJob):
+    @staticmethod
+    def job_factory(
+        num_post_selections,
+        num_pixels,
+        num_shots,
+        xmin,
+        xmax,
+        ymin,
+        ymax,
+        add_measurements,
+        template=False,
+    ):
+        xs = np.linspace(xmin, xmax, num_pixels + 1)
+        xs = 0.5 * (xs[:-1] + xs[1:])
+        ys = np.linspace(ymin, ymax, num_pixels + 1)
+        ys = 0.5 * (ys[:-1] + ys[1:])
+
+        for (i, x), (j, y) in it.product(enumerate(xs), enumerate(ys)):
+            z = x + 1j * y
+            yield NumpySchroedingerMicroscopeJob(
+                num_post_selections, z, add_measurements, i, j, num_shots, template
+            )
+
+    def __init__(self, num_post_selections, z, add_measurements, i, j, num_shots, template=False):
+        super().__init__()
+
+        self.num_post_selections = num_post_selections
+        self.add_measurements = add_measurements
+        self.z = z
+        self.i = i
+        self.j = j
+        self.num_shots = num_shots
+        self.template = template
+
+    def parameters_for_pixel(self):
+        z = self.z
+
+        # Calculate some parameters
+        theta = 2 * np.arccos(abs(z) / np.sqrt(1 + abs(z) ** 2))
+        phi = np.angle(z)
+
+        return {"theta": theta, "phi": phi}
+
+    @staticmethod
+    @functools.lru_cache()
+    def template_circuit(num_post_selections, add_measurements):
+        """
+        circuit with a numpy Parameter in place of every pixel-dependent angle;
+        it is built once, and every batch of pixels is simulated in a single pass
+        """
+        parameters = {name: Parameter(name) for name in ["theta", "phi"]}
+        return NumpySchroedingerMicroscopeJob.make_circuit(
+            num_post_selections, add_measurements, **parameters
+        )
+
+    @staticmethod
+    def make_circuit(num_post_selections, add_measurements, theta, phi):
+        # Build the circuit
+        circuit = Circuit(2 ** num_post_selections)
+        for k in range(2 ** num_post_selections):
+            circuit.ry(theta, k)
+            circuit.rz(-phi, k)
+        for k in range(num_post_selections):
+            for l in range(0, 2 ** num_post_selections, 2 ** (k + 1)):
+                circuit.cx(l, l + 2 ** k)
+                circuit.s(l)
+                circuit.h(l)
+                circuit.s(l)
+        if add_measurements:
+            circuit.measure(range(2 ** num_post_selections))
+
+        return circuit
+
+    def build_circuit(self):
+        if self.template:
+            return self.template_circuit(self.num_post_selections, self.add_measurements)
+
+        return self.make_circuit(
+            self.num_post_selections, self.add_measurements, **self.parameters_for_pixel()
+        )
+
+    def run(self, device):
+        super().run(device)
+        if self.template:
+            return device.execute(
+                self.circuit, num_shots=self.num_shots, parameters=self.parameters_for_pixel()
+            )
+        return device.execute(self.circuit, num_shots=self.num_shots)
+
+    def __str__(self):
+        return f"NumpySchroedingerMicroscopeJob-{self.i}-{self.j}"
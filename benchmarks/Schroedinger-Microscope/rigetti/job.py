@@ -1,4 +1,5 @@
 import itertools as it
+import functools
 from functools import reduce
 from typing import Union
 
@@ -10,8 +11,11 @@ from libbench.rigetti import Job as RigettiJob
 
 
 class RigettiSchroedingerMicroscopeJob(RigettiJob):
+    # jobs pickled before templates existed build their own program
+    template = False
+
     @staticmethod
-    def job_factory(num_post_selections, num_pixels, xmin, xmax, ymin, ymax, shots):
+    def job_factory(num_post_selections, num_pixels, xmin, xmax, ymin, ymax, shots, template=False):
         xs = np.linspace(xmin, xmax, num_pixels + 1)
         xs = 0.5 * (xs[:-1] + xs[1:])
         ys = np.linspace(ymin, ymax, num_pixels + 1)
@@ -19,9 +23,9 @@ class RigettiSchroedingerMicroscopeJob(RigettiJob):
 
         for (i, x), (j, y) in it.product(enumerate(xs), enumerate(ys)):
             z = x + 1j * y
-            yield RigettiSchroedingerMicroscopeJob(num_post_selections, z, i, j, shots)
+            yield RigettiSchroedingerMicroscopeJob(num_post_selections, z, i, j, shots, template)
 
-    def __init__(self, num_post_selections, z, i, j, shots):
+    def __init__(self, num_post_selections, z, i, j, shots, template=False):
         super().__init__()
 
         self.num_post_selections = num_post_selections
@@ -29,13 +33,32 @@ class RigettiSchroedingerMicroscopeJob(RigettiJob):
         self.i = i
         self.j = j
         self.shots = shots
+        self.template = template
+
+    def parameters_for_pixel(self):
+        z = self.z
 
         # Calculate some parameters
         theta = 2 * np.arccos(abs(z) / np.sqrt(1 + abs(z) ** 2))
         phi = np.angle(z)
 
+        return {"theta": theta, "phi": phi}
+
+    @staticmethod
+    @functools.lru_cache()
+    def template_program(num_post_selections):
+        """
+        program with a declared memory region in place of every pixel-dependent angle;
+        every pixel only writes its values into the regions
+        """
         program = pq.Program()
+        parameters = {name: program.declare(name, "REAL") for name in ["theta", "phi"]}
+        return RigettiSchroedingerMicroscopeJob.make_program(
+            num_post_selections, program, **parameters
+        )
 
+    @staticmethod
+    def make_program(num_post_selections, program, theta, phi):
         qubits = 2 ** num_post_selections
 
         for k in range(qubits):
@@ -49,11 +72,22 @@ class RigettiSchroedingerMicroscopeJob(RigettiJob):
                 program += pq.gates.H(l)
                 program += pq.gates.S(l)
 
-        # store the resulting circuit
-        self.program = program
+        return program
+
+    def build_circuit(self):
+        if self.template:
+            return self.template_program(self.num_post_selections)
+
+        return self.make_program(
+            self.num_post_selections, pq.Program(), **self.parameters_for_pixel()
+        )
 
     def run(self, device):
         super().run(device)
+        if self.template:
+            return device.execute(
+                self.program, num_shots=self.shots, parameters=self.parameters_for_pixel()
+            )
         return device.execute(self.program, num_shots=self.shots)
 
     def __str__(self):
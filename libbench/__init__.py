@@ -2,6 +2,7 @@
 # that would require the user to always have all backends installed
 
 from .link import VendorLink, VendorJob, ThinPromise
-from .benchmark import VendorBenchmark
+from .benchmark import VendorBenchmark, ResultIndex
+from .histogram import Histogram
 from .jobmanager import VendorJobManager
 from .lib import *
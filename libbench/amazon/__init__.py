@@ -4,3 +4,4 @@ from .link import AmazonCloudLink as CloudLink
 from .link import AmazonMeasureLocalLink as MeasureLocalLink
 from .link import AmazonStatevectorLink as StatevectorLink
 from .link import AmazonJob as Job
+from .link import histogram
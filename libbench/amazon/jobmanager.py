@@ -5,6 +5,9 @@ from libbench import VendorJobManager
 class AmazonJobManager(VendorJobManager):
     VENDOR = 'Amazon'
 
+    # cloud tasks are polled with one round trip each
+    POLLING_WORKERS = 8
+
     def job_alive(self, promise, meta: dict):
         """
         Check whether the job is alive.
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from libbench.histogram import Histogram
 from libbench.lib import print_hl
 from libbench.link import VendorLink, VendorJob
 
@@ -8,6 +9,13 @@ import braket, braket.circuits, braket.devices, braket.aws
 import functools
 
 
+def histogram(result) -> Histogram:
+    """
+    histogram of a braket result; bitstrings list the measured qubits in order
+    """
+    return Histogram.from_dict(result.measurement_counts, result.measured_qubits)
+
+
 class AmazonDevice(ABC):
     @abstractmethod
     def execute(self, circuit: braket.circuits.Circuit, num_shots: int):
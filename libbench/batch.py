@@ -0,0 +1,176 @@
+import hashlib
+import itertools as it
+from typing import List, Optional, Tuple
+
+
+class BatchPromise:
+    """
+    Promise for a single experiment within a batch that has been submitted as one vendor job.
+    The wrapped promise is shared by all jobs in the batch.
+    If identical circuits of several jobs have been merged into one experiment,
+    shots is the (start, stop) range of this job's shots within the experiment.
+    """
+
+    def __init__(self, promise, index: int, shots: Optional[Tuple[int, int]] = None):
+        self.promise = promise
+        self.index = index
+        self.shots = shots
+
+
+class BatchRecorder:
+    """
+    Stands in for a device while the jobs of a batch are run; instead of submitting
+    each circuit, the arguments to execute are recorded. All other attributes are
+    forwarded to the actual device, so that jobs can still query device information.
+    """
+
+    def __init__(self, device):
+        self._device = device
+        self.requests = []
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def execute(self, circuit, **kwargs):
+        self.requests.append({"circuit": circuit, **kwargs})
+
+
+def supports_batches(device) -> bool:
+    return hasattr(device, "execute_batch")
+
+
+def unwrap_promise(promise):
+    """
+    return the vendor promise behind a batch promise
+    """
+    return promise.promise if isinstance(promise, BatchPromise) else promise
+
+
+def record_requests(jobs: list, device) -> List[dict]:
+    """
+    run all jobs on a recorder, and return the request each of them makes to the device
+    """
+    recorder = BatchRecorder(device)
+    for job in jobs:
+        job.run(recorder)
+    assert len(recorder.requests) == len(jobs), "every job has to execute exactly one circuit"
+
+    return recorder.requests
+
+
+def request_key(job, request: dict) -> str:
+    """
+    content hash of a job's request, disregarding the number of shots
+    """
+    options = sorted((k, repr(v)) for k, v in request.items() if not k in ["circuit", "num_shots"])
+    return hashlib.sha256((job.qasm() + repr(options)).encode()).hexdigest()
+
+
+def merge_requests(jobs: list, requests: List[dict], max_shots: Optional[int] = None) -> list:
+    """
+    group jobs with identical requests into entries ([job, ...], merged request, [shots, ...]),
+    where the merged request asks for the sum of all jobs' shots, at most max_shots, and for
+    per-shot memory such that the shots can be split among the jobs again
+    """
+    groups = {}
+    for job, request in zip(jobs, requests):
+        groups.setdefault(request_key(job, request), []).append((job, request))
+
+    entries = []
+    for group in groups.values():
+        chunk = []
+        for job, request in group:
+            if chunk and max_shots is not None:
+                if sum(_num_shots(r) for _, r in chunk) + _num_shots(request) > max_shots:
+                    entries.append(_merge_chunk(chunk))
+                    chunk = []
+            chunk.append((job, request))
+        entries.append(_merge_chunk(chunk))
+
+    return entries
+
+
+def _num_shots(request: dict) -> int:
+    return request.get("num_shots", 1024)
+
+
+def _merge_chunk(chunk: list) -> tuple:
+    jobs = [job for job, _ in chunk]
+    if len(chunk) == 1:
+        return jobs, chunk[0][1], None
+
+    shots = [_num_shots(request) for _, request in chunk]
+    request = {**chunk[0][1], "num_shots": sum(shots), "memory": True}
+    return jobs, request, shots
+
+
+def batch_key(device, request: dict):
+    """
+    requests can only share a vendor job if the device assigns them the same key, e.g. for the
+    same number of shots; devices without a batch_key method batch any requests together
+    """
+    key = getattr(device, "batch_key", None)
+    return None if key is None else key(request)
+
+
+def split_units(entries: list, batch_size: int, device) -> list:
+    """
+    split entries ([job, ...], request, [shots, ...]) into units of at most batch_size entries.
+    Entries whose request is known are grouped by their batch key first, such that every unit
+    can be submitted as one vendor job; e.g. merged entries can differ in their summed shots
+    """
+    groups = {}
+    for entry in entries:
+        key = ("recorded", batch_key(device, entry[1])) if entry[1] is not None else ("lazy",)
+        groups.setdefault(key, []).append(entry)
+
+    return [
+        group[i : i + batch_size]
+        for group in groups.values()
+        for i in range(0, len(group), batch_size)
+    ]
+
+
+def run_batch(entries: list, device) -> List[dict]:
+    """
+    run entries ([job, ...], request, [shots, ...]) on the device; entries without request are
+    recorded first. Requests that share a batch key run as a single vendor job, so a unit whose
+    recorded requests differ in e.g. their number of shots is run as several vendor jobs.
+    Returns one response per job, in the same format as job.run
+    """
+    missing = [jobs[0] for jobs, request, _ in entries if request is None]
+    recorded = iter(record_requests(missing, device))
+    requests = [next(recorded) if request is None else request for _, request, _ in entries]
+
+    groups = {}
+    for index, request in enumerate(requests):
+        groups.setdefault(batch_key(device, request), []).append(index)
+
+    submitted = [None] * len(entries)  # (promise, index within the vendor job, transpiled circuit)
+    for indices in groups.values():
+        # results are split by index, which requires the result of a batch even for one request
+        if supports_batches(device):
+            response = device.execute_batch([requests[i] for i in indices])
+            promise, transpiled_circuits = response["result"], response["transpiled_circuits"]
+        else:
+            assert len(indices) == 1, "the device does not support batches"
+            response = device.execute(**requests[indices[0]])
+            promise, transpiled_circuits = response["result"], [response["transpiled_circuit"]]
+
+        for index, (i, transpiled) in enumerate(zip(indices, transpiled_circuits)):
+            submitted[i] = promise, index, transpiled
+
+    responses = []
+    for (jobs, _, shots), (promise, index, transpiled) in zip(entries, submitted):
+        # merged jobs each obtain their own range of shots
+        ranges = [None] * len(jobs)
+        if shots is not None:
+            stops = list(it.accumulate(shots))
+            ranges = [(stop - n, stop) for n, stop in zip(shots, stops)]
+
+        for shot_range in ranges:
+            responses.append(
+                {"result": BatchPromise(promise, index, shot_range), "transpiled_circuit": transpiled}
+            )
+
+    return responses
@@ -4,6 +4,45 @@ from typing import List, Dict
 
 from .link import VendorJob
 
+_MISSING = object()
+
+class ResultIndex(dict):
+    """
+    Results keyed by job, as passed to collate_results.
+    Jobs can in addition be looked up by their parameters, e.g.
+    results.lookup(repetition=0, pauli_string=("X", "Z")); for every combination of parameter
+    names, an index is built on first use, so that lookups take constant time.
+    """
+
+    def __init__(self, results: Dict[VendorJob, object]):
+        super().__init__(results)
+        self._indices = {}  # parameter names: {parameter values: job}
+
+    def _index(self, names: tuple) -> dict:
+        if not names in self._indices:
+            index = {}
+            for job in self:
+                values = tuple(getattr(job, name, _MISSING) for name in names)
+                if not any(value is _MISSING for value in values):
+                    index.setdefault(values, job)
+            self._indices[names] = index
+
+        return self._indices[names]
+
+    def lookup_job(self, **parameters) -> VendorJob:
+        """
+        return the first job with the given parameter values, or None if there is none
+        """
+        names = tuple(sorted(parameters))
+        return self._index(names).get(tuple(parameters[name] for name in names))
+
+    def lookup(self, **parameters):
+        """
+        return the result of the first job with the given parameter values, or None if there is none
+        """
+        job = self.lookup_job(**parameters)
+        return None if job is None else self[job]
+
 
 class VendorBenchmark(ABC):
     """
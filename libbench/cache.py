@@ -0,0 +1,70 @@
+import hashlib, os, pickle, tempfile
+
+from .lib import print_stderr
+
+
+class DiskCache:
+    """
+    Persistent key-value store with one pickle file per entry, kept in FOLDER/namespace/version.
+    Keys are obtained by hashing arbitrary parts with a stable repr, see DiskCache.key; bump the
+    version of a namespace whenever the way its entries are computed changes.
+    """
+
+    # the cache folder next to libbench, independent of the working directory
+    FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+    def __init__(self, namespace: str, version: int = 1):
+        self.namespace = namespace
+        self.version = version
+
+    @staticmethod
+    def key(*parts) -> str:
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(
+            self.FOLDER, self.namespace, f"v{self.version}", key[:2], f"{key}.pickle"
+        )
+
+    def get(self, key: str, default=None):
+        """
+        entries that cannot be loaded, e.g. pickles of classes that changed since, are misses
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return default
+        except Exception as e:
+            print_stderr(f"ignoring unreadable cache entry {self._path(key)}: {e}")
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def set(self, key: str, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # write atomically, such that concurrent readers never see partial entries; every writer,
+        # be it another process or another submission thread, gets a temporary file of its own
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class MemoryCache(dict):
+    """
+    In-process counterpart of DiskCache, for entries that must not outlive the process
+    """
+
+    key = staticmethod(DiskCache.key)
+
+    def set(self, key: str, value):
+        self[key] = value
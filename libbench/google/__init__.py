@@ -4,3 +4,4 @@ from .link import GoogleCloudLink as CloudLink
 from .link import GoogleMeasureLocalLink as MeasureLocalLink
 from .link import GoogleStatevectorLink as StatevectorLink
 from .link import GoogleJob as Job
+from .link import histogram
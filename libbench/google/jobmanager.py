@@ -3,7 +3,10 @@ from libbench import VendorJobManager
 
 class GoogleJobManager(VendorJobManager):
     VENDOR = 'Google'
-    
+
+    # local simulators run a whole batch with a single simulator, as parameter sweeps where possible
+    BATCH_SIZE = 1024
+
     def job_alive(self, promise, meta: dict):
         """
         Check whether the job is alive.
@@ -23,6 +26,21 @@ class GoogleJobManager(VendorJobManager):
         """
         return promise.result()
 
+    def split_result(self, result, index: int, shots=None):
+        """
+        extract the result of a single request from the list of results of a batch;
+        for jobs merged with others, only the job's range of repetitions is kept
+        """
+        result = result[index]
+        if shots is None or not hasattr(result, "repetitions"):
+            return result
+
+        start, stop = shots
+        return type(result)(
+            params=result.params,
+            measurements={key: value[start:stop] for key, value in result.measurements.items()},
+        )
+
     def freeze_promise(self, promise):
         """
         Freeze a promise.
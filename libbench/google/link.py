@@ -1,11 +1,32 @@
 from abc import ABC, abstractmethod
+from libbench.histogram import Histogram
 from libbench.lib import print_hl
 from libbench.link import VendorLink, VendorJob
 from .promise import GoogleCloudPromise
 from .promise import GoogleMeasureLocalPromise
 from .promise import GoogleStatevectorPromise
+from .promise import GoogleMeasureLocalBatchPromise
+from .promise import GoogleStatevectorBatchPromise
 import cirq
 import functools
+import numpy as np
+
+
+def resolve_parameters(circuit: cirq.Circuit, parameters: dict = None) -> cirq.Circuit:
+    """
+    resolve the sympy symbols of a template circuit by name
+    """
+    if parameters is None:
+        return circuit
+    return cirq.resolve_parameters(circuit, cirq.ParamResolver(parameters))
+
+
+def histogram(result, keys: list, qubits: list = None) -> Histogram:
+    """
+    histogram of the measurements with the given keys of a cirq result, concatenated in this order
+    """
+    bits = np.hstack([result.measurements[key] for key in keys])
+    return Histogram.from_bits(bits, qubits)
 
 
 class GoogleDevice(ABC):
@@ -14,29 +35,61 @@ class GoogleDevice(ABC):
         pass
 
 
-class SparseSimulatorMeasureLocal(GoogleDevice):
+class GoogleSimulatorBase(GoogleDevice):
+    """
+    Local simulators reuse a single cirq simulator for all jobs; batches of requests are run
+    with one call per parameter sweep, see promise.group_sweeps
+    """
+
+    MAX_BATCH_SIZE = 1024
+
+    def __init__(self):
+        self.simulator = cirq.Simulator()
+
+    @property
+    def max_batch_size(self):
+        return self.MAX_BATCH_SIZE
+
+
+class SparseSimulatorMeasureLocal(GoogleSimulatorBase):
     def __init__(self):
+        super().__init__()
         self.name = "sparse_simulator_measure_local"
 
-    def execute(self, circuit, num_shots: int):
+    def execute(self, circuit, num_shots: int, parameters: dict = None):
+        circuit = resolve_parameters(circuit, parameters)
         return {
-            "result": GoogleMeasureLocalPromise(circuit, cirq.Simulator(), num_shots=num_shots),
+            "result": GoogleMeasureLocalPromise(circuit, self.simulator, num_shots=num_shots),
             "transpiled_circuit": None,
         }
 
+    def execute_batch(self, requests: list):
+        return {
+            "result": GoogleMeasureLocalBatchPromise(requests, self.simulator),
+            "transpiled_circuits": [None] * len(requests),
+        }
+
 
-class SparseSimulatorStatevector(GoogleDevice):
+class SparseSimulatorStatevector(GoogleSimulatorBase):
     def __init__(self):
+        super().__init__()
         self.name = "sparse_simulator_statevector"
 
-    def execute(self, circuit, num_shots: int, **kwargs):
+    def execute(self, circuit, num_shots: int, parameters: dict = None, **kwargs):
+        circuit = resolve_parameters(circuit, parameters)
         return {
             "result": GoogleStatevectorPromise(
-                circuit, cirq.Simulator(), num_shots=num_shots, **kwargs
+                circuit, self.simulator, num_shots=num_shots, **kwargs
             ),
             "transpiled_circuit": None,
         }
 
+    def execute_batch(self, requests: list):
+        return {
+            "result": GoogleStatevectorBatchPromise(requests, self.simulator),
+            "transpiled_circuits": [None] * len(requests),
+        }
+
 
 GOOGLE_STATEVECTOR_DEVICES = {
     "sparse_simulator_statevector": SparseSimulatorStatevector()
@@ -92,15 +92,93 @@ class GoogleMeasureLocalPromise(GoogleLocalPromise):
         return self._result
 
 
+# options of a request that only concern sampling, which the statevector simulators ignore
+SAMPLING_OPTIONS = ["num_shots", "memory"]
+
+
+def simulate_options(options: dict) -> dict:
+    """
+    the options of a request that are passed on to the simulator, e.g. qubit_order
+    """
+    return {k: v for k, v in options.items() if not k in SAMPLING_OPTIONS}
+
+
 class GoogleStatevectorPromise(GoogleLocalPromise):
-    def __init__(self, *args, num_shots: int, **kwargs):
-        self.kwargs = {}
-        if "qubit_order" in kwargs:
-            self.kwargs["qubit_order"] = kwargs["qubit_order"]
-            del kwargs["qubit_order"]
-        super().__init__(*args, **kwargs)
+    def __init__(self, circuit: cirq.Circuit, device, **kwargs):
+        super().__init__(circuit, device)
+        self.kwargs = simulate_options(kwargs)
 
     def result(self):
         if self._result is None:
             self._result = self.device.simulate(self.circuit, **self.kwargs)
         return self._result
+
+
+def group_sweeps(requests: list) -> list:
+    """
+    group requests (dicts with circuit, num_shots and further options, see GoogleDevice.execute)
+    into sweeps: requests with identical circuits and options that only differ in their parameters
+    become a single sweep (circuit, options, [resolver, ...], [request index, ...])
+    """
+    sweeps = {}
+    reprs = {}  # id(circuit): repr(circuit); template jobs share a single circuit object
+    for index, request in enumerate(requests):
+        circuit = request["circuit"]
+        options = {k: v for k, v in request.items() if not k in ["circuit", "parameters"]}
+        resolver = cirq.ParamResolver(request.get("parameters") or {})
+
+        if not id(circuit) in reprs:
+            reprs[id(circuit)] = repr(circuit)
+        key = reprs[id(circuit)], repr(sorted(options.items()))
+
+        if not key in sweeps:
+            sweeps[key] = (circuit, options, [], [])
+        sweeps[key][2].append(resolver)
+        sweeps[key][3].append(index)
+
+    return list(sweeps.values())
+
+
+class GoogleBatchPromiseBase(GoogleLocalPromise):
+    """
+    Runs the circuits of several requests with a single simulator, grouped into parameter sweeps;
+    the result is the list of results, one per request.
+    """
+
+    def __init__(self, requests: list, device):
+        super().__init__(None, device)
+        self.sweeps = group_sweeps(requests)
+        self.num_requests = len(requests)
+
+    @abstractmethod
+    def run_sweeps(self) -> list:
+        """
+        return one list of results per sweep
+        """
+        pass
+
+    def result(self):
+        if self._result is None:
+            results = [None] * self.num_requests
+            for (*_, indices), sweep_results in zip(self.sweeps, self.run_sweeps()):
+                for index, result in zip(indices, sweep_results):
+                    results[index] = result
+            self._result = results
+        return self._result
+
+
+class GoogleMeasureLocalBatchPromise(GoogleBatchPromiseBase):
+    def run_sweeps(self):
+        return self.device.run_batch(
+            [circuit for circuit, *_ in self.sweeps],
+            params_list=[resolvers for _, _, resolvers, _ in self.sweeps],
+            repetitions=[options["num_shots"] for _, options, *_ in self.sweeps],
+        )
+
+
+class GoogleStatevectorBatchPromise(GoogleBatchPromiseBase):
+    def run_sweeps(self):
+        return [
+            self.device.simulate_sweep(circuit, params=resolvers, **simulate_options(options))
+            for circuit, options, resolvers, _ in self.sweeps
+        ]
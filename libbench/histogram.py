@@ -0,0 +1,132 @@
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+class Histogram:
+    """
+    Dense histogram of the measurement outcomes of n qubits, as produced by every vendor link.
+
+    counts[i] is the number of shots with outcome i. The bits of i are ordered as qubits, with
+    qubits[0] the most significant bit; i.e. the usual bitstring key of an outcome, with one
+    character per qubit in the order of qubits, is f"{i:0{n}b}". Qubits can be any hashable labels,
+    e.g. qubit or classical bit indices.
+    """
+
+    def __init__(self, counts: np.ndarray, qubits: Optional[Iterable] = None):
+        self.counts = np.asarray(counts, dtype=np.int64)
+        n = int(np.log2(len(self.counts)))
+        assert len(self.counts) == 2 ** n, "histogram has to have one entry per outcome"
+
+        self.qubits = tuple(range(n)) if qubits is None else tuple(qubits)
+        assert len(self.qubits) == n, "histogram has to have one label per qubit"
+
+    @staticmethod
+    def from_bits(bits: np.ndarray, qubits: Optional[Iterable] = None) -> "Histogram":
+        """
+        histogram of an array of measured bits with one row per shot, and one column per qubit
+        """
+        bits = np.asarray(bits, dtype=np.int64).reshape(len(bits), -1)
+        n = bits.shape[1]
+        outcomes = bits @ (1 << np.arange(n - 1, -1, -1, dtype=np.int64))
+        return Histogram(np.bincount(outcomes, minlength=2 ** n), qubits)
+
+    @staticmethod
+    def from_dict(counts: Dict[str, int], qubits: Optional[Iterable] = None) -> "Histogram":
+        """
+        histogram from a dict bitstring: count; spaces separating registers are ignored
+        """
+        keys = [key.replace(" ", "") for key in counts]
+        n = len(qubits) if qubits is not None else len(keys[0]) if keys else 0
+        dense = np.zeros(2 ** n, dtype=np.int64)
+        for key, count in zip(keys, counts.values()):
+            dense[int(key, 2)] += count
+        return Histogram(dense, qubits)
+
+    @staticmethod
+    def from_hex_counts(counts: Dict[str, int], qubits: Iterable) -> "Histogram":
+        """
+        histogram from a dict of hexadecimal outcomes, e.g. {"0x1": 5}, as returned by IBM backends
+        """
+        qubits = tuple(qubits)
+        dense = np.zeros(2 ** len(qubits), dtype=np.int64)
+        for key, count in counts.items():
+            dense[int(key, 16)] += count
+        return Histogram(dense, qubits)
+
+    @property
+    def num_qubits(self) -> int:
+        return len(self.qubits)
+
+    @property
+    def num_shots(self) -> int:
+        return int(self.counts.sum())
+
+    def probabilities(self) -> np.ndarray:
+        num_shots = self.num_shots
+        return self.counts / num_shots if num_shots > 0 else np.zeros(len(self.counts))
+
+    def tensor(self) -> np.ndarray:
+        """
+        counts as an array with one axis of length 2 per qubit, in the order of qubits
+        """
+        return self.counts.reshape((2,) * self.num_qubits)
+
+    def marginal(self, qubits: Iterable) -> "Histogram":
+        """
+        histogram of a subset of the qubits, in the given order; all other qubits are summed over
+        """
+        qubits = tuple(qubits)
+        axes = [self.qubits.index(q) for q in qubits]
+        others = tuple(a for a in range(self.num_qubits) if not a in axes)
+        tensor = self.tensor().sum(axis=others) if others else self.tensor()
+
+        # after summing, the remaining axes are in their original relative order
+        remaining = sorted(axes)
+        tensor = np.transpose(tensor, [remaining.index(a) for a in axes])
+        return Histogram(tensor.reshape(-1), qubits)
+
+    def bit_reversed(self) -> "Histogram":
+        """
+        the same histogram with the order of qubits reversed, i.e. outcome indices bit-reversed
+        """
+        return self.marginal(self.qubits[::-1])
+
+    def index(self, outcome: Dict[object, int]) -> int:
+        """
+        index of the outcome with the given bits for some qubits, and 0 for all others
+        """
+        return sum(bit << (self.num_qubits - 1 - self.qubits.index(q)) for q, bit in outcome.items())
+
+    def key(self, index: int) -> str:
+        return f"{index:0{self.num_qubits}b}"
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        dict bitstring: count of all outcomes that occurred
+        """
+        return {self.key(i): int(self.counts[i]) for i in np.flatnonzero(self.counts)}
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Histogram)
+            and self.qubits == other.qubits
+            and np.array_equal(self.counts, other.counts)
+        )
+
+    def __repr__(self):
+        return f"Histogram({self.to_dict()}, qubits={self.qubits})"
+
+
+def probabilities(result, num_qubits: int) -> np.ndarray:
+    """
+    dense outcome probabilities of a parsed result, which is either a Histogram, or a
+    dict bitstring: probability, as returned by statevector parsers and by runs before histograms
+    """
+    if isinstance(result, Histogram):
+        return result.probabilities()
+
+    dense = np.zeros(2 ** num_qubits)
+    for key, p in result.items():
+        dense[int(key, 2)] = p
+    return dense
@@ -4,4 +4,5 @@ from .link import IBMMeasureLocalLink as MeasureLocalLink
 from .link import IBMStatevectorLink as StatevectorLink
 from .link import IBMJob as Job
 from .link import IBMThinPromise
+from .link import histogram
 from .jobmanager import IBMJobManager as JobManager
@@ -1,7 +1,7 @@
 from libbench import VendorJobManager, print_stderr
 from .benchmark import IBMBenchmark
 
-from .link import IBMDevice
+from .link import IBMDevice, split_qiskit_result
 
 from qiskit.providers import JobStatus
 from qiskit.exceptions import QiskitError
@@ -27,6 +27,9 @@ class IBMJobManager(VendorJobManager):
     # maximum time for a job to be considered a failure
     MAX_JOB_AGE = datetime.timedelta(minutes=60*24*2)
 
+    # every poll is a round trip to the cloud backend, so we poll concurrently
+    POLLING_WORKERS = 16
+
     def job_alive(self, promise, meta: dict):
         """
         check whether we consider the job behind the promise alive on an IBM backend; however we should also check whether job_id is successful
@@ -51,6 +54,7 @@ class IBMJobManager(VendorJobManager):
         # it could e.g. be a network issue. We let that error propagate
         status = promise.status()
         print(f"The job with IBM ID {id} is reported to be in status: {status}")
+        meta["queued"] = status == JobStatus.QUEUED
 
         if status in [JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.DONE]:
             return True
@@ -80,6 +84,12 @@ class IBMJobManager(VendorJobManager):
         finally:
             return False
 
+    def job_waiting(self, promise, meta: dict):
+        """
+        check whether the job is still queued on the IBM backend; job_alive records the status
+        """
+        return meta.get("queued", False)
+
     def queued_successfully(self, promise, meta: dict):
         """
         check whether we consider the job behind the promise queued, or more than queued, on an IBM backend;
@@ -119,6 +129,12 @@ class IBMJobManager(VendorJobManager):
             print_stderr(e)
             return None
 
+    def split_result(self, result, index: int, shots=None):
+        """
+        extract the result of a single experiment from the result of a batched job
+        """
+        return split_qiskit_result(result, index, shots)
+
     def gate_statistics(self):
         """
         Get statistics of gate fidelities
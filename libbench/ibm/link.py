@@ -1,21 +1,267 @@
 from abc import abstractmethod
+from libbench.cache import DiskCache
+from libbench.histogram import Histogram
 from libbench.lib import print_hl
 from libbench.link import VendorJob, VendorLink, ThinPromise
-import functools
+import copy, functools
+from collections import Counter
 from qiskit.providers import JobStatus
 import qiskit
 from typing import Union, Tuple, List, Dict
 from libbench import print_stderr
 from qiskit.exceptions import QiskitError
+from qiskit.result import Result
+from qiskit.result.models import ExperimentResultData
 
 IBM_KNOWN_STATEVECTOR_DEVICES = ["statevector_simulator"]
 
 IBM_KNOWN_MEASURE_LOCAL_DEVICES = ["qasm_simulator"]
 
+TRANSPILE_CACHE = DiskCache("transpile")
+
+
+def histogram(result, experiment: int = 0) -> Histogram:
+    """
+    histogram of the classical bits measured in an experiment of a qiskit result; as in qiskit's
+    bitstrings, the last classical bit is the most significant one
+    """
+    num_bits = result.results[experiment].header.memory_slots
+    return Histogram.from_hex_counts(result.data(experiment)["counts"], range(num_bits - 1, -1, -1))
+
+
+def split_qiskit_result(result, index: int, shots=None):
+    """
+    extract the result of a single experiment from the qiskit result of a batched job;
+    for jobs merged with others, the counts are recomputed from the job's range of shots.
+
+    Only the experiment itself is copied, not the whole batch, as this is called once per experiment
+    """
+    experiment = result.results[index]
+    memory = getattr(experiment.data, "memory", None)
+    if shots is not None and memory is not None:
+        start, stop = shots
+        memory = memory[start:stop]
+        experiment = copy.copy(experiment)
+        experiment.data = ExperimentResultData(counts=dict(Counter(memory)), memory=memory)
+        experiment.shots = stop - start
+
+    return Result(
+        backend_name=result.backend_name,
+        backend_version=result.backend_version,
+        qobj_id=result.qobj_id,
+        job_id=result.job_id,
+        success=result.success,
+        results=[experiment],
+        date=getattr(result, "date", None),
+        status=getattr(result, "status", None),
+        header=getattr(result, "header", None),
+    )
+
+
+def bind_parameters(circuit: qiskit.QuantumCircuit, parameters: dict) -> qiskit.QuantumCircuit:
+    """
+    bind the parameters of a (transpiled) template circuit by name
+    """
+    return circuit.bind_parameters({p: parameters[p.name] for p in circuit.parameters})
+
+
+def transpile_backend(target: dict) -> tuple:
+    """
+    everything about the backend that transpiled circuits depend on, see IBMDevice.transpile_target
+    """
+    return (
+        target["name"],
+        target["coupling_map"],
+        target["basis_gates"],
+        target["properties"],
+        target["qiskit"],
+    )
+
+
+def transpile_key(target: dict, circuit, initial_layout, optimization_level) -> str:
+    return TRANSPILE_CACHE.key(
+        transpile_backend(target), initial_layout, optimization_level, circuit.qasm()
+    )
+
+
+@functools.lru_cache()
+def backend_properties(key: str):
+    """
+    calibration data of a backend, stored once by transpile_target, and loaded once per process
+    """
+    return None if key is None else TRANSPILE_CACHE.get(key)
+
+
+def _transpile_at_level(target: dict, circuits: list, layouts: list, level: int) -> list:
+    return qiskit.compiler.transpile(
+        circuits,
+        initial_layout=None if all(l is None for l in layouts) else layouts,
+        optimization_level=level,
+        coupling_map=target["coupling_map"],
+        basis_gates=target["basis_gates"],
+        backend_properties=backend_properties(target["properties"]),
+    )
+
+
+def _transpile_lowering_level(target: dict, circuit, layout, level: int) -> tuple:
+    """
+    transpile a single circuit, lowering the optimization level until the transpiler succeeds;
+    returns the transpiled circuit and the level used
+    """
+    while True:
+        try:
+            return _transpile_at_level(target, [circuit], [layout], level)[0], level
+        except qiskit.transpiler.exceptions.TranspilerError:
+            if level == 0:
+                raise
+            print_stderr("transpiler error. Lowering optimization level")
+            level -= 1
+
+
+def transpile(target: dict, circuits, initial_layout, optimization_level):
+    """
+    transpile a circuit, or a list of circuits with a list of initial layouts, for the backend
+    described by target, see IBMDevice.transpile_target.
+    Transpiled circuits are cached on disk per backend configuration, calibration and qiskit
+    version; and for every circuit family, we remember the optimization level that succeeded,
+    so failing levels are skipped.
+    This is a module-level function, such that it can run in worker processes
+    """
+    single = not isinstance(circuits, list)
+    if single:
+        circuits, initial_layout = [circuits], [initial_layout]
+    elif initial_layout is None:
+        initial_layout = [None] * len(circuits)
+
+    backend = transpile_backend(target)
+    keys = [
+        transpile_key(target, circuit, layout, optimization_level)
+        for circuit, layout in zip(circuits, initial_layout)
+    ]
+    families = [
+        TRANSPILE_CACHE.key(
+            backend, layout, optimization_level, circuit.num_qubits, sorted(circuit.count_ops())
+        )
+        for circuit, layout in zip(circuits, initial_layout)
+    ]
+    experiments = [TRANSPILE_CACHE.get(key) for key in keys]
+
+    # transpile the remaining circuits, grouped by the level to start at; identical circuits,
+    # e.g. a template shared by many jobs, are only transpiled once
+    levels = {}
+    first = {}
+    for i, experiment in enumerate(experiments):
+        if experiment is None and not keys[i] in first:
+            first[keys[i]] = i
+            levels.setdefault(TRANSPILE_CACHE.get(families[i], optimization_level), []).append(i)
+
+    for level, indices in levels.items():
+        try:
+            transpiled = _transpile_at_level(
+                target, [circuits[i] for i in indices], [initial_layout[i] for i in indices], level
+            )
+            transpiled = [(experiment, level) for experiment in transpiled]
+        except qiskit.transpiler.exceptions.TranspilerError:
+            # retry one circuit at a time, such that only the failing ones lower their level
+            transpiled = [
+                _transpile_lowering_level(target, circuits[i], initial_layout[i], level)
+                for i in indices
+            ]
+
+        for i, (experiment, used_level) in zip(indices, transpiled):
+            experiments[i] = experiment
+            TRANSPILE_CACHE.set(keys[i], experiment)
+            TRANSPILE_CACHE.set(families[i], used_level)
+
+    for i, key in enumerate(keys):
+        if experiments[i] is None:
+            experiments[i] = experiments[first[key]]
+
+    return experiments[0] if single else experiments
+
 
 class IBMDevice:
     def __init__(self, device):
         self.device = device
+        self._preparing = set()  # transpile cache keys handed out for preparation
+
+    @property
+    def max_batch_size(self):
+        """
+        maximum number of experiments the backend accepts within a single job
+        """
+        return getattr(self.device.configuration(), "max_experiments", None) or 1
+
+    @property
+    def max_shots(self):
+        return getattr(self.device.configuration(), "max_shots", None)
+
+    def batch_key(self, request: dict) -> tuple:
+        """
+        experiments of a qobj share their number of shots, and we transpile them together
+        """
+        return request.get("num_shots", 1024), request.get("optimization_level", 3)
+
+    def transpile_target(self) -> dict:
+        """
+        small picklable description of the backend, as needed for transpilation; the calibration
+        data is stored in the transpile cache once, and referred to by a key that changes with
+        every recalibration
+        """
+        cfg = self.device.configuration()
+        properties = self.device.properties()
+        target = {
+            "name": self.device.name(),
+            "coupling_map": cfg.coupling_map,
+            "basis_gates": cfg.basis_gates,
+            "properties": None,
+            "qiskit": qiskit.__version__,
+        }
+        if properties is not None:
+            target["properties"] = TRANSPILE_CACHE.key(
+                "properties", target["name"], str(properties.last_update_date), target["qiskit"]
+            )
+            if not target["properties"] in TRANSPILE_CACHE:
+                TRANSPILE_CACHE.set(target["properties"], properties)
+
+        return target
+
+    def _transpile(self, circuits, initial_layout, optimization_level):
+        return transpile(self.transpile_target(), circuits, initial_layout, optimization_level)
+
+    def preparation(self, requests: list) -> list:
+        """
+        tasks that transpile the requested circuits into the transpile cache, one per circuit,
+        to be run ahead of submission, see libbench.pipeline. Circuits that are cached or already
+        being prepared, e.g. the template shared by many jobs, are skipped
+        """
+        target = self.transpile_target()
+        tasks = []
+        for request in requests:
+            args = (
+                request["circuit"],
+                request.get("initial_layout"),
+                request.get("optimization_level", 3),
+            )
+            key = transpile_key(target, *args)
+            if key in self._preparing or key in TRANSPILE_CACHE:
+                continue
+            self._preparing.add(key)
+            tasks.append((transpile, (target, *args)))
+
+        return tasks
+
+    def _run(self, qobj):
+        try:
+            return self.device.run(qobj)
+        except QiskitError as e:
+            message = e.message.rstrip("\n .")
+            message = e.message.rstrip(".'")
+            if message.endswith("Error code: 3458"):
+                print_stderr("You don't have enough credits to run this job.")
+                return None
+
+            raise
 
     def execute(
         self,
@@ -23,38 +269,62 @@ class IBMDevice:
         num_shots=1024,
         initial_layout=None,
         optimization_level=3,
+        memory=False,
+        parameters: dict = None,
     ):
-        while optimization_level >= 0:
-            try:
-                experiment = qiskit.compiler.transpile(
-                    circuit,
-                    initial_layout=initial_layout,
-                    optimization_level=optimization_level,
-                    backend=self.device,
-                )
-                break
-            except qiskit.transpiler.exceptions.TranspilerError as e:
-                print_stderr("transpiler error. Lowering optimization level")
-                optimization_level -= 1
-                if optimization_level < 0:
-                    raise e
+        experiment = self._transpile(circuit, initial_layout, optimization_level)
+        if parameters is not None:
+            experiment = bind_parameters(experiment, parameters)
 
         print_hl(circuit, color="white")
         print_hl(experiment, color="white")
         qobj = qiskit.compiler.assemble(
-            experiment, shots=num_shots, max_credits=15, backend=self.device
+            experiment, shots=num_shots, memory=memory, max_credits=15, backend=self.device
         )
 
-        try:
-            return {"result": self.device.run(qobj), "transpiled_circuit": experiment}
-        except QiskitError as e:
-            message = e.message.rstrip("\n .")
-            message = e.message.rstrip(".'")
-            if message.endswith("Error code: 3458"):
-                print_stderr("You don't have enough credits to run this job.")
-                return {"result": ThinPromise(lambda: None), "transpiled_circuit": None}
+        promise = self._run(qobj)
+        if promise is None:
+            return {"result": ThinPromise(lambda: None), "transpiled_circuit": None}
+        return {"result": promise, "transpiled_circuit": experiment}
+
+    def execute_batch(self, requests: list):
+        """
+        transpile all requested circuits and assemble them as experiments of a single qobj,
+        which is run as one job; all requests have to share their batch_key, which
+        libbench.batch.run_batch ensures by splitting other batches into several jobs
+        """
+        num_shots = {request.get("num_shots", 1024) for request in requests}
+        optimization_level = {request.get("optimization_level", 3) for request in requests}
+        assert (
+            len(num_shots) == 1 and len(optimization_level) == 1
+        ), "experiments in a batch have to share num_shots and optimization_level"
+
+        circuits = [request["circuit"] for request in requests]
+        initial_layout = [request.get("initial_layout") for request in requests]
+        if all(layout is None for layout in initial_layout):
+            initial_layout = None
+
+        experiments = self._transpile(circuits, initial_layout, optimization_level.pop())
+        experiments = [
+            experiment
+            if request.get("parameters") is None
+            else bind_parameters(experiment, request["parameters"])
+            for experiment, request in zip(experiments, requests)
+        ]
+
+        print_hl(f"batch of {len(experiments)} experiments transpiled.", color="white")
+        qobj = qiskit.compiler.assemble(
+            experiments,
+            shots=num_shots.pop(),
+            memory=any(request.get("memory", False) for request in requests),
+            max_credits=15,
+            backend=self.device,
+        )
 
-            raise
+        promise = self._run(qobj)
+        if promise is None:
+            return {"result": ThinPromise(lambda: None), "transpiled_circuits": [None] * len(requests)}
+        return {"result": promise, "transpiled_circuits": experiments}
 
 
 class IBMJob(VendorJob):
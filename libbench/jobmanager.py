@@ -1,29 +1,53 @@
-import pickle, os
+import itertools as it
+import copy, json, pickle, os, time
 from pathlib import Path
 from abc import ABC, abstractmethod
 from typing import Optional, Callable
 
-from .benchmark import VendorBenchmark
-from .lib import benchmark_id, print_hl, print_stderr
+from .batch import (
+    BatchPromise,
+    merge_requests,
+    record_requests,
+    run_batch,
+    split_units,
+    supports_batches,
+    unwrap_promise,
+)
+from .benchmark import ResultIndex, VendorBenchmark
+from .lib import benchmark_id, parallel_map, print_hl, print_stderr
+from .pipeline import CircuitPipeline
+from .store import ResultStore
 
 
 class VendorJobManager(ABC):
     RUN_FOLDER = "./runs"
     JOBMANAGER_FILENAME = "jobmanager.pickle"
+    JOURNAL_FILENAME = "jobmanager.journal"
+    MANIFEST_FILENAME = "manifest.json"
     COLLATED_FILENAME = "collated.pickle"
     VISUALIZED_FILENAME = "visualized.pickle"
-    JOBS_FOLDER = "jobs"
     MAX_FAILURE_COUNT = 1
     MAX_QUEUE_COUNT = 10 ** 6
+    SUBMISSION_WORKERS = 1  # number of jobs submitted concurrently; 1 submits sequentially
+    POLLING_WORKERS = 1  # number of queued promises polled concurrently
+    MIN_POLLING_INTERVAL = 60  # seconds; backoff for jobs waiting in a queue starts here
+    MAX_POLLING_INTERVAL = 60 * 60  # and doubles up to this limit
+    BATCH_SIZE = 1  # number of jobs submitted as a single vendor job, if the device supports it
+    DEDUPLICATE = False  # merge jobs with identical circuits into one experiment with summed shots
+    PREPARATION_WORKERS = 1  # processes preparing circuits ahead of submission; 1 prepares in-process
+    SNAPSHOT_INTERVAL = 50  # journal records after which the journal is compacted into a snapshot
 
     def __init__(self, benchmark: VendorBenchmark):
         self.benchmark = benchmark
-        self.scheduled = benchmark.get_jobs()
+        self.jobs = list(benchmark.get_jobs())  # the journal refers to jobs by their index in here
+        self.scheduled = list(self.jobs)
         self.ID = self.VENDOR + "-" + str(benchmark) + "--" + benchmark_id()
 
         self.queued = {}  # job: promise
         self.results = {}  # job: result
 
+        self._init_journal()
+
     def update(
         self,
         device,
@@ -33,61 +57,108 @@ class VendorJobManager(ABC):
         store_jobmanager=True,
         store_additional_info=True,
         display_status=True,
+        submission_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        deduplicate: Optional[bool] = None,
+        preparation_workers: Optional[int] = None,
     ) -> Optional[object]:
         # try to queue more jobs
-        new_scheduled = []
-        failure_counter = 0
-
-        for job in self.scheduled:
-            if failure_counter >= self.MAX_FAILURE_COUNT or len(self.queued) > self.MAX_QUEUE_COUNT:
-                new_scheduled.append(job)
-                continue
-
-            # try to obtain result
-            response = job.run(device)
-            promise = response["result"]
-            job.transpiled_circuit = response["transpiled_circuit"]
+        scheduled = list(self.scheduled)
+
+        # circuits are built and prepared for submission on a pool of worker processes,
+        # concurrently with the submission of the units already prepared
+        preparation_workers = preparation_workers or self.PREPARATION_WORKERS
+        pipeline = None
+        if preparation_workers > 1 and len(scheduled) > 1:
+            pipeline = CircuitPipeline(device, preparation_workers)
+
+        try:
+            self.scheduled = self._submit(
+                device,
+                scheduled,
+                pipeline,
+                submission_workers,
+                batch_size,
+                deduplicate,
+                store_job_and_results,
+            )
+        finally:
+            if pipeline is not None:
+                pipeline.close()
+
+        # try to obtain more results; every vendor promise that is due for polling is checked
+        # once, concurrently, and the outcome is shared among all jobs of a batch
+        def poll(job):
+            promise = unwrap_promise(self.queued[job])
+            result = self.try_get_results(promise, device)
+            if result is not None:
+                return result, True
+            return None, self.job_alive(promise, job.meta)
 
-            if self.queued_successfully(promise, job.meta):
-                print(f"{str(job)} successfully queued.")
-                self.queued[job] = promise
-                failure_counter = 0
-            else:
-                print(f"Could not queue {str(job)}.")
-                new_scheduled.append(job)
-                failure_counter += 1
+        now = time.time()
+        representatives = {}
+        for job in self.queued:
+            representatives.setdefault(id(unwrap_promise(self.queued[job])), job)
+        due = [job for job in representatives.values() if self._poll_due(job, now)]
+
+        # the meta of jobs that keep waiting is only journaled if polling changed it
+        due_promises = {id(unwrap_promise(self.queued[job])) for job in due}
+        metas = {
+            job: copy.deepcopy(job.meta)
+            for job in self.queued
+            if id(unwrap_promise(self.queued[job])) in due_promises
+        }
 
-        self.scheduled = new_scheduled
+        polled = {}
+        for job, (result, alive) in zip(due, parallel_map(poll, due, self.POLLING_WORKERS)):
+            polled[id(unwrap_promise(self.queued[job]))] = (result, alive)
+            if result is None and alive:
+                self._schedule_next_poll(job, unwrap_promise(self.queued[job]), now)
 
-        # try to obtain more results
         new_queued = {}
         for job in self.queued:
             promise = self.queued[job]
 
+            # 0. jobs backing off are not polled in this round
+            if not id(unwrap_promise(promise)) in polled:
+                new_queued[job] = promise
+                continue
+
             # 1. we try to get the result
-            result = self.try_get_results(promise, device)
+            result, alive = polled[id(unwrap_promise(promise))]
             if result is not None:
+                self._changed.add(job)
+                if isinstance(promise, BatchPromise):
+                    result = self.split_result(result, promise.index, promise.shots)
+
                 print(f"{job} completed.")
                 self.results[job] = self.benchmark.parse_result(job, result)
 
                 # store job results separately in addition
                 if store_job_and_results:
-                    self._save_in_run_folder(f"jobs/{str(job)}.raw-result.pickle", result)
-                    self._save_in_run_folder(f"jobs/{str(job)}.pickle", self.results[job])
-                    self._save_in_run_folder(f"jobs/{str(job)}.circuit.pickle", job.serialize())
-                    self._save_in_run_folder(f"jobs/{str(job)}.circuit.qasm", job.qasm(), pickle_dump = False)
+                    # the circuit has been stored on submission already
+                    self.result_store.add(
+                        self._job_indices[job], job, self.results[job], raw_result=result
+                    )
 
             # 2. if that failed, check whether job is alive and if not reschedule
-            elif not self.job_alive(promise, job.meta):
+            elif not alive:
+                self._changed.add(job)
+                job.meta = {key: value for key, value in job.meta.items() if key != "next-poll"}
                 self.scheduled = [job] + self.scheduled
                 print(f"The job {job} has been rescheduled")
 
             # 3. otherwise the job simply wasn't done, put back to queue
             else:
                 new_queued[job] = promise
+                if job.meta != metas[job]:
+                    self._waiting.add(job)
 
         self.queued = new_queued
 
+        if store_job_and_results:
+            self.result_store.commit()
+
         # store jobmanager for reuse
         if store_jobmanager:
             self.save(additional_stored_info)
@@ -106,8 +177,139 @@ class VendorJobManager(ABC):
         self.print_status()
         return False
 
+    def _submit(
+        self,
+        device,
+        scheduled,
+        pipeline,
+        submission_workers,
+        batch_size,
+        deduplicate,
+        store_circuits=True,
+    ):
+        """
+        submit scheduled jobs, and return the ones that could not be queued.
+        Jobs with identical circuits are optionally merged into a single entry that runs with their
+        summed shots; a submission unit is either a single entry, or a batch of entries that is
+        submitted as a single vendor job. The circuits of queued jobs go into the result store
+        before they are released, so they need not be rebuilt once the results are in
+        """
+        batch_size = batch_size or self.BATCH_SIZE
+        batch_size = min(batch_size, device.max_batch_size) if supports_batches(device) else 1
+        submission_workers = submission_workers or self.SUBMISSION_WORKERS
+        deduplicate = self.DEDUPLICATE if deduplicate is None else deduplicate
+
+        if deduplicate and len(scheduled) > 1:
+            if pipeline is not None:
+                pipeline.build(scheduled)
+                pipeline.wait_built(scheduled)
+            entries = merge_requests(
+                scheduled, record_requests(scheduled, device), getattr(device, "max_shots", None)
+            )
+        else:
+            entries = [([job], None, None) for job in scheduled]
+        units = split_units(entries, batch_size, device)
+        new_scheduled = []
+        failure_counter = 0
+
+        if pipeline is not None:
+            pipeline.prepare(units)
+
+        def submit(unit):
+            """
+            submit a unit, and return (jobs, responses, queued successfully) per vendor job
+            """
+            if pipeline is not None:
+                pipeline.ready(unit)
+
+            jobs = [job for entry in unit for job in entry[0]]
+            if len(jobs) == 1 and unit[0][1] is None:
+                responses = [jobs[0].run(device)]
+            else:
+                responses = run_batch(unit, device)
+
+            # jobs within a batch share a vendor job, hence also its polling state
+            vendor_jobs = {}
+            for job, response in zip(jobs, responses):
+                promise = unwrap_promise(response["result"])
+                _, shared_jobs, shared_responses = vendor_jobs.setdefault(
+                    id(promise), (promise, [], [])
+                )
+                shared_jobs.append(job)
+                shared_responses.append(response)
+
+            submitted = []
+            for promise, shared_jobs, shared_responses in vendor_jobs.values():
+                for job in shared_jobs[1:]:
+                    job.meta = shared_jobs[0].meta
+                queued_successfully = self.queued_successfully(promise, shared_jobs[0].meta)
+                submitted.append((shared_jobs, shared_responses, queued_successfully))
+            return submitted
+
+        position = 0
+        while position < len(units):
+            if failure_counter >= self.MAX_FAILURE_COUNT or len(self.queued) > self.MAX_QUEUE_COUNT:
+                for unit in units[position:]:
+                    for entry in unit:
+                        for job in entry[0]:
+                            job.release_circuit()
+                            new_scheduled.append(job)
+                break
+
+            # submit the next window of units concurrently; the window never exceeds the queue limit,
+            # and the failure counter is checked in between windows, which for a single worker is
+            # the same as checking it in between units
+            window_size = min(submission_workers, self.MAX_QUEUE_COUNT + 1 - len(self.queued))
+            window = units[position : position + window_size]
+            position += len(window)
+
+            submitted = parallel_map(submit, window, submission_workers)
+            for jobs, responses, queued_successfully in it.chain.from_iterable(submitted):
+                for job, response in zip(jobs, responses):
+                    self._changed.add(job)
+                    job.transpiled_circuit = response["transpiled_circuit"]
+
+                    if queued_successfully:
+                        print(f"{str(job)} successfully queued.")
+                        self.queued[job] = response["result"]
+                        if store_circuits:
+                            self.result_store.add_circuit(
+                                self._job_indices[job], job.serialize(), job.qasm()
+                            )
+                    else:
+                        print(f"Could not queue {str(job)}.")
+                        new_scheduled.append(job)
+
+                    # circuits are rebuilt on demand, e.g. on resubmission
+                    job.release_circuit()
+
+                failure_counter = 0 if queued_successfully else failure_counter + 1
+
+        return new_scheduled
+
+    @property
+    def result_store(self) -> ResultStore:
+        if getattr(self, "_result_store", None) is None:
+            os.makedirs(f"{self.RUN_FOLDER}/{self.ID}", exist_ok=True)
+            self._result_store = ResultStore(f"{self.RUN_FOLDER}/{self.ID}/{ResultStore.FILENAME}")
+        return self._result_store
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_result_store", None)
+        return state
+
     def collate_results(self):
-        return self.benchmark.collate_results(self.results)
+        """
+        collate from the result store if it holds all results, which does not require the actual jobs;
+        otherwise, e.g. for runs that did not store their results, from the results in memory
+        """
+        results = self.results
+        if os.path.exists(f"{self.RUN_FOLDER}/{self.ID}/{ResultStore.FILENAME}"):
+            if len(self.result_store) == len(self.results):
+                results = self.result_store.results()
+
+        return self.benchmark.collate_results(ResultIndex(results))
 
     def visualize_results(self, collated_result):
         path = Path(self.RUN_FOLDER) / self.ID
@@ -152,15 +354,21 @@ class VendorJobManager(ABC):
         print(".")
 
     def print_status(self, tail: str = ""):
-        status = self.status()
+        self.print_manifest_status(
+            {"ID": self.ID, "status": self.status(), "parameters": repr(self.benchmark)}, tail
+        )
+
+    @staticmethod
+    def print_manifest_status(manifest: dict, tail: str = ""):
+        status = manifest["status"]
 
-        print(self.ID, end=": ")
+        print(manifest["ID"], end=": ")
         print_hl(str(status["scheduled"]), color="red", end=" ")
         print_hl(str(status["queued"]), color="yellow", end=" ")
         print_hl(str(status["completed"]), color="green")
         if tail:
             print("  ", tail)
-            print("  ", str(repr(self.benchmark)))
+            print("  ", manifest["parameters"])
 
     def status(self):
         return {
@@ -175,20 +383,195 @@ class VendorJobManager(ABC):
         return status["scheduled"] == 0 and status["queued"] == 0
 
     def save(self, additional_stored_info):
+        """
+        append the state of all jobs that changed since the last save to the journal;
+        every SNAPSHOT_INTERVAL records, and once the benchmark is done, the journal is
+        compacted into a snapshot of the entire jobmanager
+        """
+        if self._journal_length is None or self._journal_length >= self.SNAPSHOT_INTERVAL or self.done:
+            self._save_snapshot(additional_stored_info)
+        else:
+            self._append_to_journal()
+
+        self.save_manifest(additional_stored_info)
+
+    def save_manifest(self, additional_stored_info):
+        """
+        small json summary of the run, which suffices to list runs and their status
+        """
+        manifest = {
+            "ID": self.ID,
+            "vendor": self.VENDOR,
+            "benchmark": str(self.benchmark),
+            "parameters": repr(self.benchmark),
+            "additional_stored_info": additional_stored_info,
+            "status": self.status(),
+            "done": self.done,
+            "updated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+        self._save_in_run_folder(
+            self.MANIFEST_FILENAME + ".tmp",
+            json.dumps(manifest, indent=4, default=str),
+            pickle_dump=False,
+        )
+        os.replace(
+            f"{self.RUN_FOLDER}/{self.ID}/{self.MANIFEST_FILENAME}.tmp",
+            f"{self.RUN_FOLDER}/{self.ID}/{self.MANIFEST_FILENAME}",
+        )
+
+    @classmethod
+    def load_manifest(clx, ID) -> Optional[dict]:
+        """
+        returns None for runs stored before there were manifests
+        """
+        path = f"{clx.RUN_FOLDER}/{ID}/{clx.MANIFEST_FILENAME}"
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _freeze_promises(self, queued: dict) -> dict:
+        # promises shared by a batch are frozen once
+        frozen = {}
+        frozen_queued = {}
+        for job, promise in queued.items():
+            vendor_promise = unwrap_promise(promise)
+            if not id(vendor_promise) in frozen:
+                frozen[id(vendor_promise)] = self.freeze_promise(vendor_promise)
+
+            frozen_queued[job] = (
+                BatchPromise(frozen[id(vendor_promise)], promise.index, promise.shots)
+                if isinstance(promise, BatchPromise)
+                else frozen[id(vendor_promise)]
+            )
+
+        return frozen_queued
+
+    def _save_snapshot(self, additional_stored_info):
         # freeze promise queue into something pickleable
-        old_queued = self.queued.copy()
+        old_queued = self.queued
+        self.queued = self._freeze_promises(self.queued)
 
-        for job in self.queued:
-            self.queued[job] = self.freeze_promise(self.queued[job])
+        # journal records of older generations are ignored, so a stale journal
+        # is harmless should we fail before truncating it below
+        self._generation += 1
+        self._changed = set()
+        self._waiting = set()
+        self._journal_length = 0
 
         self._save_in_run_folder(
-            self.JOBMANAGER_FILENAME,
+            self.JOBMANAGER_FILENAME + ".tmp",
             {"jobmanager": self, "additional_stored_info": additional_stored_info},
         )
+        os.replace(
+            f"{self.RUN_FOLDER}/{self.ID}/{self.JOBMANAGER_FILENAME}.tmp",
+            f"{self.RUN_FOLDER}/{self.ID}/{self.JOBMANAGER_FILENAME}",
+        )
+        self._save_in_run_folder(self.JOURNAL_FILENAME, "", pickle_dump=False)
 
         # restore queue
         self.queued = old_queued
 
+    def _append_to_journal(self):
+        if not self._changed and not self._waiting:
+            return
+
+        # all changes go into a single record, such that batches keep sharing their promise and meta
+        frozen_queued = self._freeze_promises(
+            {job: self.queued[job] for job in self._changed if job in self.queued}
+        )
+        changes = []
+        for job in self._changed:
+            change = {"job": self._job_indices[job], "meta": job.meta}
+            if job in self.results:
+                change.update({"state": "completed", "result": self.results[job]})
+            elif job in frozen_queued:
+                change.update(
+                    {
+                        "state": "queued",
+                        "promise": frozen_queued[job],
+                        "device_info": job.device_info,
+                        "transpiled_circuit": job.transpiled_circuit,
+                    }
+                )
+            else:
+                change.update({"state": "scheduled"})
+            changes.append(change)
+
+        # jobs that are still waiting in the vendor's queue only changed their meta, e.g. the
+        # polling backoff; their promise and circuit are in an earlier record or the snapshot
+        for job in self._waiting - self._changed:
+            changes.append({"job": self._job_indices[job], "meta": job.meta, "state": "waiting"})
+
+        with open(f"{self.RUN_FOLDER}/{self.ID}/{self.JOURNAL_FILENAME}", "ab") as f:
+            pickle.dump({"generation": self._generation, "changes": changes}, f)
+
+        self._changed = set()
+        self._waiting = set()
+        self._journal_length += 1
+
+    def _init_journal(self):
+        self._job_indices = {job: index for index, job in enumerate(self.jobs)}
+        self._changed = set()  # jobs whose state changed since the last save
+        self._waiting = set()  # queued jobs of which only the meta changed since the last save
+        self._generation = 0  # incremented with every snapshot
+        self._journal_length = None  # records since the last snapshot; None if there is none yet
+
+    def _replay_journal(self):
+        """
+        apply the journal records written since the last snapshot
+        """
+        self._journal_length = 0
+        path = f"{self.RUN_FOLDER}/{self.ID}/{self.JOURNAL_FILENAME}"
+        if not os.path.exists(path):
+            return
+
+        changes = {}
+        with open(path, "rb") as f:
+            while True:
+                try:
+                    record = pickle.load(f)
+                except EOFError:
+                    break
+                except pickle.UnpicklingError:
+                    print_stderr(f"ignoring truncated journal record in {path}")
+                    break
+
+                if record["generation"] != self._generation:
+                    continue
+
+                self._journal_length += 1
+                for change in record["changes"]:
+                    if change["state"] == "waiting" and change["job"] in changes:
+                        changes[change["job"]] = {**changes[change["job"]], "meta": change["meta"]}
+                    else:
+                        changes[change["job"]] = change
+
+        for index, change in changes.items():
+            job = self.jobs[index]
+            job.meta = change["meta"]
+            if change["state"] == "waiting":
+                continue
+
+            self.queued.pop(job, None)
+            self.results.pop(job, None)
+
+            if change["state"] == "queued":
+                job.device_info = change["device_info"]
+                job.transpiled_circuit = change["transpiled_circuit"]
+                self.queued[job] = change["promise"]
+            elif change["state"] == "completed":
+                self.results[job] = change["result"]
+
+        self.scheduled = [
+            job
+            for job in self.scheduled
+            if not self._job_indices[job] in changes
+            or changes[self._job_indices[job]]["state"] == "waiting"
+        ] + [self.jobs[index] for index in sorted(changes) if changes[index]["state"] == "scheduled"]
+
     def save_additional_info_files(self, additional_stored_info):
         for key, what in additional_stored_info.items():
             self._save_in_run_folder(f"{what}.{key}")
@@ -208,10 +591,22 @@ class VendorJobManager(ABC):
 
     @classmethod
     def load(clx, ID):
+        """
+        load the last snapshot, and replay the journal written since
+        """
         with open(f"{clx.RUN_FOLDER}/{ID}/{clx.JOBMANAGER_FILENAME}", "rb") as f:
             slug = pickle.load(f)
-            assert slug["jobmanager"].ID == ID, "instance ID does not match passed ID"
-            return slug
+            jobmanager = slug["jobmanager"]
+            assert jobmanager.ID == ID, "instance ID does not match passed ID"
+
+        # runs stored before there was a journal only consist of a snapshot
+        if not hasattr(jobmanager, "jobs"):
+            jobmanager.jobs = [*jobmanager.scheduled, *jobmanager.queued, *jobmanager.results]
+            jobmanager._init_journal()
+        jobmanager.__dict__.setdefault("_waiting", set())
+
+        jobmanager._replay_journal()
+        return slug
 
     def print_gate_statistics(self):
         assert self.done, "benchmark not done yet"
@@ -225,17 +620,62 @@ class VendorJobManager(ABC):
     def gate_statistics(self):
         pass
 
+    def _poll_due(self, job, now: float) -> bool:
+        return not "next-poll" in job.meta or job.meta["next-poll"]["time"] <= now
+
+    def _schedule_next_poll(self, job, promise, now: float):
+        """
+        back off exponentially while the job waits in the vendor's queue
+        """
+        if not self.job_waiting(promise, job.meta):
+            job.meta.pop("next-poll", None)
+            return
+
+        interval = (
+            min(2 * job.meta["next-poll"]["interval"], self.MAX_POLLING_INTERVAL)
+            if "next-poll" in job.meta
+            else self.MIN_POLLING_INTERVAL
+        )
+        job.meta["next-poll"] = {"interval": interval, "time": now + interval}
+
+    def job_waiting(self, promise, meta: dict) -> bool:
+        """
+        check whether the job behind the promise, which job_alive reported alive, is still waiting
+        in the vendor's queue; such jobs are polled with exponential backoff.
+        By default we poll every job on every update.
+        """
+        return False
+
     def thaw(self, device):
-        # thaw queued promises
+        # thaw queued promises; promises shared by a batch are thawed once
+        thawed = {}
         for job in list(self.queued):
-            thawed_promise = self.thaw_promise(self.queued[job], device)
+            promise = self.queued[job]
+            frozen_promise = unwrap_promise(promise)
+            if not id(frozen_promise) in thawed:
+                thawed[id(frozen_promise)] = self.thaw_promise(frozen_promise, device)
+
+            thawed_promise = thawed[id(frozen_promise)]
             if thawed_promise is None:
                 print_stderr(f"could not thaw job {job}; rescheduling")
                 self.scheduled.append(job)
+                self._changed.add(job)
                 del self.queued[job]
 
             else:
-                self.queued[job] = self.thaw_promise(self.queued[job], device)
+                self.queued[job] = (
+                    BatchPromise(thawed_promise, promise.index, promise.shots)
+                    if isinstance(promise, BatchPromise)
+                    else thawed_promise
+                )
+
+    def split_result(self, result, index: int, shots: Optional[tuple] = None):
+        """
+        extract the result of the experiment with the given index from the result of a batch
+        that has been submitted as a single vendor job; if shots is a (start, stop) range,
+        only these shots of the experiment belong to the job
+        """
+        raise NotImplementedError(f"{self.VENDOR} does not support batched jobs")
 
     @abstractmethod
     def queued_successfully(self, promise, meta: dict) -> bool:
@@ -1,4 +1,5 @@
 from termcolor import colored
+from concurrent.futures import ThreadPoolExecutor
 import os, binascii, time, sys
 
 
@@ -18,3 +19,16 @@ def print_stderr(*args):
 
 def is_power_of_2(num):
     return num != 0 and ((num & (num - 1)) == 0)
+
+
+def parallel_map(fn, items, max_workers=1):
+    """
+    apply fn to all items on a pool of at most max_workers threads;
+    results are returned in the order of items, and exceptions are re-raised
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Callable, Tuple, List, Union
 
+from .store import is_primitive
+
 
 class ThinPromise(ABC):
     """
@@ -38,6 +40,47 @@ class VendorJob(ABC):
         self.device_info = None
         self.transpiled_circuit = None
         self.meta = {}  # additional information that can be stored alongside job
+        self._circuit = None
+
+    def build_circuit(self):
+        """
+        build the job's circuit from its parameters.
+        Jobs implementing this are lightweight descriptors: the circuit is built on first access,
+        and dropped again with release_circuit, or when the job is pickled
+        """
+        return None
+
+    @property
+    def circuit(self):
+        if self._circuit is None:
+            self._circuit = self.build_circuit()
+        return self._circuit
+
+    @circuit.setter
+    def circuit(self, circuit):
+        self._circuit = circuit
+
+    def _builds_circuit(self) -> bool:
+        return type(self).build_circuit is not VendorJob.build_circuit
+
+    def release_circuit(self):
+        if self._builds_circuit():
+            self._circuit = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self._builds_circuit():
+            state["_circuit"] = None
+        return state
+
+    def __setstate__(self, state):
+        # jobs pickled before circuits were built on demand stored them as plain attributes
+        for key in ["program", "circuit"]:
+            if state.get(key) is not None:
+                state["_circuit"] = state[key]
+            state.pop(key, None)
+        state.setdefault("_circuit", None)
+        self.__dict__.update(state)
 
     @abstractmethod
     def run(self, device):
@@ -51,6 +94,17 @@ class VendorJob(ABC):
     def serialize(self):
         return {"device_info": None, "transpiled_circuit": self.transpiled_circuit}
 
+    def parameters(self) -> dict:
+        """
+        the job's attributes with primitive values, e.g. pixel coordinates or qubit indices;
+        these are kept in the result store, and suffice to collate results
+        """
+        return {
+            key: value
+            for key, value in vars(self).items()
+            if not key.startswith("_") and is_primitive(value)
+        }
+
 
 class VendorLink(ABC):
     """
@@ -0,0 +1,9 @@
+from .benchmark import NumpyBenchmark as Benchmark
+from .jobmanager import NumpyJobManager as JobManager
+from .link import NumpyCloudLink as CloudLink
+from .link import NumpyMeasureLocalLink as MeasureLocalLink
+from .link import NumpyStatevectorLink as StatevectorLink
+from .link import NumpyJob as Job
+from .link import histogram
+from .circuit import Circuit, Parameter
+from .simulator import simulate, simulate_tree
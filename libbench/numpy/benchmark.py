@@ -0,0 +1,5 @@
+from libbench.benchmark import VendorBenchmark
+
+
+class NumpyBenchmark(VendorBenchmark):
+    pass
@@ -0,0 +1,287 @@
+from typing import Dict, List, Iterable
+
+import numpy as np
+
+
+class Parameter:
+    """
+    Placeholder for an angle of a template circuit, resolved by name when the circuit is simulated.
+    Parameters can be scaled by a constant, e.g. -phi or 0.5 * theta
+    """
+
+    def __init__(self, name: str, scale: float = 1.0):
+        self.name = name
+        self.scale = scale
+
+    def resolve(self, parameters: Dict[str, np.ndarray]) -> np.ndarray:
+        assert self.name in parameters, f"no value given for parameter {self.name}"
+        return self.scale * parameters[self.name]
+
+    def __neg__(self):
+        return Parameter(self.name, -self.scale)
+
+    def __mul__(self, factor: float):
+        return Parameter(self.name, self.scale * factor)
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        return self.name if self.scale == 1.0 else f"{self.scale}*{self.name}"
+
+
+def _matrix(rows: list) -> np.ndarray:
+    """
+    stack the entries of a matrix, each of which is a scalar or an array of values for a batch of
+    parameters, into an array of shape (..., d, d)
+    """
+    entries = [np.asarray(entry, dtype=np.complex128) for row in rows for entry in row]
+    entries = np.broadcast_arrays(*entries)
+    return np.stack(entries, axis=-1).reshape(entries[0].shape + (len(rows), len(rows)))
+
+
+def controlled(matrix: np.ndarray) -> np.ndarray:
+    """
+    controlled version of a (batch of) single-qubit gate(s); the control is the first qubit
+    """
+    out = np.zeros(matrix.shape[:-2] + (4, 4), dtype=np.complex128)
+    out[..., 0, 0] = out[..., 1, 1] = 1
+    out[..., 2:, 2:] = matrix
+    return out
+
+
+def _rx(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return _matrix([[c, -1.0j * s], [-1.0j * s, c]])
+
+
+def _ry(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return _matrix([[c, -s], [s, c]])
+
+
+def _rz(phi):
+    return _matrix([[np.exp(-0.5j * phi), 0], [0, np.exp(0.5j * phi)]])
+
+
+def _u1(lam):
+    return _matrix([[1, 0], [0, np.exp(1.0j * lam)]])
+
+
+def _u3(theta, phi, lam):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return _matrix(
+        [
+            [c, -np.exp(1.0j * lam) * s],
+            [np.exp(1.0j * phi) * s, np.exp(1.0j * (phi + lam)) * c],
+        ]
+    )
+
+
+X = _matrix([[0, 1], [1, 0]])
+Y = _matrix([[0, -1.0j], [1.0j, 0]])
+Z = _matrix([[1, 0], [0, -1]])
+H = _matrix([[1, 1], [1, -1]]) / np.sqrt(2)
+S = _matrix([[1, 0], [0, 1.0j]])
+T = _matrix([[1, 0], [0, np.exp(0.25j * np.pi)]])
+SWAP = _matrix([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+SQSWAP = _matrix(
+    [
+        [1, 0, 0, 0],
+        [0, (1 + 1.0j) / 2, (1 - 1.0j) / 2, 0],
+        [0, (1 - 1.0j) / 2, (1 + 1.0j) / 2, 0],
+        [0, 0, 0, 1],
+    ]
+)
+
+# gate name: (number of qubits, matrix as function of the gate's parameters);
+# the first qubit a gate acts on is the most significant bit of the matrix index
+GATES = {
+    "x": (1, lambda: X),
+    "y": (1, lambda: Y),
+    "z": (1, lambda: Z),
+    "h": (1, lambda: H),
+    "s": (1, lambda: S),
+    "sdg": (1, lambda: S.conj()),
+    "t": (1, lambda: T),
+    "tdg": (1, lambda: T.conj()),
+    "rx": (1, _rx),
+    "ry": (1, _ry),
+    "rz": (1, _rz),
+    "u1": (1, _u1),
+    "u3": (1, _u3),
+    "cx": (2, lambda: controlled(X)),
+    "cz": (2, lambda: controlled(Z)),
+    "ch": (2, lambda: controlled(H)),
+    "crz": (2, lambda phi: controlled(_rz(phi))),
+    "cry": (2, lambda theta: controlled(_ry(theta))),
+    "cu3": (2, lambda theta, phi, lam: controlled(_u3(theta, phi, lam))),
+    "swap": (2, lambda: SWAP),
+    "sqswap": (2, lambda: SQSWAP),
+    "unitary": (None, lambda matrix: matrix),
+}
+
+
+class Gate:
+    def __init__(self, name: str, qubits: tuple, params: tuple = (), adjoint: bool = False):
+        self.name = name
+        self.qubits = qubits
+        self.params = params
+        self.adjoint = adjoint
+
+    def matrix(self, parameters: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        the gate's matrix, of shape (d, d), or (batch, d, d) if any of its parameters is batched
+        """
+        values = [p.resolve(parameters) if isinstance(p, Parameter) else p for p in self.params]
+        matrix = GATES[self.name][1](*values)
+        return np.conj(np.swapaxes(matrix, -1, -2)) if self.adjoint else matrix
+
+    def inverse(self) -> "Gate":
+        return Gate(self.name, self.qubits, self.params, not self.adjoint)
+
+    def __repr__(self):
+        params = ""
+        if self.name == "unitary":
+            # entries at full precision: the listing identifies the circuit when grouping requests
+            params = "(" + ",".join(repr(complex(v)) for v in np.ravel(self.params[0])) + ")"
+        elif self.params:
+            params = "(" + ",".join(repr(p) for p in self.params) + ")"
+        adjoint = "^dg" if self.adjoint else ""
+        qubits = ",".join(f"q[{q}]" for q in self.qubits)
+        return f"{self.name}{params}{adjoint} {qubits};"
+
+
+class Circuit:
+    """
+    Gate list of a circuit on num_qubits qubits, simulated by libbench.numpy.simulate.
+    Gates follow the qiskit conventions for their matrices, but qubit 0 is the most significant
+    bit of the statevector index, as in cirq
+    """
+
+    def __init__(self, num_qubits: int):
+        self.num_qubits = num_qubits
+        self.gates: List[Gate] = []
+        self.measured: List[int] = []  # measured qubits, in the order of the classical bits
+
+    def append(self, name: str, qubits: Iterable[int], params: tuple = ()) -> "Circuit":
+        qubits = tuple(qubits)
+        assert name in GATES, f"unknown gate {name}"
+        assert GATES[name][0] in [None, len(qubits)], f"{name} acts on {GATES[name][0]} qubits"
+        assert len(set(qubits)) == len(qubits), "gates act on distinct qubits"
+        assert all(0 <= q < self.num_qubits for q in qubits), "qubit out of range"
+        self.gates.append(Gate(name, qubits, tuple(params)))
+        return self
+
+    def x(self, q):
+        return self.append("x", [q])
+
+    def y(self, q):
+        return self.append("y", [q])
+
+    def z(self, q):
+        return self.append("z", [q])
+
+    def h(self, q):
+        return self.append("h", [q])
+
+    def s(self, q):
+        return self.append("s", [q])
+
+    def sdg(self, q):
+        return self.append("sdg", [q])
+
+    def t(self, q):
+        return self.append("t", [q])
+
+    def tdg(self, q):
+        return self.append("tdg", [q])
+
+    def rx(self, theta, q):
+        return self.append("rx", [q], [theta])
+
+    def ry(self, theta, q):
+        return self.append("ry", [q], [theta])
+
+    def rz(self, phi, q):
+        return self.append("rz", [q], [phi])
+
+    def u1(self, lam, q):
+        return self.append("u1", [q], [lam])
+
+    def u3(self, theta, phi, lam, q):
+        return self.append("u3", [q], [theta, phi, lam])
+
+    def cx(self, control, target):
+        return self.append("cx", [control, target])
+
+    def cz(self, control, target):
+        return self.append("cz", [control, target])
+
+    def ch(self, control, target):
+        return self.append("ch", [control, target])
+
+    def crz(self, phi, control, target):
+        return self.append("crz", [control, target], [phi])
+
+    def cry(self, theta, control, target):
+        return self.append("cry", [control, target], [theta])
+
+    def cu3(self, theta, phi, lam, control, target):
+        return self.append("cu3", [control, target], [theta, phi, lam])
+
+    def swap(self, q1, q2):
+        return self.append("swap", [q1, q2])
+
+    def sqswap(self, q1, q2):
+        return self.append("sqswap", [q1, q2])
+
+    def unitary(self, matrix, qubits):
+        matrix = np.asarray(matrix, dtype=np.complex128)
+        assert matrix.shape == (2 ** len(qubits),) * 2, "matrix does not match the qubits"
+        return self.append("unitary", qubits, [matrix])
+
+    def measure(self, qubits: Iterable[int]) -> "Circuit":
+        self.measured.extend(qubits)
+        return self
+
+    def compose(self, other: "Circuit", qubits: Iterable[int] = None) -> "Circuit":
+        """
+        append the gates of other, with its qubit i mapped to qubits[i]
+        """
+        qubits = list(range(other.num_qubits)) if qubits is None else list(qubits)
+        for gate in other.gates:
+            mapped = tuple(qubits[q] for q in gate.qubits)
+            self.gates.append(Gate(gate.name, mapped, gate.params, gate.adjoint))
+        return self
+
+    def inverse(self) -> "Circuit":
+        circuit = Circuit(self.num_qubits)
+        circuit.gates = [gate.inverse() for gate in reversed(self.gates)]
+        return circuit
+
+    @property
+    def parameters(self) -> List[str]:
+        return sorted(
+            {p.name for gate in self.gates for p in gate.params if isinstance(p, Parameter)}
+        )
+
+    def qasm(self) -> str:
+        """
+        qasm-like listing of the circuit; parameters appear by name.
+        Gates and measurements are only ever appended, so their counts identify the listing, which
+        we keep: batches of template jobs all ask for the listing of the same circuit
+        """
+        version = (len(self.gates), len(self.measured))
+        if getattr(self, "_qasm", (None, None))[0] == version:
+            return self._qasm[1]
+
+        lines = ["OPENQASM 2.0;", f"qreg q[{self.num_qubits}];"]
+        if self.measured:
+            lines.append(f"creg c[{len(self.measured)}];")
+        lines += [repr(gate) for gate in self.gates]
+        lines += [f"measure q[{q}] -> c[{c}];" for c, q in enumerate(self.measured)]
+        self._qasm = (version, "\n".join(lines))
+        return self._qasm[1]
+
+    def __repr__(self):
+        return self.qasm()
@@ -0,0 +1,59 @@
+from typing import Optional
+
+from libbench import VendorJobManager
+
+
+class NumpyJobManager(VendorJobManager):
+    VENDOR = "Numpy"
+
+    # a batch is simulated at once, with one simulation per distinct circuit;
+    # the template jobs of a whole pixel grid thus evolve in a single pass
+    BATCH_SIZE = 2 ** 16
+
+    def job_alive(self, promise, meta: dict):
+        """
+        Check whether the job is alive.
+        """
+        return promise.status() == "DONE"
+
+    def queued_successfully(self, promise, meta: dict):
+        """
+        Check whether the job is successfully queued.
+        """
+        return promise.status() == "DONE"
+
+    def try_get_results(self, promise, device):
+        """
+        Obtain job results when done; the simulators finish immediately.
+        """
+        return promise.result()
+
+    def split_result(self, result, index: int, shots: Optional[tuple] = None):
+        """
+        extract the result of a single request from the list of results of a batch;
+        for jobs merged with others, only the job's range of shots is kept
+        """
+        result = result[index]
+        if shots is None:
+            return result
+
+        start, stop = shots
+        return result[start:stop]
+
+    def freeze_promise(self, promise):
+        """
+        Freeze a promise.
+        """
+        return promise.freeze()
+
+    def thaw_promise(self, promise, _):
+        """
+        Thaw a promise.
+        """
+        return promise.thaw()
+
+    def gate_statistics(self):
+        """
+        Get statistics of gate fidelities
+        """
+        return {}
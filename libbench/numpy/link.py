@@ -0,0 +1,250 @@
+from abc import ABC, abstractmethod
+from typing import List
+import functools
+
+import numpy as np
+
+from libbench.histogram import Histogram
+from libbench.lib import print_hl
+from libbench.link import VendorLink, VendorJob, ThinPromise
+
+from .circuit import Circuit
+from .simulator import simulate, simulate_tree, measured_probabilities, sample, Measurements
+
+
+def histogram(result: Measurements) -> Histogram:
+    """
+    histogram of the measured qubits, with the first measured qubit as the most significant bit
+    """
+    return result.histogram()
+
+
+def group_requests(requests: List[dict]) -> List[List[int]]:
+    """
+    group the indices of requests for the same circuit; each group is simulated as a single batch,
+    with the parameters and initial basis states of its requests stacked
+    """
+    groups = {}
+    for index, request in enumerate(requests):
+        parameters = request.get("parameters") or {}
+        from_basis_state = request.get("basis_state") is not None
+        key = (request["circuit"].qasm(), tuple(sorted(parameters)), from_basis_state)
+        groups.setdefault(key, []).append(index)
+    return list(groups.values())
+
+
+class NumpyDevice(ABC):
+    """
+    Statevector simulation of a Circuit in numpy; results are available immediately.
+    Batches of requests are run with one simulation per distinct circuit, in which identical
+    requests are evolved once, and distinct circuits without parameters only simulate the gates
+    they do not share with one another.
+    A request can start from the computational basis state with index basis_state instead of
+    |0...0>, e.g. to evaluate a circuit on all inputs at once
+    """
+
+    # a whole pixel grid of template jobs fits into a single batch
+    MAX_BATCH_SIZE = 2 ** 16
+
+    # number of amplitudes simulated at once, i.e. states in a chunk times statevector dimension
+    MAX_AMPLITUDES = 2 ** 22
+
+    @property
+    def max_batch_size(self):
+        return self.MAX_BATCH_SIZE
+
+    @property
+    def info(self):
+        return None
+
+    @abstractmethod
+    def _results(self, circuit: Circuit, states: np.ndarray, requests: List[dict]) -> list:
+        """
+        one result per request, given the final states of the circuit for all requests
+        """
+        pass
+
+    def _run(self, requests: List[dict]) -> list:
+        results = [None] * len(requests)
+        groups = group_requests(requests)
+
+        # circuits without parameters, e.g. one per path through a tree of directions, share the
+        # states of their common gate prefixes; one tree per circuit size
+        trees = {}
+        for group in groups:
+            circuit = requests[group[0]]["circuit"]
+            if self._in_tree(requests[group[0]]):
+                trees.setdefault(circuit.num_qubits, []).append(group)
+
+        for tree in trees.values():
+            circuits = [requests[group[0]]["circuit"] for group in tree]
+            for i, state in simulate_tree(circuits):
+                states = np.broadcast_to(state, (len(tree[i]), len(state)))
+                self._store(results, tree[i], circuits[i], states, requests)
+
+        for group in groups:
+            circuit = requests[group[0]]["circuit"]
+            if self._in_tree(requests[group[0]]):
+                continue
+            names = requests[group[0]].get("parameters") or {}
+            from_basis_state = requests[group[0]].get("basis_state") is not None
+
+            # requests with the same parameters and basis state, e.g. repetitions of a job, end up
+            # in the same state, which we simulate once for all of them
+            duplicates = {}
+            for i in group:
+                key = (
+                    requests[i].get("basis_state"),
+                    tuple(requests[i]["parameters"][name] for name in names),
+                )
+                duplicates.setdefault(key, []).append(i)
+            distinct = [indices[0] for indices in duplicates.values()]
+            duplicates = {indices[0]: indices for indices in duplicates.values()}
+
+            # all states of a chunk are evolved at once, in a tensor of shape (chunk, 2^n)
+            chunk_size = max(1, self.MAX_AMPLITUDES >> circuit.num_qubits)
+            for start in range(0, len(distinct), chunk_size):
+                chunk = distinct[start : start + chunk_size]
+                parameters = {
+                    name: np.array([requests[i]["parameters"][name] for i in chunk])
+                    for name in names
+                }
+
+                initial_state = None
+                if from_basis_state:
+                    initial_state = np.zeros((len(chunk), 2 ** circuit.num_qubits))
+                    initial_state[
+                        np.arange(len(chunk)), [requests[i]["basis_state"] for i in chunk]
+                    ] = 1
+
+                states = simulate(circuit, parameters, initial_state)
+                if states.ndim == 1:
+                    states = np.broadcast_to(states, (len(chunk), len(states)))
+
+                counts = [len(duplicates[i]) for i in chunk]
+                if sum(counts) > len(chunk):
+                    states = np.repeat(states, counts, axis=0)
+                indices = [j for i in chunk for j in duplicates[i]]
+                self._store(results, indices, circuit, states, requests)
+
+        return results
+
+    @staticmethod
+    def _in_tree(request: dict) -> bool:
+        return not request["circuit"].parameters and request.get("basis_state") is None
+
+    def _store(self, results: list, indices: List[int], circuit: Circuit, states, requests):
+        chunk_results = self._results(circuit, states, [requests[i] for i in indices])
+        for i, result in zip(indices, chunk_results):
+            results[i] = result
+
+    def execute(
+        self,
+        circuit: Circuit,
+        num_shots: int = None,
+        parameters: dict = None,
+        basis_state: int = None,
+        **_,
+    ):
+        request = {
+            "circuit": circuit,
+            "num_shots": num_shots,
+            "parameters": parameters,
+            "basis_state": basis_state,
+        }
+        return {
+            "result": ThinPromise(lambda: self._run([request])[0]),
+            "transpiled_circuit": None,
+        }
+
+    def execute_batch(self, requests: List[dict]):
+        return {
+            "result": ThinPromise(self._run, requests),
+            "transpiled_circuits": [None] * len(requests),
+        }
+
+
+class NumpyStatevectorSimulator(NumpyDevice):
+    name = "statevector_simulator"
+
+    def _results(self, circuit, states, requests):
+        return [np.array(state) for state in states]
+
+
+class NumpyMeasureLocalSimulator(NumpyDevice):
+    """
+    Samples the measured qubits from the exact outcome distribution, i.e. without noise
+    """
+
+    name = "measure_local_simulator"
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def _results(self, circuit, states, requests):
+        probabilities = measured_probabilities(circuit, states)
+        return [
+            sample(circuit, p, request["num_shots"], self.rng)
+            for p, request in zip(probabilities, requests)
+        ]
+
+
+NUMPY_STATEVECTOR_DEVICES = {"statevector_simulator": NumpyStatevectorSimulator()}
+
+NUMPY_MEASURE_LOCAL_DEVICES = {"measure_local_simulator": NumpyMeasureLocalSimulator()}
+
+NUMPY_CLOUD_DEVICES = {}
+
+
+class NumpyJob(VendorJob):
+    def __init__(self):
+        super().__init__()
+        self.circuit = None
+        self.device_info = None
+
+    def serialize(self):
+        # the circuit is stored by its qasm listing already; pickling it as well would dominate
+        # the time it takes to store the results of a batch of template jobs
+        return super().serialize()
+
+    def run(self, device):
+        self.device_info = None
+
+    def qasm(self):
+        return self.circuit.qasm()
+
+
+class NumpyLinkBase(VendorLink):
+    def get_device_topology(self, name):
+        return None
+
+
+class NumpyCloudLink(NumpyLinkBase):
+    @functools.lru_cache()
+    def get_devices(self):
+        """
+        There is no cloud behind the numpy simulators.
+        """
+        return NUMPY_CLOUD_DEVICES
+
+
+class NumpyMeasureLocalLink(NumpyLinkBase):
+    def __init__(self):
+        super().__init__()
+
+        print_hl("numpy measure local backend loaded.")
+
+    @functools.lru_cache()
+    def get_devices(self):
+        return NUMPY_MEASURE_LOCAL_DEVICES
+
+
+class NumpyStatevectorLink(NumpyLinkBase):
+    def __init__(self):
+        super().__init__()
+
+        print_hl("numpy statevector simulator backend loaded.")
+
+    @functools.lru_cache()
+    def get_devices(self):
+        return NUMPY_STATEVECTOR_DEVICES
@@ -0,0 +1,155 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from libbench.histogram import Histogram
+
+from .circuit import Circuit
+
+
+def apply_gate(state: np.ndarray, matrix: np.ndarray, qubits: tuple) -> np.ndarray:
+    """
+    apply a gate to a batch of states of shape (batch, 2, ..., 2); the matrix has shape (d, d),
+    or (batch, d, d) for a different gate per state
+    """
+    k = len(qubits)
+    axes = [1 + q for q in qubits]
+    targets = list(range(-k, 0))
+
+    state = np.moveaxis(state, axes, targets)
+    shape = state.shape
+    if matrix.ndim == 2:
+        # the same gate for all states is a single product with all amplitudes of the batch
+        state = state.reshape(-1, 2 ** k) @ matrix.T
+    else:
+        state = state.reshape(shape[0], -1, 2 ** k) @ np.swapaxes(matrix, -1, -2)
+    return np.moveaxis(state.reshape(shape), targets, axes)
+
+
+def batch_size(parameters: Dict[str, np.ndarray], initial_state: Optional[np.ndarray]):
+    """
+    common length of all batched parameters and initial states, or None if nothing is batched
+    """
+    sizes = {len(value) for value in parameters.values() if value.ndim > 0}
+    if initial_state is not None and initial_state.ndim > 1:
+        sizes.add(len(initial_state))
+    assert len(sizes) <= 1, "all batched parameters need the same length"
+    return sizes.pop() if sizes else None
+
+
+def simulate(
+    circuit: Circuit, parameters: Dict[str, object] = None, initial_state: np.ndarray = None
+) -> np.ndarray:
+    """
+    final statevector of a circuit, starting from |0...0> or the given initial state.
+
+    Parameters map the name of each Parameter of the circuit to a value, or to an array of values;
+    initial_state can likewise be a single state, or an array of states. If anything is batched,
+    all states in the batch are evolved at once, and the result has shape (batch, 2^n) instead
+    of (2^n,)
+    """
+    n = circuit.num_qubits
+    parameters = {
+        name: np.asarray(value, dtype=np.float64) for name, value in (parameters or {}).items()
+    }
+    if initial_state is not None:
+        initial_state = np.asarray(initial_state, dtype=np.complex128)
+    size = batch_size(parameters, initial_state)
+
+    if initial_state is None:
+        state = np.zeros((size or 1, 2 ** n), dtype=np.complex128)
+        state[:, 0] = 1
+    else:
+        state = np.broadcast_to(initial_state.reshape(-1, 2 ** n), (size or 1, 2 ** n))
+
+    state = state.reshape((-1,) + (2,) * n)
+    for gate in circuit.gates:
+        state = apply_gate(state, gate.matrix(parameters), gate.qubits)
+
+    state = state.reshape(-1, 2 ** n)
+    return state if size is not None else state[0]
+
+
+def simulate_tree(circuits: List[Circuit]) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    index and final statevector of each of a list of circuits without parameters that share
+    prefixes of their gate lists, e.g. one circuit per path through a tree of measurement directions.
+
+    Sorting the gate listings visits the circuits in the depth-first order of the tree of their
+    prefixes; we keep the state after every gate of the current path, such that each node of the
+    tree is simulated only once. The states are yielded in that order, so that they need not all
+    be kept in memory at the same time
+    """
+    n = circuits[0].num_qubits
+    assert all(circuit.num_qubits == n for circuit in circuits), "circuits differ in size"
+    assert not any(circuit.parameters for circuit in circuits), "circuits cannot have parameters"
+
+    listings = [[repr(gate) for gate in circuit.gates] for circuit in circuits]
+    order = sorted(range(len(circuits)), key=lambda i: listings[i])
+
+    state = np.zeros((1,) + (2,) * n, dtype=np.complex128)
+    state[(0,) * (n + 1)] = 1
+    path = [state]  # path[k] is the state after the first k gates of the previous circuit
+    previous = []
+
+    for i in order:
+        shared = 0
+        for a, b in zip(listings[i], previous):
+            if a != b:
+                break
+            shared += 1
+        del path[shared + 1 :]
+
+        for gate in circuits[i].gates[shared:]:
+            path.append(apply_gate(path[-1], gate.matrix({}), gate.qubits))
+
+        previous = listings[i]
+        yield i, path[-1].reshape(2 ** n)
+
+
+def measured_probabilities(circuit: Circuit, state: np.ndarray) -> np.ndarray:
+    """
+    outcome probabilities of the measured qubits of the circuit, or all qubits if none are measured,
+    with the first measured qubit as the most significant bit
+    """
+    n = circuit.num_qubits
+    qubits = circuit.measured or list(range(n))
+
+    probabilities = (np.abs(state) ** 2).reshape(state.shape[:-1] + (2,) * n)
+    batch = state.ndim - 1
+    others = tuple(batch + q for q in range(n) if not q in qubits)
+    probabilities = probabilities.sum(axis=others)
+
+    # after summing, the remaining axes are in increasing order of their qubits
+    remaining = sorted(qubits)
+    source = [batch + remaining.index(q) for q in qubits]
+    probabilities = np.moveaxis(probabilities, source, range(batch, batch + len(qubits)))
+    return probabilities.reshape(state.shape[:-1] + (-1,))
+
+
+class Measurements:
+    """
+    Sampled outcomes of a measured circuit, one per shot; outcome i has the bits of the measured
+    qubits, with the first measured qubit as the most significant bit
+    """
+
+    def __init__(self, memory: np.ndarray, qubits: tuple):
+        self.memory = memory
+        self.qubits = qubits
+
+    def histogram(self) -> Histogram:
+        return Histogram(np.bincount(self.memory, minlength=2 ** len(self.qubits)), self.qubits)
+
+    def __getitem__(self, shots: slice) -> "Measurements":
+        return Measurements(self.memory[shots], self.qubits)
+
+    def __len__(self):
+        return len(self.memory)
+
+
+def sample(
+    circuit: Circuit, probabilities: np.ndarray, num_shots: int, rng: np.random.Generator
+) -> Measurements:
+    qubits = tuple(circuit.measured or range(circuit.num_qubits))
+    probabilities = probabilities / probabilities.sum()
+    return Measurements(rng.choice(len(probabilities), size=num_shots, p=probabilities), qubits)
@@ -0,0 +1,35 @@
+import numpy as np
+
+from .cache import DiskCache
+
+
+def pixel_centers(num_pixels: int, extent: tuple) -> np.ndarray:
+    """
+    complex centers of the num_pixels x num_pixels pixels covering
+    extent = (xmin, xmax, ymin, ymax), with rows running over y
+    """
+    xmin, xmax, ymin, ymax = extent
+    xs = np.linspace(xmin, xmax, num_pixels + 1)
+    xs = 0.5 * (xs[:-1] + xs[1:])
+    ys = np.linspace(ymin, ymax, num_pixels + 1)
+    ys = 0.5 * (ys[:-1] + ys[1:])
+    return xs[np.newaxis, :] + 1j * ys[:, np.newaxis]
+
+
+def cached_pictures(cache: DiskCache, probabilities, n: int, num_pixels: int, extent: tuple):
+    """
+    the pictures probabilities(n, points) over the pixel centers of extent, memoized in cache by
+    (n, num_pixels, extent)
+    """
+    extent = tuple(float(e) for e in extent)
+    key = cache.key(n, num_pixels, extent)
+    pictures = cache.get(key)
+    if pictures is not None:
+        return pictures
+
+    # points at which a map is singular yield nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pictures = probabilities(n, pixel_centers(num_pixels, extent))
+
+    cache.set(key, pictures)
+    return pictures
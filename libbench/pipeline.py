@@ -0,0 +1,127 @@
+import queue, threading
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import record_requests
+from .lib import print_stderr
+
+
+def _build_circuit(job):
+    """
+    build a job's circuit within a worker process; the job arrives without circuit,
+    see VendorJob.__getstate__
+    """
+    return job.build_circuit()
+
+
+def _run_task(task):
+    fn, args = task
+    return fn(*args)
+
+
+class CircuitPipeline:
+    """
+    Prepares the submission units of a jobmanager update on a pool of worker processes,
+    ahead of their submission: first the jobs' circuits are built, then the circuits
+    each job requests are handed to the device's preparation method, which returns picklable tasks
+    (fn, args) to run on the pool, e.g. transpilation into a disk cache. The submission itself
+    then only does the network round trip.
+
+    Units are prepared in order on a separate thread, each as soon as all of its circuits are
+    built, such that CPU work on later units overlaps with the submission of earlier ones; the
+    pool's own threads only ever collect results. Preparation is an optimization only:
+    if a worker fails, the work is redone in-process upon submission.
+    """
+
+    def __init__(self, device, max_workers: int):
+        self.device = device
+        self.pool = ProcessPoolExecutor(max_workers=max_workers)
+        self._built = {}  # job: future of its circuit
+        self._prepared = {}  # id(unit): (event set once prepared, [future, ...])
+        self._lock = threading.Lock()
+        self._units = queue.Queue()  # units to prepare, followed by None once closed
+        self._closed = threading.Event()
+        self._preparer = threading.Thread(target=self._prepare_units, daemon=True)
+        self._preparer.start()
+
+    def build(self, jobs: list):
+        """
+        start building the circuits of all jobs that build them on demand
+        """
+        with self._lock:
+            for job in jobs:
+                if job in self._built or not job._builds_circuit() or job._circuit is not None:
+                    continue
+                self._built[job] = self.pool.submit(_build_circuit, job)
+
+    def wait_built(self, jobs: list):
+        """
+        block until the circuits of the given jobs are built, and attach them to the jobs
+        """
+        for job in jobs:
+            with self._lock:
+                future = self._built.pop(job, None)
+            if future is None or job._circuit is not None:
+                continue
+            try:
+                job.circuit = future.result()
+            except Exception as e:
+                print_stderr(f"could not build circuit of {str(job)} in worker: {e}")
+
+    def prepare(self, units: list):
+        """
+        start preparing all units; every unit is a list of entries ([job, ...], request, shots)
+        """
+        self.build([job for unit in units for entry in unit for job in entry[0]])
+
+        for unit in units:
+            self._prepared[id(unit)] = threading.Event(), []
+            self._units.put(unit)
+
+    def _prepare_units(self):
+        while True:
+            unit = self._units.get()
+            if unit is None:
+                return
+            if not self._closed.is_set():
+                self._prepare_unit(unit)
+            self._prepared[id(unit)][0].set()
+
+    def _prepare_unit(self, unit: list):
+        preparation = getattr(self.device, "preparation", None)
+        _, tasks = self._prepared[id(unit)]
+        try:
+            self.wait_built([job for entry in unit for job in entry[0]])
+            if preparation is not None:
+                missing = [entry[0][0] for entry in unit if entry[1] is None]
+                recorded = iter(record_requests(missing, self.device))
+                requests = [next(recorded) if entry[1] is None else entry[1] for entry in unit]
+                for task in preparation(requests):
+                    tasks.append(self.pool.submit(_run_task, task))
+        except Exception as e:
+            print_stderr(f"could not prepare submission: {e}")
+
+    def ready(self, unit: list):
+        """
+        block until a unit is prepared; afterwards, submitting it does not redo any prepared work
+        """
+        if not id(unit) in self._prepared:
+            return
+
+        event, tasks = self._prepared[id(unit)]
+        event.wait()
+        del self._prepared[id(unit)]
+        for task in tasks:
+            try:
+                task.result()
+            except Exception as e:
+                print_stderr(f"could not prepare submission in worker: {e}")
+
+    def close(self):
+        # units not prepared yet are skipped, and circuits not built yet are not built anymore
+        self._closed.set()
+        with self._lock:
+            for future in self._built.values():
+                future.cancel()
+        self._units.put(None)
+        self._preparer.join()
+        self.pool.shutdown(wait=True, cancel_futures=True)
@@ -4,4 +4,5 @@ from .link import QuTechMeasureLocalLink as MeasureLocalLink
 from .link import QuTechStatevectorLink as StatevectorLink
 from .link import QuTechJob as Job
 from .link import QuTechThinPromise
+from .link import histogram
 from .jobmanager import QuTechJobManager as JobManager
@@ -1,6 +1,8 @@
 from libbench import VendorJobManager, print_stderr
 from .benchmark import QuTechBenchmark
 
+from libbench.ibm.link import split_qiskit_result
+
 from .link import QuTechDevice
 
 from qiskit.providers import JobStatus
@@ -27,6 +29,9 @@ class QuTechJobManager(VendorJobManager):
     # maximum time for a job to be considered a failure
     MAX_JOB_AGE = datetime.timedelta(minutes=60*24*2)
 
+    # every poll is a round trip to the cloud backend, so we poll concurrently
+    POLLING_WORKERS = 4
+
     def job_alive(self, promise, meta: dict):
         """
         check whether we consider the job behind the promise alive on an QuTech backend; however we should also check whether job_id is successful
@@ -48,6 +53,7 @@ class QuTechJobManager(VendorJobManager):
         # it could e.g. be a network issue. We let that error propagate
         status = promise.status()
         print(f"The job with QuTech ID {id} is reported to be in status: {status}")
+        meta["queued"] = status == JobStatus.QUEUED
 
         if status in [JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.DONE]:
             return True
@@ -77,6 +83,12 @@ class QuTechJobManager(VendorJobManager):
         finally:
             return False
 
+    def job_waiting(self, promise, meta: dict):
+        """
+        check whether the job is still queued on the QuTech backend; job_alive records the status
+        """
+        return meta.get("queued", False)
+
     def queued_successfully(self, promise, meta: dict):
         """
         check whether we consider the job behind the promise queued, or more than queued, on an QuTech backend;
@@ -116,6 +128,12 @@ class QuTechJobManager(VendorJobManager):
             print_stderr(str(e))
             return None
 
+    def split_result(self, result, index: int, shots=None):
+        """
+        extract the result of a single experiment from the result of a batched job
+        """
+        return split_qiskit_result(result, index, shots)
+
     def gate_statistics(self):
         """
         Get statistics of gate fidelities
@@ -1,8 +1,8 @@
 from abc import abstractmethod
+from libbench.ibm.link import IBMDevice, histogram
 from libbench.lib import print_hl
 from libbench.link import VendorJob, VendorLink, ThinPromise
 import functools
-import qiskit
 from typing import Union, Tuple, List, Dict
 from libbench import print_stderr
 from quantuminspire.exceptions import ApiError
@@ -12,44 +12,19 @@ QUTECH_KNOWN_STATEVECTOR_DEVICES = ["statevector_simulator"]
 QUTECH_KNOWN_MEASURE_LOCAL_DEVICES = ["qasm_simulator"]
 
 
-class QuTechDevice:
-    def __init__(self, device):
-        self.device = device
-
-    def execute(
-        self,
-        circuit: qiskit.QuantumCircuit,
-        num_shots=1024,
-        initial_layout=None,
-        optimization_level=3,
-    ):
-        while optimization_level >= 0:
-            try:
-                experiment = qiskit.compiler.transpile(
-                    circuit,
-                    initial_layout=initial_layout,
-                    optimization_level=optimization_level,
-                    backend=self.device,
-                )
-                break
-            except qiskit.transpiler.exceptions.TranspilerError as e:
-                print_stderr("transpiler error. Lowering optimization level")
-                optimization_level -= 1
-                if optimization_level < 0:
-                    raise e
-
-        print_hl(circuit, color="white")
-        print_hl(experiment, color="white")
-        qobj = qiskit.compiler.assemble(
-            experiment, shots=num_shots, max_credits=15, backend=self.device
-        )
+class QuTechDevice(IBMDevice):
+    """
+    Quantum Inspire backends are qiskit backends, so we transpile, batch and submit as on IBM;
+    only errors on submission differ
+    """
 
+    def _run(self, qobj):
         try:
-            return {"result": self.device.run(qobj), "transpiled_circuit": experiment}
+            return self.device.run(qobj)
         except ApiError as e:
             if "Please wait for those jobs to finish or cancel a job." in str(e):
                 print_stderr(str(e))
-                return {"result": ThinPromise(lambda: None), "transpiled_circuit": None}
+                return None
 
             raise
 
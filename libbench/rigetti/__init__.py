@@ -4,3 +4,4 @@ from .link import RigettiCloudLink as CloudLink
 from .link import RigettiMeasureLocalLink as MeasureLocalLink
 from .link import RigettiStatevectorLink as StatevectorLink
 from .jobmanager import RigettiJobManager as JobManager
+from .counts import bitstring_counts, bitstring_histogram, counts_to_dict
@@ -0,0 +1,38 @@
+import numpy as np
+
+from libbench.histogram import Histogram
+
+
+def bitstring_counts(result: dict, qubits) -> np.ndarray:
+    """
+    Count the joint measurement outcomes of the given qubits, from results of the form
+    qubit : measurement-outcomes, with one column per shot.
+
+    Returns a dense array with one entry per outcome; the outcome index reads the qubits as a binary
+    number with the first qubit as most significant bit, i.e. the outcome key
+    "".join(str(result[q][shot]) for q in qubits) has index int(key, 2)
+    """
+    qubits = list(qubits)
+    n = len(qubits)
+
+    outcomes = np.zeros(len(result[qubits[0]]), dtype=np.int64)
+    for q in qubits:
+        outcomes <<= 1
+        outcomes |= np.asarray(result[q], dtype=np.int64) & 1
+
+    return np.bincount(outcomes, minlength=2 ** n)
+
+
+def counts_to_dict(counts: np.ndarray, n: int) -> dict:
+    """
+    convert dense counts of n qubits into a dict outcome key: count, omitting outcomes never measured
+    """
+    return {f"{i:0{n}b}": int(counts[i]) for i in np.flatnonzero(counts)}
+
+
+def bitstring_histogram(result: dict, qubits) -> Histogram:
+    """
+    histogram of the joint measurement outcomes of the given qubits, see bitstring_counts
+    """
+    qubits = list(qubits)
+    return Histogram(bitstring_counts(result, qubits), qubits)
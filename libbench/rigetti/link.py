@@ -6,9 +6,12 @@ import pyquil as pq
 
 import functools
 from libbench import print_stderr
+from libbench.cache import DiskCache, MemoryCache
 
 from .. import print_hl
 
+COMPILE_CACHE = DiskCache("compile")
+
 
 class RigettiDevice(ABC):
     @abstractmethod
@@ -27,6 +30,7 @@ class RigettiDevice(ABC):
 class RigettiQVM(RigettiDevice):
     def __init__(self, device_name: str):
         self.device = pq.get_qc(device_name, as_qvm=True, noisy="noisy" in device_name)
+        self.compile_cache = COMPILE_CACHE
 
     @property
     def name(self):
@@ -36,6 +40,20 @@ class RigettiQVM(RigettiDevice):
     def info(self):
         return self.device.device.get_specs().to_dict()
 
+    def _compile(self, program: pq.Program, optimize):
+        """
+        compile a program, or take its executable from the compile cache; the key is the program
+        text, its number of shots, the device name and whether we optimize.
+        A template program is thus compiled once, and its executable reused for every parameter set
+        """
+        key = self.compile_cache.key(self.name, program.out(), program.num_shots, optimize)
+        executable = self.compile_cache.get(key)
+        if executable is None:
+            executable = self.device.compile(program, optimize=optimize)
+            self.compile_cache.set(key, executable)
+
+        return executable
+
     def _run_and_measure(
         self,
         program: pq.Program,
@@ -43,6 +61,7 @@ class RigettiQVM(RigettiDevice):
         measure_qubits: list,
         optimize,
         active_reset=False,
+        parameters: dict = None,
     ):
         program = program.copy()
         qubits = measure_qubits if measure_qubits is not None else program.get_qubits()
@@ -58,9 +77,15 @@ class RigettiQVM(RigettiDevice):
 
         program.wrap_in_numshots_loop(shots=num_shots)
 
+        # template programs declare a memory region per parameter, which we fill in per run;
+        # the shared executable is not modified
+        memory_map = None
+        if parameters is not None:
+            memory_map = {name: [value] for name, value in parameters.items()}
+
         try:
-            executable = self.device.compile(program, optimize=optimize)
-            bitstring_array = self.device.run(executable=executable)
+            executable = self._compile(program, optimize)
+            bitstring_array = self.device.run(executable=executable, memory_map=memory_map)
         except Exception as e:
             print_stderr(e)  # we want to log, but not interrupt
             return {"result": ThinPromise(lambda: None), "transpiled_circuit": None}
@@ -78,9 +103,16 @@ class RigettiQVM(RigettiDevice):
         }
 
     def execute(
-        self, program: pq.Program, num_shots: int, measure_qubits: list = None, optimize=True
+        self,
+        program: pq.Program,
+        num_shots: int,
+        measure_qubits: list = None,
+        optimize=True,
+        parameters: dict = None,
     ):
-        return self._run_and_measure(program, num_shots, measure_qubits, optimize)
+        return self._run_and_measure(
+            program, num_shots, measure_qubits, optimize, parameters=parameters
+        )
 
 
 class RigettiQPU(RigettiQVM):
@@ -88,6 +120,9 @@ class RigettiQPU(RigettiQVM):
         # not calling super().__init__() on purpose
         self.device = pq.get_qc(device_name, as_qvm=False)
 
+        # QPU executables are only valid until the next recalibration, so we do not persist them
+        self.compile_cache = MemoryCache()
+
 
 class RigettiStatevectorSimulator(RigettiDevice):
     def __init__(self):
@@ -101,9 +136,12 @@ class RigettiStatevectorSimulator(RigettiDevice):
     def info(self):
         return None
 
-    def execute(self, program: pq.Program, **_):
+    def execute(self, program: pq.Program, parameters: dict = None, **_):
+        memory_map = None
+        if parameters is not None:
+            memory_map = {name: [value] for name, value in parameters.items()}
         return {
-            "result": ThinPromise(self.device.wavefunction, program),
+            "result": ThinPromise(self.device.wavefunction, program, memory_map=memory_map),
             "transpiled_circuit": None,
         }
 
@@ -117,6 +155,14 @@ class RigettiJob(VendorJob):
         super().__init__()
         self.program = None
 
+    @property
+    def program(self):
+        return self.circuit
+
+    @program.setter
+    def program(self, program):
+        self.circuit = program
+
     @abstractmethod
     def run(self, device: RigettiDevice):
         self.device_info = device.info
@@ -0,0 +1,160 @@
+import hashlib, pickle, sqlite3
+from enum import Enum
+from numbers import Number
+from typing import Dict
+
+import numpy as np
+
+
+PRIMITIVE_TYPES = (Number, str, bool, type(None), Enum, np.generic)
+
+
+def is_primitive(value) -> bool:
+    if isinstance(value, tuple):
+        return all(is_primitive(v) for v in value)
+    return isinstance(value, PRIMITIVE_TYPES)
+
+
+class StoredJob:
+    """
+    Stands in for a job read back from a result store; it carries the job's parameters
+    as attributes, which is all that collate_results needs.
+    """
+
+    def __init__(self, serial: int, name: str, parameters: dict):
+        self.serial = serial
+        self.name = name
+        self.__dict__.update(parameters)
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"StoredJob({self.name})"
+
+
+class ResultStore:
+    """
+    Per-run sqlite store for completed jobs.
+    Each job is one row with its parameters and parsed result, as well as a blob for the raw
+    result; scalar entries of parsed results are in addition stored in a (serial, key, value)
+    table, from which they can be read as columns. The serialized circuit and qasm of a job are
+    added on submission, while the circuit is still built; each distinct circuit is stored once,
+    keyed by a hash of its content, as e.g. all pixels of a template run share the same circuit.
+    """
+
+    FILENAME = "results.sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                serial INTEGER PRIMARY KEY,
+                name TEXT,
+                parameters BLOB,
+                result BLOB,
+                raw_result BLOB
+            );
+            CREATE TABLE IF NOT EXISTS circuits (
+                key TEXT PRIMARY KEY,
+                circuit BLOB,
+                qasm TEXT
+            );
+            CREATE TABLE IF NOT EXISTS job_circuits (
+                serial INTEGER PRIMARY KEY,
+                key TEXT
+            );
+            CREATE TABLE IF NOT EXISTS scalars (
+                serial INTEGER,
+                key TEXT,
+                value REAL,
+                PRIMARY KEY (key, serial)
+            );
+            """
+        )
+
+    def add_circuit(self, serial: int, circuit=None, qasm: str = None):
+        """
+        add the circuit of a submitted job; a resubmitted job's circuit is overwritten
+        """
+        circuit = None if circuit is None else pickle.dumps(circuit)
+        digest = hashlib.sha256(circuit or b"")
+        digest.update((qasm or "").encode())
+        key = digest.hexdigest()
+
+        self.connection.execute(
+            "INSERT OR IGNORE INTO circuits VALUES (?, ?, ?)", (key, circuit, qasm)
+        )
+        self.connection.execute("INSERT OR REPLACE INTO job_circuits VALUES (?, ?)", (serial, key))
+
+    def add(self, serial: int, job, result, raw_result=None):
+        """
+        add a completed job; a job that is already present is overwritten
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?)",
+            (
+                serial,
+                str(job),
+                pickle.dumps(job.parameters()),
+                pickle.dumps(result),
+                None if raw_result is None else pickle.dumps(raw_result),
+            ),
+        )
+
+        if isinstance(result, dict):
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO scalars VALUES (?, ?, ?)",
+                (
+                    (serial, key, float(value))
+                    for key, value in result.items()
+                    if isinstance(value, (Number, np.number)) and not isinstance(value, complex)
+                ),
+            )
+
+    def commit(self):
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def results(self) -> Dict[StoredJob, object]:
+        """
+        parsed results keyed by stand-ins for the jobs, in the format expected by collate_results
+        """
+        return {
+            StoredJob(serial, name, pickle.loads(parameters)): pickle.loads(result)
+            for serial, name, parameters, result in self.connection.execute(
+                "SELECT serial, name, parameters, result FROM jobs ORDER BY serial"
+            )
+        }
+
+    def raw_result(self, name: str):
+        row = self.connection.execute(
+            "SELECT raw_result FROM jobs WHERE name = ?", (name,)
+        ).fetchone()
+        return None if row is None or row[0] is None else pickle.loads(row[0])
+
+    def circuit(self, name: str):
+        row = self.connection.execute(
+            "SELECT circuit, qasm FROM jobs "
+            "JOIN job_circuits USING (serial) JOIN circuits USING (key) WHERE name = ?",
+            (name,),
+        ).fetchone()
+        return None if row is None else (None if row[0] is None else pickle.loads(row[0]), row[1])
+
+    def scalars(self, key: str) -> np.ndarray:
+        """
+        a scalar entry of all parsed results as array of (serial, value) rows
+        """
+        return np.array(
+            self.connection.execute(
+                "SELECT serial, value FROM scalars WHERE key = ? ORDER BY serial", (key,)
+            ).fetchall(),
+            dtype=np.float64,
+        ).reshape(-1, 2)
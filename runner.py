@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 import argparse
+import contextlib
+import fcntl
 import glob
 import importlib
 import os
@@ -91,6 +93,46 @@ def obtain_jobmanager(job_id, run_folder, recreate_device):
     return jobmanager, device, slug
 
 
+def obtain_manifest(job_id, run_folder):
+    VendorJobManager.RUN_FOLDER = run_folder
+    manifest = VendorJobManager.load_manifest(job_id)
+
+    # runs stored before there were manifests are loaded once to create it
+    if manifest is None:
+        jobmanager, _, slug = obtain_jobmanager(job_id, run_folder, recreate_device=False)
+        jobmanager.save_manifest(slug["additional_stored_info"])
+        manifest = VendorJobManager.load_manifest(job_id)
+
+    return manifest
+
+
+@contextlib.contextmanager
+def run_lock(job_id, run_folder):
+    """
+    exclusive lock on a run while it is loaded and updated, such that a run resumed by hand and by
+    the daemon is never worked on by two processes at once; yields whether the lock was obtained
+    """
+    with open(f"{run_folder}/{job_id}/run.lock", "w") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def saved_at(job_id, run_folder):
+    """
+    modification time of a run's manifest, which is rewritten on every save
+    """
+    path = f"{run_folder}/{job_id}/{VendorJobManager.MANIFEST_FILENAME}"
+    return os.stat(path).st_mtime_ns if os.path.exists(path) else None
+
+
 """
     INFO
 """
@@ -135,11 +177,19 @@ def _run_update(
     device: object,
     additional_stored_info: dict,
     show_directly: bool = False,
+    submission_workers: int = None,
+    batch_size: int = None,
+    preparation_workers: int = None,
+    deduplicate: bool = None,
 ):
     if not jobmanager.update(
         device,
         additional_stored_info=additional_stored_info,
         figure_callback=_show_figure if show_directly else lambda *x: None,
+        submission_workers=submission_workers,
+        batch_size=batch_size,
+        preparation_workers=preparation_workers,
+        deduplicate=deduplicate,
     ):
         print(f"benchmark not done. Resume by calling ./runner.py resume {jobmanager.ID}")
 
@@ -147,10 +197,24 @@ def _run_update(
 def resume_benchmark(args):
     RUN_FOLDER = args.run_folder
     JOB_ID = args.job_id
-    jobmanager, device, slug = obtain_jobmanager(JOB_ID, RUN_FOLDER, recreate_device=True)
 
-    # run update
-    _run_update(jobmanager, device, slug["additional_stored_info"])
+    with run_lock(JOB_ID, RUN_FOLDER) as locked:
+        if not locked:
+            print_stderr(f"{JOB_ID} is being resumed by another process, e.g. the daemon.")
+            return
+
+        jobmanager, device, slug = obtain_jobmanager(JOB_ID, RUN_FOLDER, recreate_device=True)
+
+        # run update
+        _run_update(
+            jobmanager,
+            device,
+            slug["additional_stored_info"],
+            submission_workers=args.submission_workers,
+            batch_size=args.batch_size,
+            preparation_workers=args.preparation_workers,
+            deduplicate=args.deduplicate,
+        )
 
 
 def new_benchmark(args):
@@ -187,6 +251,10 @@ def new_benchmark(args):
             "benchmark": BENCHMARK,
         },
         show_directly=args.show_directly,
+        submission_workers=args.submission_workers,
+        batch_size=args.batch_size,
+        preparation_workers=args.preparation_workers,
+        deduplicate=args.deduplicate,
     )
 
 
@@ -195,21 +263,29 @@ def new_benchmark(args):
 """
 
 
-def _get_job_ids(run_folder):
+def _get_job_ids(run_folder, done=None):
     # sort directories increasingly with respect to ctime
     dirs = list(filter(os.path.isdir, glob.glob(f"{run_folder}/*")))
     dirs.sort(key=lambda x: os.path.getctime(x))
-    return [
+    job_ids = [
         os.path.basename(folder)
         for folder in dirs
         if not os.path.basename(folder) in {"__pycache__", "obsolete"}
     ]
 
+    # optionally filter by completion, which only requires the manifests
+    if done is not None:
+        job_ids = [
+            job_id for job_id in job_ids if obtain_manifest(job_id, run_folder)["done"] == done
+        ]
+
+    return job_ids
+
 
 def refresh(args):
     RUN_FOLDER = args.run_folder
     ALL = args.all
-    job_ids = args.job_ids if not ALL else _get_job_ids(RUN_FOLDER)
+    job_ids = args.job_ids if not ALL else _get_job_ids(RUN_FOLDER, done=True)
 
     for JOB_ID in job_ids:
         print(f"refreshing {JOB_ID}...", end=" ")
@@ -274,9 +350,142 @@ def status(args):
     job_ids = _get_job_ids(RUN_FOLDER)
     for job_id in random.sample(job_ids, len(job_ids)):
         print(f"Obtaining status for {job_id}.")
-        jobmanager, _, slug = obtain_jobmanager(job_id, RUN_FOLDER, recreate_device=False)
-        jobmanager.print_status(tail=slug["additional_stored_info"])
-        jobmanager.save_additional_info_files(slug["additional_stored_info"])
+        manifest = obtain_manifest(job_id, RUN_FOLDER)
+        VendorJobManager.print_manifest_status(manifest, tail=manifest["additional_stored_info"])
+
+
+"""
+    DAEMON
+"""
+import time
+
+
+def daemon(args):
+    RUN_FOLDER = args.run_folder
+    MODES = {MODE_CLASS_NAMES[mode] for mode in args.modes}
+
+    links = {}  # (vendor, mode): link
+    devices = {}  # (vendor, mode, device): device
+    active = {}  # job id: (jobmanager, device, additional_stored_info, saved_at)
+    ignored = set()  # job ids of runs that are done, or not run by the daemon
+
+    def get_device(vendor, mode, name):
+        if not (vendor, mode) in links:
+            links[(vendor, mode)] = import_link(vendor, mode)()
+        if not (vendor, mode, name) in devices:
+            devices[(vendor, mode, name)] = links[(vendor, mode)].get_device(name)
+        return devices[(vendor, mode, name)]
+
+    def load(job_id, info):
+        # note the time of the last save before loading, such that later saves trigger a reload
+        saved = saved_at(job_id, RUN_FOLDER)
+        jobmanager, *_ = obtain_jobmanager(job_id, RUN_FOLDER, recreate_device=False)
+        device = get_device(info["vendor"], info["mode"], info["device"])
+        jobmanager.thaw(device)
+        return jobmanager, device, info, saved
+
+    print_hl(f"daemon polling runs in {RUN_FOLDER} every {args.interval}s; stop with ctrl-c.")
+    try:
+        while True:
+            # pick up runs that are not done yet
+            for job_id in _get_job_ids(RUN_FOLDER):
+                if job_id in active or job_id in ignored:
+                    continue
+
+                manifest = obtain_manifest(job_id, RUN_FOLDER)
+                info = manifest["additional_stored_info"]
+                if (
+                    manifest["done"]
+                    or not info["mode"] in MODES
+                    or not info["vendor"] in args.vendors
+                ):
+                    ignored.add(job_id)
+                    continue
+
+                try:
+                    active[job_id] = load(job_id, info)
+                except Exception as e:
+                    print_stderr(f"could not load {job_id}: {e}")
+                    ignored.add(job_id)
+                    continue
+
+                print(f"resuming {job_id} on {info['device']}")
+
+            # resume all active runs; finished runs are finalized by update
+            for job_id, (jobmanager, device, info, saved) in list(active.items()):
+                with run_lock(job_id, RUN_FOLDER) as locked:
+                    # runs being resumed by another process are updated in the next round
+                    if not locked:
+                        continue
+
+                    try:
+                        # the run has been resumed by another process since, so our state is stale
+                        if saved_at(job_id, RUN_FOLDER) != saved:
+                            print(f"reloading {job_id}, which has been updated elsewhere")
+                            jobmanager, device, info, saved = active[job_id] = load(job_id, info)
+                            if jobmanager.done:
+                                del active[job_id]
+                                ignored.add(job_id)
+                                continue
+
+                        _run_update(
+                            jobmanager,
+                            device,
+                            info,
+                            submission_workers=args.submission_workers,
+                            batch_size=args.batch_size,
+                            preparation_workers=args.preparation_workers,
+                            deduplicate=args.deduplicate,
+                        )
+                        active[job_id] = jobmanager, device, info, saved_at(job_id, RUN_FOLDER)
+                    except Exception as e:
+                        # the run is picked up again from its last saved state
+                        print_stderr(f"error while resuming {job_id}: {e}")
+                        del active[job_id]
+                        continue
+
+                if jobmanager.done:
+                    del active[job_id]
+                    ignored.add(job_id)
+
+            time.sleep(args.interval)
+
+    except KeyboardInterrupt:
+        print_hl("daemon terminated.")
+
+
+def add_manager_arguments(parser):
+    """
+    options of how a jobmanager submits jobs; all of them default to None, such that the
+    jobmanager of the vendor decides
+    """
+    parser.add_argument(
+        "--submission_workers",
+        type=int,
+        default=None,
+        help="number of jobs to submit concurrently; defaults to the vendor's choice, "
+        f"usually {VendorJobManager.SUBMISSION_WORKERS}",
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=None,
+        help="number of jobs to submit as a single vendor job, if the device supports it; "
+        "defaults to the vendor's choice",
+    )
+    parser.add_argument(
+        "--preparation_workers",
+        type=int,
+        default=None,
+        help="number of processes that build and transpile circuits ahead of submission; "
+        "by default, circuits are prepared in-process upon submission",
+    )
+    parser.add_argument(
+        "--deduplicate",
+        action="store_true",
+        default=None,
+        help="merge jobs with identical circuits into one experiment with their summed shots",
+    )
 
 
 if __name__ == "__main__":
@@ -312,6 +521,7 @@ if __name__ == "__main__":
         default=VendorJobManager.RUN_FOLDER,
         help=f"folder to store benchmark jobs in; created if it does not exist",
     )
+    add_manager_arguments(parser_A)
     subparsers_A = parser_A.add_subparsers(metavar="BENCHMARK", help="benchmark to run")
 
     parser_benchmarks = {}
@@ -366,6 +576,7 @@ if __name__ == "__main__":
         default=VendorJobManager.RUN_FOLDER,
         help=f"folder to store benchmark jobs in; created if it does not exist",
     )
+    add_manager_arguments(parser_R)
 
     # update collation and visualization steps of jobmanager
     parser_V = subparsers.add_parser(
@@ -414,6 +625,35 @@ if __name__ == "__main__":
         help=f"folder to store benchmark jobs in; created if it does not exist",
     )
 
+    # keep polling unfinished benchmarks
+    parser_D = subparsers.add_parser(
+        "daemon", help="Keep resuming all unfinished benchmarks.", **argparse_options
+    )
+    parser_D.set_defaults(func=daemon)
+    parser_D.add_argument(
+        "--run_folder",
+        default=VendorJobManager.RUN_FOLDER,
+        help=f"folder to store benchmark jobs in; created if it does not exist",
+    )
+    parser_D.add_argument(
+        "--interval", type=float, default=60, help="seconds to wait in between polling rounds"
+    )
+    parser_D.add_argument(
+        "--modes",
+        nargs="+",
+        choices=MODES,
+        default=["cloud"],
+        help="modes of the benchmarks to resume",
+    )
+    parser_D.add_argument(
+        "--vendors",
+        nargs="+",
+        choices=VENDORS,
+        default=VENDORS,
+        help="vendors of the benchmarks to resume",
+    )
+    add_manager_arguments(parser_D)
+
     args = parser.parse_args()
 
     # correctly parsed? otherwise show help